@@ -1,13 +1,116 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError, InterfaceError
+from sqlalchemy.orm import sessionmaker, Session
 from .settings import Settings
+from app.core.exceptions.database_exceptions import DatabaseUnavailableError
 
 
 class DatabaseConfig:
-    def __init__(self):
+    # Coduri MySQL/MariaDB pentru server oprit sau conexiune pierduta (nu deadlock-uri etc.)
+    CONNECTION_ERROR_CODES = {2002, 2003, 2005, 2006, 2013}
+
+    def __init__(self, db_uri: str = None, circuit_breaker=None):
         self.settings = Settings()
-        self.engine = create_engine(self.settings.DB_URI, echo=False)
-        self.SessionLocal = sessionmaker(bind=self.engine)
+        self.circuit_breaker = circuit_breaker
+        self.db_uri = db_uri or self.settings.DB_URI
+        self.engine = create_engine(self.db_uri, echo=False, **self._engine_options())
+        # Obiectele raman utilizabile dupa commit/close (repository-urile le returneaza detasate)
+        self.SessionLocal = sessionmaker(bind=self.engine, expire_on_commit=False)
+        self._local = threading.local()
+
+    def get_session(self) -> Session:
+        return self.SessionLocal()
+
+    @contextmanager
+    def session_scope(self) -> Iterator[Session]:
+        """Unit of work: nested scopes on the same thread share one session and transaction.
+
+        Repositories only flush; the outermost scope commits, or rolls back if anything inside raised.
+        """
+        session = getattr(self._local, 'session', None)
+        if session is not None:
+            yield session
+            return
+
+        breaker = self.circuit_breaker
+        if breaker and not breaker.allow_request():
+            raise DatabaseUnavailableError(
+                f"Baza de date este indisponibila, reincercare in {breaker.seconds_until_retry():.0f}s"
+            )
+
+        session = self.SessionLocal()
+        self._local.session = session
+        self._local.after_commit = []
+        try:
+            yield session
+            session.commit()
+            callbacks = self._local.after_commit
+        except (OperationalError, InterfaceError) as e:
+            # Doar erorile de conexiune deschid circuitul; celelalte inseamna ca serverul a raspuns
+            if breaker:
+                if self._is_connection_error(e):
+                    breaker.record_failure(e)
+                else:
+                    breaker.record_success()
+            session.rollback()
+            raise
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            self._local.session = None
+            self._local.after_commit = []
+            session.close()
+
+        if breaker:
+            breaker.record_success()
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                print(f"Warning: After-commit callback failed: {e}")
+
+    def in_unit_of_work(self) -> bool:
+        return getattr(self._local, 'session', None) is not None
+
+    def after_commit(self, callback):
+        """Runs callback once the current unit of work commits (right away outside a scope)."""
+        if self.in_unit_of_work():
+            self._local.after_commit.append(callback)
+        else:
+            callback()
+
+    def ping(self):
+        with self.engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+
+    def _is_connection_error(self, error: Exception) -> bool:
+        if isinstance(error, InterfaceError) or getattr(error, 'connection_invalidated', False):
+            return True
+        args = getattr(getattr(error, 'orig', None), 'args', None)
+        return bool(args) and args[0] in self.CONNECTION_ERROR_CODES
+
+    def dispose(self):
+        self.engine.dispose()
+
+    def _engine_options(self) -> dict:
+        if self.db_uri.startswith('sqlite'):
+            # Sesiunile sunt folosite si din thread-uri de fundal
+            return {'connect_args': {'check_same_thread': False}}
 
-    def get_session(self):
-        return self.SessionLocal()
\ No newline at end of file
+        options = {
+            'pool_size': getattr(self.settings, 'DB_POOL_SIZE', 5),
+            'max_overflow': getattr(self.settings, 'DB_MAX_OVERFLOW', 5),
+            'pool_timeout': getattr(self.settings, 'DB_POOL_TIMEOUT', 10),
+            # MariaDB inchide conexiunile inactive dupa wait_timeout
+            'pool_recycle': getattr(self.settings, 'DB_POOL_RECYCLE', 1800),
+            'pool_pre_ping': getattr(self.settings, 'DB_POOL_PRE_PING', True)
+        }
+        connect_timeout = getattr(self.settings, 'DB_CONNECT_TIMEOUT', 0)
+        if connect_timeout and self.db_uri.startswith('mysql'):
+            options['connect_args'] = {'connect_timeout': connect_timeout}
+        return options
@@ -0,0 +1,5 @@
+class DatabaseError(Exception):
+    pass
+
+class DatabaseUnavailableError(DatabaseError):
+    pass
@@ -16,6 +16,10 @@ class IAuthService(ABC):
     def verify_password(self, password: str, hashed_password: str) -> bool:
         pass
 
+    @abstractmethod
+    def clear_verification_cache(self, username: str = None):
+        pass
+
 
 class IUserRepository(ABC):
     @abstractmethod
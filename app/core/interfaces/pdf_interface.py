@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from concurrent.futures import Future
 from typing import Dict, Any
 
 
@@ -12,3 +13,13 @@ class IPdfService(ABC):
     def preview_pdf(self, content: str, metadata: Dict[str, Any], doctor_name: str = None,
                     selected_title: str = None, header_image_path: str = None) -> str:
         pass
+
+    @abstractmethod
+    def generate_pdf_async(self, content: str, metadata: Dict[str, Any], output_path: str, doctor_name: str = None,
+                           selected_title: str = None, header_image_path: str = None) -> Future:
+        pass
+
+    @abstractmethod
+    def preview_pdf_async(self, content: str, metadata: Dict[str, Any], doctor_name: str = None,
+                          selected_title: str = None, header_image_path: str = None) -> Future:
+        pass
@@ -0,0 +1,80 @@
+from datetime import datetime
+from typing import List
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, func, select, text
+from sqlalchemy.engine import Engine
+
+from app.database.migrations import MIGRATIONS
+
+
+class MigrationRunner:
+    """Applies the versioned scripts in app/database/migrations in order.
+
+    The applied versions are recorded in a schema_version table, so every
+    script runs once per database. Scripts must be idempotent: setup_database.py
+    creates the tables from models.py (already at the latest schema) and then
+    runs them as well. On MySQL/MariaDB a named lock keeps two clients from
+    applying the same version at once (DDL is not transactional there).
+    """
+
+    LOCK_NAME = "medical_app_schema_migrations"
+    LOCK_TIMEOUT = 60  # seconds
+
+    def __init__(self, engine: Engine, migrations=None):
+        self._engine = engine
+        self._migrations = sorted(migrations or MIGRATIONS, key=lambda migration: migration.VERSION)
+
+        self._metadata = MetaData()
+        self._version_table = Table(
+            "schema_version", self._metadata,
+            Column("version", Integer, primary_key=True),
+            Column("description", String(255), nullable=True),
+            Column("applied_at", DateTime, default=datetime.utcnow)
+        )
+
+    def current_version(self) -> int:
+        self._metadata.create_all(self._engine)
+        with self._engine.connect() as connection:
+            return connection.execute(select(func.max(self._version_table.c.version))).scalar() or 0
+
+    def pending(self) -> List:
+        current = self.current_version()
+        return [migration for migration in self._migrations if migration.VERSION > current]
+
+    def upgrade(self) -> List[int]:
+        applied = []
+
+        with self._engine.connect() as lock_connection:
+            self._acquire_lock(lock_connection)
+            try:
+                # Versiunea se citeste dupa lock: alt client poate tocmai sa fi aplicat migrarile
+                for migration in self.pending():
+                    print(f"Applying database migration {migration.VERSION}: {migration.DESCRIPTION}")
+                    with self._engine.begin() as connection:
+                        migration.upgrade(connection)
+                        connection.execute(self._version_table.insert().values(
+                            version=migration.VERSION,
+                            description=migration.DESCRIPTION,
+                            applied_at=datetime.utcnow()
+                        ))
+                    applied.append(migration.VERSION)
+            finally:
+                self._release_lock(lock_connection)
+
+        return applied
+
+    def _uses_named_lock(self) -> bool:
+        return self._engine.dialect.name in ("mysql", "mariadb")
+
+    def _acquire_lock(self, connection):
+        if not self._uses_named_lock():
+            return
+        acquired = connection.execute(
+            text("SELECT GET_LOCK(:name, :timeout)"), {"name": self.LOCK_NAME, "timeout": self.LOCK_TIMEOUT}
+        ).scalar()
+        if acquired != 1:
+            raise RuntimeError("Another client is applying database migrations; try again later")
+
+    def _release_lock(self, connection):
+        if self._uses_named_lock():
+            connection.execute(text("SELECT RELEASE_LOCK(:name)"), {"name": self.LOCK_NAME})
@@ -0,0 +1,8 @@
+from app.database.migrations import m0001_lookup_indexes, m0002_study_history
+
+# Ordinea conteaza: fiecare modul are VERSION, DESCRIPTION si upgrade(connection).
+# Lista este explicita (nu descoperita din director) ca sa functioneze si in executabilul PyInstaller.
+MIGRATIONS = [
+    m0001_lookup_indexes,
+    m0002_study_history,
+]
@@ -0,0 +1,23 @@
+from sqlalchemy import inspect, text
+
+VERSION = 1
+DESCRIPTION = "Indexes on report_title.title_text, pacs_urls.name and the updated_at columns"
+
+INDEXES = [
+    ("report_title", "title_text"),
+    ("report_title", "updated_at"),
+    ("pacs_urls", "name"),
+    ("pacs_urls", "updated_at"),
+    ("app_settings", "updated_at"),
+]
+
+
+def upgrade(connection):
+    inspector = inspect(connection)
+
+    for table, column in INDEXES:
+        index_name = f"ix_{table}_{column}"
+        existing = {index["name"] for index in inspector.get_indexes(table)}
+        # Bazele create cu models.py actual au deja indexul
+        if index_name not in existing:
+            connection.execute(text(f"CREATE INDEX {index_name} ON {table} ({column})"))
@@ -0,0 +1,51 @@
+from datetime import datetime
+
+from sqlalchemy import Boolean, Column, DateTime, Index, Integer, MetaData, String, Table
+
+VERSION = 2
+DESCRIPTION = "Study, report and transfer history tables"
+
+# Schema de la momentul migrarii, independenta de modificarile ulterioare din models.py
+metadata = MetaData()
+
+study_records = Table(
+    "study_records", metadata,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("study_id", String(64), unique=True, nullable=False),
+    Column("study_instance_uid", String(128), nullable=True, index=True),
+    Column("patient_name", String(255), nullable=True),
+    Column("study_date", String(32), nullable=True),
+    Column("description", String(255), nullable=True),
+    Column("created_at", DateTime, default=datetime.utcnow),
+    Column("updated_at", DateTime, default=datetime.utcnow, index=True)
+)
+
+report_records = Table(
+    "report_records", metadata,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("study_id", String(64), nullable=False, index=True),
+    Column("pdf_path", String(512), nullable=False),
+    Column("content_hash", String(64), nullable=True, index=True),
+    Column("author", String(255), nullable=True),
+    Column("title_text", String(255), nullable=True),
+    Column("created_at", DateTime, default=datetime.utcnow, index=True)
+)
+
+transfer_records = Table(
+    "transfer_records", metadata,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("study_id", String(64), nullable=False),
+    Column("target_url", String(512), nullable=False),
+    Column("success", Boolean, nullable=False, default=False),
+    Column("error_message", String(500), nullable=True),
+    Column("with_result", Boolean, nullable=False, default=False),
+    Column("sent_by", String(50), nullable=True),
+    Column("sent_at", DateTime, default=datetime.utcnow, index=True),
+    Index("ix_transfer_records_study_target", "study_id", "target_url", "success")
+)
+
+
+def upgrade(connection):
+    # checkfirst: bazele create cu setup_database.py au deja tabelele
+    for table in (study_records, report_records, transfer_records):
+        table.create(connection, checkfirst=True)
@@ -1,6 +1,6 @@
 from datetime import datetime
 import enum
-from sqlalchemy import Column, Integer, String, Enum, DateTime
+from sqlalchemy import Column, Integer, String, Enum, DateTime, Boolean, Index
 from sqlalchemy.ext.declarative import declarative_base
 
 Base = declarative_base()
@@ -23,12 +23,12 @@ class PacsUrl(Base):
     __tablename__ = "pacs_urls"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    name = Column(String(255), nullable=False)
+    name = Column(String(255), nullable=False, index=True)
     url = Column(String(512), nullable=False)
     username = Column(String(100), nullable=True)
     password = Column(String(255), nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
 
 
 class AppSettings(Base):
@@ -39,12 +39,54 @@ class AppSettings(Base):
     setting_value = Column(String(500), nullable=True)
     description = Column(String(255), nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
 
 class ReportTitle(Base):
     __tablename__ = "report_title"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    title_text = Column(String(255), nullable=False)
+    title_text = Column(String(255), nullable=False, index=True)
     created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
\ No newline at end of file
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
+
+
+class StudyRecord(Base):
+    __tablename__ = "study_records"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    study_id = Column(String(64), unique=True, nullable=False)  # ID-ul Orthanc sau al studiului local
+    study_instance_uid = Column(String(128), nullable=True, index=True)
+    patient_name = Column(String(255), nullable=True)
+    study_date = Column(String(32), nullable=True)
+    description = Column(String(255), nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
+
+
+class ReportRecord(Base):
+    __tablename__ = "report_records"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    study_id = Column(String(64), nullable=False, index=True)
+    pdf_path = Column(String(512), nullable=False)
+    content_hash = Column(String(64), nullable=True, index=True)
+    author = Column(String(255), nullable=True)
+    title_text = Column(String(255), nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+
+
+class TransferRecord(Base):
+    __tablename__ = "transfer_records"
+    __table_args__ = (
+        # "A fost deja trimis?" = un singur lookup pe (study_id, target_url, success)
+        Index("ix_transfer_records_study_target", "study_id", "target_url", "success"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    study_id = Column(String(64), nullable=False)
+    target_url = Column(String(512), nullable=False)
+    success = Column(Boolean, nullable=False, default=False)
+    error_message = Column(String(500), nullable=True)
+    with_result = Column(Boolean, nullable=False, default=False)
+    sent_by = Column(String(50), nullable=True)
+    sent_at = Column(DateTime, default=datetime.utcnow, index=True)
@@ -1,15 +1,21 @@
+import threading
+from typing import TYPE_CHECKING
+
 from app.config.settings import Settings
 from app.config.database import DatabaseConfig
 
 # Infrastructure
 from app.infrastructure.http_client import HttpClient
-from app.infrastructure.pdf_generator import PdfGenerator
+from app.infrastructure.circuit_breaker import CircuitBreakerRegistry
 from app.repositories.report_title_repository import ReportTitleRepository
 from app.repositories.settings_repository import SettingsRepository
 
 # Repositories
 from app.repositories.user_repository import UserRepository
 from app.repositories.pacs_url_repository import PacsUrlRepository
+from app.repositories.study_record_repository import StudyRecordRepository
+from app.repositories.report_record_repository import ReportRecordRepository
+from app.repositories.transfer_record_repository import TransferRecordRepository
 
 # Services
 from app.services.auth_service import AuthService
@@ -20,13 +26,24 @@ from app.services.session_service import SessionService
 from app.services.pacs_service import PacsService
 from app.services.local_file_service import LocalFileService
 from app.services.hybrid_pacs_service import HybridPacsService
-from app.services.pdf_service import PdfService
 from app.services.settings_service import SettingsService
+from app.services.study_history_service import StudyHistoryService
+from app.services.health_monitor import HealthMonitor
 
 # Controllers
 from app.presentation.controllers.auth_controller import AuthController
 from app.presentation.controllers.hybrid_pacs_controller import HybridPacsController
 
+# Modulele PDF (weasyprint) se importa la prima folosire, nu la pornire
+if TYPE_CHECKING:
+    from app.database.migration_runner import MigrationRunner
+    from app.infrastructure.local_replica import LocalReplica
+    from app.infrastructure.pdf_generator import PdfGenerator
+    from app.infrastructure.pdf_render_pool import PdfRenderPool
+    from app.infrastructure.pdf_thumbnailer import PdfThumbnailer
+    from app.infrastructure.report_archive import ReportArchive
+    from app.services.pdf_service import PdfService
+
 
 class Container:
     _instances = {}
@@ -40,44 +57,176 @@ class Container:
     # Config
     @classmethod
     def get_database_config(cls) -> DatabaseConfig:
-        return cls._get_or_create('database_config', DatabaseConfig)
+        circuit_breakers = cls.get_circuit_breakers()
+        return cls._get_or_create('database_config', lambda: DatabaseConfig(
+            circuit_breaker=circuit_breakers.get("database")
+        ))
+
+    @classmethod
+    def get_circuit_breakers(cls) -> CircuitBreakerRegistry:
+        settings = Settings()
+        return cls._get_or_create('circuit_breakers', lambda: CircuitBreakerRegistry(
+            getattr(settings, 'CIRCUIT_FAILURE_THRESHOLD', 3),
+            getattr(settings, 'CIRCUIT_RESET_TIMEOUT', 30)
+        ))
+
+    @classmethod
+    def get_health_monitor(cls) -> HealthMonitor:
+        settings = Settings()
+        circuit_breakers = cls.get_circuit_breakers()
+        db_config = cls.get_database_config()
+
+        def pacs_endpoints():
+            source_url, source_auth = settings.get_source_pacs_config()
+            target_url, target_auth = settings.get_target_pacs_config()
+            return [("PACS sursă", source_url, source_auth), ("PACS țintă", target_url, target_auth)]
+
+        def create_monitor():
+            monitor = HealthMonitor(
+                circuit_breakers,
+                db_config,
+                pacs_endpoints,
+                getattr(settings, 'HEALTH_CHECK_INTERVAL', 15),
+                getattr(settings, 'HEALTH_PROBE_TIMEOUT', 3)
+            )
+            monitor.start()
+            return monitor
+
+        return cls._get_or_create('health_monitor', create_monitor)
+
+    @classmethod
+    def get_migration_runner(cls) -> "MigrationRunner":
+        from app.database.migration_runner import MigrationRunner
+        db_config = cls.get_database_config()
+        return cls._get_or_create('migration_runner', lambda: MigrationRunner(db_config.engine))
+
+    @classmethod
+    def get_local_replica(cls) -> "LocalReplica":
+        settings = Settings()
+        if not getattr(settings, 'LOCAL_REPLICA_ENABLED', False):
+            return None
+
+        def create_replica():
+            from app.infrastructure.local_replica import LocalReplica
+            replica = LocalReplica(
+                cls.get_database_config(),
+                settings.LOCAL_REPLICA_PATH,
+                getattr(settings, 'LOCAL_REPLICA_SYNC_INTERVAL', 60)
+            )
+            replica.start()
+            return replica
+
+        try:
+            return cls._get_or_create('local_replica', create_replica)
+        except Exception as e:
+            print(f"Warning: Local replica unavailable, reading from the server: {e}")
+            # Nu mai incercam la fiecare repository
+            cls._instances['local_replica'] = None
+            return None
 
     # Infrastructure
     @classmethod
     def get_http_client(cls) -> HttpClient:
-        return cls._get_or_create('http_client', lambda: HttpClient(timeout=30))
+        settings = Settings()
+        circuit_breakers = cls.get_circuit_breakers()
+        return cls._get_or_create('http_client', lambda: HttpClient(
+            timeout=30,
+            connect_timeout=getattr(settings, 'HTTP_CONNECT_TIMEOUT', None),
+            circuit_breakers=circuit_breakers
+        ))
 
     @classmethod
-    def get_pdf_generator(cls) -> PdfGenerator:
+    def get_pdf_generator(cls) -> "PdfGenerator":
+        from app.infrastructure.pdf_generator import PdfGenerator
         settings = Settings()
-        return cls._get_or_create('pdf_generator', lambda: PdfGenerator(settings.PDF_CSS_PATH))
+        return cls._get_or_create('pdf_generator', lambda: PdfGenerator(
+            settings.PDF_CSS_PATH,
+            settings.PDF_TEMPLATE_PATH,
+            pdf_options=getattr(settings, 'PDF_WRITE_OPTIONS', None),
+            header_max_width=getattr(settings, 'PDF_HEADER_MAX_WIDTH', 1200)
+        ))
+
+    @classmethod
+    def get_pdf_render_pool(cls) -> "PdfRenderPool":
+        from app.infrastructure.pdf_render_pool import PdfRenderPool
+        settings = Settings()
+        workers = getattr(settings, 'PDF_RENDER_WORKERS', 0)
+        if workers <= 0:
+            return None
+
+        return cls._get_or_create('pdf_render_pool', lambda: PdfRenderPool(
+            settings.PDF_CSS_PATH,
+            workers,
+            settings.PDF_TEMPLATE_PATH,
+            pdf_options=getattr(settings, 'PDF_WRITE_OPTIONS', None),
+            header_max_width=getattr(settings, 'PDF_HEADER_MAX_WIDTH', 1200)
+        ))
+
+    @classmethod
+    def get_pdf_thumbnailer(cls) -> "PdfThumbnailer":
+        from app.infrastructure.pdf_thumbnailer import PdfThumbnailer
+        settings = Settings()
+        return cls._get_or_create('pdf_thumbnailer', lambda: PdfThumbnailer(
+            getattr(settings, 'PDF_THUMBNAIL_DIR', 'report_archive/thumbnails'),
+            getattr(settings, 'PDF_THUMBNAIL_WIDTH', 240)
+        ))
+
+    @classmethod
+    def get_report_archive(cls) -> "ReportArchive":
+        from app.infrastructure.report_archive import ReportArchive
+        settings = Settings()
+        return cls._get_or_create('report_archive', lambda: ReportArchive(
+            getattr(settings, 'REPORT_ARCHIVE_DIR', 'report_archive')
+        ))
 
     # Repositories
     @classmethod
     def get_user_repository(cls) -> UserRepository:
         db_config = cls.get_database_config()
-        return cls._get_or_create('user_repository', lambda: UserRepository(db_config))
+        replica = cls.get_local_replica()
+        return cls._get_or_create('user_repository', lambda: UserRepository(db_config, replica))
 
     @classmethod
     def get_pacs_url_repository(cls) -> PacsUrlRepository:
         db_config = cls.get_database_config()
-        return cls._get_or_create('pacs_url_repository', lambda: PacsUrlRepository(db_config))
+        replica = cls.get_local_replica()
+        return cls._get_or_create('pacs_url_repository', lambda: PacsUrlRepository(db_config, replica))
 
     @classmethod
     def get_settings_repository(cls) -> SettingsRepository:
         db_config = cls.get_database_config()
-        return cls._get_or_create('settings_repository', lambda: SettingsRepository(db_config))
+        replica = cls.get_local_replica()
+        return cls._get_or_create('settings_repository', lambda: SettingsRepository(db_config, replica))
 
     @classmethod
     def get_report_title_repository(cls) -> ReportTitleRepository:
         db_config = cls.get_database_config()
-        return cls._get_or_create('report_title_repository', lambda: ReportTitleRepository(db_config))
+        replica = cls.get_local_replica()
+        return cls._get_or_create('report_title_repository', lambda: ReportTitleRepository(db_config, replica))
+
+    @classmethod
+    def get_study_record_repository(cls) -> StudyRecordRepository:
+        db_config = cls.get_database_config()
+        return cls._get_or_create('study_record_repository', lambda: StudyRecordRepository(db_config))
+
+    @classmethod
+    def get_report_record_repository(cls) -> ReportRecordRepository:
+        db_config = cls.get_database_config()
+        return cls._get_or_create('report_record_repository', lambda: ReportRecordRepository(db_config))
+
+    @classmethod
+    def get_transfer_record_repository(cls) -> TransferRecordRepository:
+        db_config = cls.get_database_config()
+        return cls._get_or_create('transfer_record_repository', lambda: TransferRecordRepository(db_config))
 
     # Services
     @classmethod
     def get_auth_service(cls) -> AuthService:
         user_repo = cls.get_user_repository()
-        return cls._get_or_create('auth_service', lambda: AuthService(user_repo))
+        settings = Settings()
+        return cls._get_or_create('auth_service', lambda: AuthService(
+            user_repo, getattr(settings, 'AUTH_VERIFICATION_CACHE_TTL', 0)
+        ))
 
     @classmethod
     def get_session_service(cls) -> SessionService:
@@ -98,7 +247,12 @@ class Container:
     def get_local_file_service(cls) -> LocalFileService:
         settings = Settings()
         cache_dir = getattr(settings, 'LOCAL_STUDIES_CACHE_DIR', 'local_studies_cache')
-        return cls._get_or_create('local_file_service', lambda: LocalFileService(cache_dir))
+        return cls._get_or_create('local_file_service', lambda: LocalFileService(
+            cache_dir,
+            max_studies=getattr(settings, 'LOCAL_STUDIES_MAX_COUNT', 0),
+            max_age_days=getattr(settings, 'LOCAL_STUDIES_MAX_AGE_DAYS', 0),
+            eviction_interval=getattr(settings, 'LOCAL_STUDIES_EVICTION_INTERVAL', 0)
+        ))
 
     @classmethod
     def get_hybrid_pacs_service(cls) -> HybridPacsService:
@@ -109,19 +263,37 @@ class Container:
         ))
 
     @classmethod
-    def get_pdf_service(cls) -> PdfService:
+    def get_pdf_service(cls) -> "PdfService":
+        from app.services.pdf_service import PdfService
         pdf_generator = cls.get_pdf_generator()
-        return cls._get_or_create('pdf_service', lambda: PdfService(pdf_generator))
+        render_pool = cls.get_pdf_render_pool()
+        report_archive = cls.get_report_archive()
+        thumbnailer = cls.get_pdf_thumbnailer()
+        settings = Settings()
+        return cls._get_or_create('pdf_service', lambda: PdfService(
+            pdf_generator,
+            render_pool=render_pool,
+            preview_max_age_hours=getattr(settings, 'PDF_PREVIEW_MAX_AGE_HOURS', 24),
+            preview_max_files=getattr(settings, 'PDF_PREVIEW_MAX_FILES', 50),
+            report_archive=report_archive,
+            thumbnailer=thumbnailer
+        ))
 
     @classmethod
     def get_pacs_url_service(cls) -> PacsUrlService:
         pacs_url_repo = cls.get_pacs_url_repository()
-        return cls._get_or_create('pacs_url_service', lambda: PacsUrlService(pacs_url_repo))
+        settings = Settings()
+        return cls._get_or_create('pacs_url_service', lambda: PacsUrlService(
+            pacs_url_repo, getattr(settings, 'CONFIG_CACHE_TTL', 30)
+        ))
 
     @classmethod
     def get_settings_service(cls) -> SettingsService:
         settings_repo = cls.get_settings_repository()
-        return cls._get_or_create('settings_service', lambda: SettingsService(settings_repo))
+        settings = Settings()
+        return cls._get_or_create('settings_service', lambda: SettingsService(
+            settings_repo, getattr(settings, 'CONFIG_CACHE_TTL', 30)
+        ))
 
     @classmethod
     def get_dicom_anonymizer_service(cls):
@@ -137,12 +309,67 @@ class Container:
     @classmethod
     def get_report_title_service(cls) -> ReportTitleService:
         report_title_repo = cls.get_report_title_repository()
-        return cls._get_or_create('report_title_service', lambda: ReportTitleService(report_title_repo))
+        settings = Settings()
+        return cls._get_or_create('report_title_service', lambda: ReportTitleService(
+            report_title_repo, getattr(settings, 'CONFIG_CACHE_TTL', 30)
+        ))
+
+    @classmethod
+    def get_study_history_service(cls) -> StudyHistoryService:
+        study_repo = cls.get_study_record_repository()
+        report_repo = cls.get_report_record_repository()
+        transfer_repo = cls.get_transfer_record_repository()
+        session_service = cls.get_session_service()
+        settings = Settings()
+        return cls._get_or_create('study_history_service', lambda: StudyHistoryService(
+            study_repo, report_repo, transfer_repo, session_service,
+            getattr(settings, 'STUDY_HISTORY_LOOKUP_TIMEOUT', 2)
+        ))
 
     @classmethod
     def get_pacs_controller(cls) -> HybridPacsController:
         hybrid_pacs_service = cls.get_hybrid_pacs_service()
         pdf_service = cls.get_pdf_service()
+        study_history_service = cls.get_study_history_service()
         return cls._get_or_create('hybrid_pacs_controller', lambda: HybridPacsController(
-            hybrid_pacs_service, pdf_service
+            hybrid_pacs_service, pdf_service, study_history_service
         ))
+
+    @classmethod
+    def start_pdf_warm_up(cls):
+        # Pornit dupa login: pregateste generarea PDF in fundal, fara sa blocheze fereastra principala
+        settings = Settings()
+        if not getattr(settings, 'PDF_WARM_UP_AFTER_LOGIN', True):
+            return
+
+        pdf_service = cls.get_pdf_service()
+
+        def warm_up():
+            try:
+                pdf_service.warm_up(settings.HEADER_IMAGE_PATH)
+            except Exception as e:
+                print(f"Warning: PDF warm-up failed: {e}")
+
+        threading.Thread(target=warm_up, name="pdf-warm-up", daemon=True).start()
+
+    @classmethod
+    def shutdown(cls):
+        pdf_service = cls._instances.get('pdf_service')
+        if pdf_service:
+            pdf_service.shutdown()
+
+        health_monitor = cls._instances.get('health_monitor')
+        if health_monitor:
+            health_monitor.stop()
+
+        study_history_service = cls._instances.get('study_history_service')
+        if study_history_service:
+            study_history_service.shutdown()
+
+        local_replica = cls._instances.get('local_replica')
+        if local_replica:
+            local_replica.stop()
+
+        database_config = cls._instances.get('database_config')
+        if database_config:
+            database_config.dispose()
@@ -0,0 +1,258 @@
+import io
+import os
+import tarfile
+import tempfile
+import threading
+import zipfile
+from collections import OrderedDict
+from typing import Iterator, Tuple, Optional
+
+import pydicom
+
+from app.utils.dicom_sniffer import DicomSniffer
+
+ARCHIVE_MEMBER_SEPARATOR = "::"
+
+
+class _SpoolingMemberStream(io.RawIOBase):
+    """Seekable view over a forward-only member stream.
+
+    Bytes are pulled from the source only as far as the caller reads; what
+    has been read is kept in a spooled temporary file so seeking back does
+    not restart decompression.
+    """
+
+    def __init__(self, source, size: int, spool_max_size: int, name: str):
+        super().__init__()
+        # pydicom citeste .name de pe BufferedReader (care il cere de la raw)
+        self.name = name
+        self._source = source
+        self._size = size
+        self._spool = tempfile.SpooledTemporaryFile(max_size=spool_max_size)
+        self._spooled = 0
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += self._size
+        # Doar pozitia se muta; datele se citesc la urmatorul read
+        self._pos = max(0, offset)
+        return self._pos
+
+    def readinto(self, buffer) -> int:
+        if self._pos >= self._spooled:
+            self.load(self._pos + len(buffer))
+
+        self._spool.seek(self._pos)
+        data = self._spool.read(min(len(buffer), max(0, self._spooled - self._pos)))
+        buffer[:len(data)] = data
+        self._pos += len(data)
+        return len(data)
+
+    def load(self, end: int = None):
+        """Copies the source into the spool up to `end` (the whole member if None)."""
+        if self._source is None:
+            return
+        self._spool.seek(self._spooled)
+        while end is None or self._spooled < end:
+            chunk = self._source.read(1024 * 1024 if end is None else max(end - self._spooled, 64 * 1024))
+            if not chunk:
+                self._close_source()
+                break
+            self._spool.write(chunk)
+            self._spooled += len(chunk)
+
+    def close(self):
+        if not self.closed:
+            self._close_source()
+            self._spool.close()
+        super().close()
+
+    def _close_source(self):
+        if self._source is not None:
+            self._source.close()
+            self._source = None
+
+
+class ArchiveMemberFile:
+    """One archive member, read on demand.
+
+    A header-only read of a large zipped instance decompresses just the
+    header. Bytes already read are spooled: small members stay in memory,
+    large ones spill to disk, so serving an instance never holds more than
+    SPOOL_MAX_SIZE bytes on the heap. Exposes the same stream()/len()
+    interface as MappedFile.
+    """
+
+    SPOOL_MAX_SIZE = 32 * 1024 * 1024
+
+    def __init__(self, source, size: int, name: str):
+        self._raw = _SpoolingMemberStream(source, size, self.SPOOL_MAX_SIZE, name)
+        self._stream = io.BufferedReader(self._raw)
+        self._size = size
+
+    def __enter__(self) -> "ArchiveMemberFile":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def load(self):
+        self._raw.load()
+
+    def stream(self):
+        self._stream.seek(0)
+        return self._stream
+
+    def close(self):
+        self._stream.close()
+
+
+class ArchiveReader:
+    """Indexes and serves DICOM instances stored inside zip/tar archives
+    without extracting the whole archive."""
+
+    ZIP_EXTENSIONS = ('.zip',)
+    TAR_EXTENSIONS = ('.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tbz2', '.tar.xz', '.txz')
+
+    def __init__(self, sniffer: DicomSniffer, max_open_archives: int = 4):
+        self._sniffer = sniffer
+        self._max_open_archives = max_open_archives
+        self._open_archives: "OrderedDict[str, Tuple[object, dict]]" = OrderedDict()  # path -> (handle, members)
+        self._lock = threading.RLock()
+
+    @classmethod
+    def is_archive(cls, file_path: str) -> bool:
+        name = file_path.lower()
+        if name.endswith(cls.ZIP_EXTENSIONS):
+            return zipfile.is_zipfile(file_path)
+        if name.endswith(cls.TAR_EXTENSIONS):
+            return tarfile.is_tarfile(file_path)
+        return False
+
+    @staticmethod
+    def make_ref(archive_path: str, member_name: str) -> str:
+        return f"{archive_path}{ARCHIVE_MEMBER_SEPARATOR}{member_name}"
+
+    @staticmethod
+    def split_ref(ref: str) -> Optional[Tuple[str, str]]:
+        if not ref or ARCHIVE_MEMBER_SEPARATOR not in ref:
+            return None
+        # Numele membrului nu contine separatorul; calea arhivei poate sa-l contina
+        archive_path, member_name = ref.rsplit(ARCHIVE_MEMBER_SEPARATOR, 1)
+        return archive_path, member_name
+
+    @classmethod
+    def is_ref(cls, ref: str) -> bool:
+        return cls.split_ref(ref) is not None
+
+    def iter_dicom_headers(self, archive_path: str) -> Iterator[Tuple[str, object]]:
+        with self._lock:
+            _, members = self._get_archive(archive_path)
+            member_names = list(members.keys())
+
+        for member_name in member_names:
+            try:
+                dataset = self._read_member_header(archive_path, member_name)
+            except Exception as e:
+                print(f"Warning: Could not read {member_name} from {archive_path}: {e}")
+                continue
+
+            if dataset is not None:
+                yield member_name, dataset
+
+    def _read_member_header(self, archive_path: str, member_name: str):
+        with self._lock:
+            handle, members = self._get_archive(archive_path)
+            member = members[member_name]
+
+            with self._open_member_stream(handle, member) as stream:
+                header = stream.read(DicomSniffer.SNIFF_SIZE)
+                if not self._sniffer.is_dicom_header(header, self._member_size(member), member_name):
+                    return None
+
+                stream.seek(0)
+                return pydicom.dcmread(stream, stop_before_pixels=True, force=True)
+
+    def open_member(self, ref: str) -> ArchiveMemberFile:
+        archive_path, member_name = self.split_ref(ref)
+        with self._lock:
+            handle, members = self._get_archive(archive_path)
+            member = members.get(member_name)
+            if member is None:
+                raise FileNotFoundError(f"{member_name} not found in {archive_path}")
+
+            member_file = ArchiveMemberFile(self._open_member_stream(handle, member), self._member_size(member), ref)
+            if not isinstance(handle, zipfile.ZipFile):
+                # Membrii tar citesc din handle-ul partajat (nu e thread-safe, se inchide la evictie): copiem acum
+                member_file.load()
+            return member_file
+
+    def member_exists(self, ref: str) -> bool:
+        parts = self.split_ref(ref)
+        if not parts or not os.path.exists(parts[0]):
+            return False
+        try:
+            with self._lock:
+                _, members = self._get_archive(parts[0])
+                return parts[1] in members
+        except Exception:
+            return False
+
+    def close_archive(self, archive_path: str):
+        with self._lock:
+            entry = self._open_archives.pop(os.path.abspath(archive_path), None)
+            if entry:
+                entry[0].close()
+
+    def close_all(self):
+        with self._lock:
+            for handle, _ in self._open_archives.values():
+                handle.close()
+            self._open_archives.clear()
+
+    def _get_archive(self, archive_path: str):
+        key = os.path.abspath(archive_path)
+        entry = self._open_archives.get(key)
+        if entry:
+            self._open_archives.move_to_end(key)
+            return entry
+
+        if zipfile.is_zipfile(archive_path):
+            handle = zipfile.ZipFile(archive_path)
+            members = {info.filename: info for info in handle.infolist() if not info.is_dir()}
+        else:
+            # Modul "r:*" permite acces aleator; membrii sunt cititi in ordinea din arhiva
+            handle = tarfile.open(archive_path, mode="r:*")
+            members = {info.name: info for info in handle.getmembers() if info.isfile()}
+
+        self._open_archives[key] = (handle, members)
+        while len(self._open_archives) > self._max_open_archives:
+            _, (old_handle, _) = self._open_archives.popitem(last=False)
+            old_handle.close()
+
+        return handle, members
+
+    def _open_member_stream(self, handle, member):
+        if isinstance(handle, zipfile.ZipFile):
+            return handle.open(member)
+        return handle.extractfile(member)
+
+    def _member_size(self, member) -> int:
+        if isinstance(member, zipfile.ZipInfo):
+            return member.file_size
+        return member.size
@@ -0,0 +1,101 @@
+import threading
+import time
+from typing import Dict, Any
+
+
+class CircuitBreaker:
+    """Fails fast while a dependency is known to be down.
+
+    After `failure_threshold` consecutive connection failures the circuit
+    opens and calls are refused for `reset_timeout` seconds. Then a single
+    trial call is let through (half-open): success closes the circuit,
+    failure opens it again. The health monitor's probes also report here,
+    so a recovered server closes the circuit without waiting for a user action.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int = 3, reset_timeout: float = 30):
+        self.name = name
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_started_at = None
+        self._last_error = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self._reset_timeout:
+                return self.HALF_OPEN
+            return self._state
+
+    @property
+    def last_error(self):
+        return self._last_error
+
+    def allow_request(self) -> bool:
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+
+            if time.monotonic() - self._opened_at < self._reset_timeout:
+                return False
+
+            # Half-open: un singur apel de proba; daca nu raporteaza rezultatul, altul poate incerca dupa reset_timeout
+            now = time.monotonic()
+            if self._trial_started_at is not None and now - self._trial_started_at < self._reset_timeout:
+                return False
+            self._state = self.HALF_OPEN
+            self._trial_started_at = now
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._trial_started_at = None
+            self._last_error = None
+
+    def record_failure(self, error: Exception = None):
+        with self._lock:
+            self._failures += 1
+            self._trial_started_at = None
+            self._last_error = str(error) if error else None
+            if self._state == self.HALF_OPEN or self._failures >= self._failure_threshold:
+                if self._state != self.OPEN:
+                    print(f"Warning: Circuit '{self.name}' opened: {self._last_error}")
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+
+    def seconds_until_retry(self) -> float:
+        with self._lock:
+            if self._state != self.OPEN:
+                return 0.0
+            return max(0.0, self._reset_timeout - (time.monotonic() - self._opened_at))
+
+
+class CircuitBreakerRegistry:
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 30):
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get(name)
+            if breaker is None:
+                breaker = CircuitBreaker(name, self._failure_threshold, self._reset_timeout)
+                self._breakers[name] = breaker
+            return breaker
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return {breaker.name: {"state": breaker.state, "error": breaker.last_error} for breaker in breakers}
@@ -1,35 +1,53 @@
 import requests
 from typing import Optional, Dict, Any
+from urllib.parse import urlsplit
 from app.core.exceptions.pacs_exceptions import PacsConnectionError
+from app.infrastructure.circuit_breaker import CircuitBreakerRegistry
 
 
 class HttpClient:
-    def __init__(self, timeout: int = 30):
+    def __init__(self, timeout: int = 30, connect_timeout: float = None,
+                 circuit_breakers: Optional[CircuitBreakerRegistry] = None):
         self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self._circuit_breakers = circuit_breakers
 
     def get(self, url: str, auth: Optional[tuple] = None, headers: Optional[Dict[str, str]] = None):
-        try:
-            response = requests.get(url, auth=auth, headers=headers, timeout=self.timeout)
-            self._validate_response(response)
-            return response
-        except requests.exceptions.RequestException as e:
-            raise PacsConnectionError(f"HTTP GET failed: {e}")
+        return self._request("GET", url, auth=auth, headers=headers)
 
     def post(self, url: str, data: Any = None, auth: Optional[tuple] = None, headers: Optional[Dict[str, str]] = None):
-        try:
-            response = requests.post(url, data=data, auth=auth, headers=headers, timeout=self.timeout)
-            self._validate_response(response)
-            return response
-        except requests.exceptions.RequestException as e:
-            raise PacsConnectionError(f"HTTP POST failed: {e}")
+        return self._request("POST", url, data=data, auth=auth, headers=headers)
 
     def delete(self, url: str, auth: Optional[tuple] = None, headers: Optional[Dict[str, str]] = None):
+        return self._request("DELETE", url, auth=auth, headers=headers)
+
+    @staticmethod
+    def endpoint_name(url: str) -> str:
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}"
+
+    def _request(self, method: str, url: str, **kwargs):
+        breaker = self._circuit_breakers.get(self.endpoint_name(url)) if self._circuit_breakers else None
+        if breaker and not breaker.allow_request():
+            raise PacsConnectionError(
+                f"PACS {breaker.name} indisponibil, reincercare in {breaker.seconds_until_retry():.0f}s"
+            )
+
+        # Conexiunea esueaza repede cand serverul e oprit; timeout-ul lung ramane pentru transferuri
+        timeout = (self.connect_timeout, self.timeout) if self.connect_timeout else self.timeout
         try:
-            response = requests.delete(url, auth=auth, headers=headers, timeout=self.timeout)
-            self._validate_response(response)
-            return response
+            response = requests.request(method, url, timeout=timeout, **kwargs)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            if breaker:
+                breaker.record_failure(e)
+            raise PacsConnectionError(f"HTTP {method} failed: {e}")
         except requests.exceptions.RequestException as e:
-            raise PacsConnectionError(f"HTTP DELETE failed: {e}")
+            raise PacsConnectionError(f"HTTP {method} failed: {e}")
+
+        if breaker:
+            breaker.record_success()
+        self._validate_response(response)
+        return response
 
     def _validate_response(self, response):
         if response.status_code == 200:
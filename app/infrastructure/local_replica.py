@@ -0,0 +1,145 @@
+import os
+import threading
+from datetime import datetime, timedelta
+from typing import ContextManager, Optional
+
+from sqlalchemy import func, or_, text, update
+from sqlalchemy.orm import Session
+
+from app.config.database import DatabaseConfig
+from app.database.models import Base, User, PacsUrl, AppSettings, ReportTitle
+
+
+class LocalReplica:
+    """SQLite mirror of users, pacs_urls, app_settings and report_title, used for reads.
+
+    Tables with an updated_at column are synced incrementally (rows changed
+    since the newest local updated_at); the others are copied in full. Rows
+    deleted on the server are removed by comparing id sets. Writes still go
+    to the server; repositories push the committed rows here right away.
+
+    The file is not encrypted, so SECRET_COLUMNS (password hashes, PACS
+    passwords) are stored empty; repositories read those from the server.
+    """
+
+    MODELS = (AppSettings, ReportTitle, PacsUrl, User)
+    SECRET_COLUMNS = {User: ("password",), PacsUrl: ("password",)}
+    # updated_at este scris cu ceasul fiecarei statii; o marja acopera decalajele dintre ceasuri
+    SYNC_OVERLAP = timedelta(minutes=5)
+
+    def __init__(self, primary: DatabaseConfig, replica_path: str, sync_interval: float = 60):
+        self._primary = primary
+        self._sync_interval = sync_interval
+        self._stop_event = threading.Event()
+        self._sync_lock = threading.Lock()
+        self._thread = None
+        self.last_synced_at: Optional[datetime] = None
+
+        os.makedirs(os.path.dirname(os.path.abspath(replica_path)), exist_ok=True)
+        self._config = DatabaseConfig(f"sqlite:///{os.path.abspath(replica_path)}")
+        Base.metadata.create_all(self._config.engine, tables=[model.__table__ for model in self.MODELS])
+        self._scrub_secrets()
+
+        # O replica din sesiunea anterioara poate servi citirile (mod offline) pana la primul sync
+        self._ready = self._has_data()
+
+    @property
+    def is_ready(self) -> bool:
+        return self._ready
+
+    def session_scope(self) -> ContextManager[Session]:
+        return self._config.session_scope()
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._sync_loop, name="local-replica-sync", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        self._config.dispose()
+
+    def sync(self) -> bool:
+        with self._sync_lock:
+            try:
+                with self._primary.session_scope() as source, self._config.session_scope() as target:
+                    for model in self.MODELS:
+                        self._sync_table(model, source, target)
+            except Exception as e:
+                print(f"Warning: Local replica sync failed: {e}")
+                return False
+
+        self._ready = True
+        self.last_synced_at = datetime.now()
+        return True
+
+    def upsert(self, *entities):
+        try:
+            with self._config.session_scope() as session:
+                for entity in entities:
+                    session.merge(self._copy(entity))
+        except Exception as e:
+            # Urmatorul sync va aduce randul de pe server
+            print(f"Warning: Could not write through to local replica: {e}")
+
+    def remove(self, model, entity_id: int):
+        try:
+            with self._config.session_scope() as session:
+                session.query(model).filter(model.id == entity_id).delete(synchronize_session=False)
+        except Exception as e:
+            print(f"Warning: Could not remove row from local replica: {e}")
+
+    def _sync_loop(self):
+        while not self._stop_event.is_set():
+            self.sync()
+            self._stop_event.wait(self._sync_interval)
+
+    def _sync_table(self, model, source: Session, target: Session):
+        query = source.query(model)
+
+        if 'updated_at' in model.__table__.columns:
+            watermark = target.query(func.max(model.updated_at)).scalar()
+            if watermark is not None:
+                query = query.filter(model.updated_at >= watermark - self.SYNC_OVERLAP)
+
+        for row in query.all():
+            target.merge(self._copy(row))
+
+        server_ids = {entity_id for (entity_id,) in source.query(model.id)}
+        local_ids = {entity_id for (entity_id,) in target.query(model.id)}
+        stale_ids = list(local_ids - server_ids)
+        if stale_ids:
+            target.query(model).filter(model.id.in_(stale_ids)).delete(synchronize_session=False)
+
+    def _copy(self, entity):
+        model = type(entity)
+        values = {column.key: getattr(entity, column.key) for column in model.__table__.columns}
+        for column in self.SECRET_COLUMNS.get(model, ()):
+            # Gol, nu NULL: users.password este NOT NULL
+            values[column] = ""
+        return model(**values)
+
+    def _scrub_secrets(self):
+        # Replicile create de versiuni mai vechi pot contine parolele reale
+        scrubbed = 0
+        with self._config.session_scope() as session:
+            for model, columns in self.SECRET_COLUMNS.items():
+                has_secret = or_(*[getattr(model, column) != "" for column in columns])
+                scrubbed += session.execute(
+                    update(model).where(has_secret).values({column: "" for column in columns})
+                ).rowcount
+
+        if scrubbed:
+            # VACUUM rescrie fisierul, ca valorile vechi sa nu ramana in paginile libere
+            with self._config.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+                connection.execute(text("VACUUM"))
+
+    def _has_data(self) -> bool:
+        try:
+            with self._config.session_scope() as session:
+                return session.query(AppSettings.id).first() is not None
+        except Exception:
+            return False
@@ -0,0 +1,77 @@
+import mmap
+import os
+from io import BytesIO
+from typing import Union, BinaryIO
+
+
+class MappedFile:
+    """Read-only memory map over a local file.
+
+    The mapping behaves like a seekable binary stream, so it can be handed
+    directly to pydicom.dcmread or to requests as an upload body without
+    first copying the whole file into a Python bytes object.
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self._file = None
+        self._map = None
+        self._fallback = None
+
+    def open(self) -> "MappedFile":
+        self._file = open(self.file_path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # Fisierele goale (si unele sisteme de fisiere) nu pot fi mapate
+            self._fallback = BytesIO(self._file.read())
+        return self
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._fallback = None
+
+    def __enter__(self) -> "MappedFile":
+        if self._file is None:
+            self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __len__(self) -> int:
+        if self._map is not None:
+            return len(self._map)
+        if self._fallback is not None:
+            return len(self._fallback.getbuffer())
+        return os.path.getsize(self.file_path)
+
+    def stream(self) -> BinaryIO:
+        source = self._map if self._map is not None else self._fallback
+        if source is None:
+            raise ValueError(f"File is not open: {self.file_path}")
+        source.seek(0)
+        return source
+
+
+def as_dicom_stream(data: Union[bytes, bytearray, memoryview, BinaryIO, MappedFile]) -> BinaryIO:
+    # MappedFile si ArchiveMemberFile expun stream()
+    if hasattr(data, 'stream'):
+        return data.stream()
+    if hasattr(data, 'read') and hasattr(data, 'seek'):
+        data.seek(0)
+        return data
+    return BytesIO(data)
+
+
+def dicom_data_length(data) -> int:
+    if hasattr(data, 'stream'):
+        return len(data)
+    if hasattr(data, 'getbuffer'):
+        return len(data.getbuffer())
+    return len(data)
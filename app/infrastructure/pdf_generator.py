@@ -1,16 +1,38 @@
 import os
 import re
 import base64
+import threading
+from io import BytesIO
 from datetime import datetime
-from weasyprint import HTML, CSS
-from typing import Dict, Any
+from typing import Dict, Any, Callable, Tuple
 from urllib.parse import urljoin
 from pathlib import Path
 
+from app.infrastructure.report_template import ReportTemplate
+
 
 class PdfGenerator:
-    def __init__(self, css_path: str):
+    # Optiuni WeasyPrint write_pdf: imaginile sunt recomprimate. Subsetarea fonturilor si
+    # compresia stream-urilor sunt deja implicite in WeasyPrint, deci nu le mai setam aici.
+    DEFAULT_PDF_OPTIONS = {
+        "optimize_images": True,
+        "jpeg_quality": 85
+    }
+
+    def __init__(self, css_path: str, template_path: str = None, pdf_options: Dict[str, Any] = None,
+                 header_max_width: int = 1200):
         self.css_path = css_path
+        self.pdf_options = {**self.DEFAULT_PDF_OPTIONS, **(pdf_options or {})}
+        self.header_max_width = header_max_width
+        # Cache WeasyPrint pentru imaginile decodate, reutilizat intre randari
+        self._image_cache: Dict[str, Any] = {}
+        if template_path is None:
+            from app.config.settings import Settings
+            template_path = Settings.PDF_TEMPLATE_PATH
+        self.template_path = template_path
+        # (tip, cale) -> ((mtime_ns, size), valoare); invalidat automat cand fisierul se schimba
+        self._asset_cache: Dict[Tuple[str, str], Tuple[Tuple[int, int], Any]] = {}
+        self._asset_lock = threading.Lock()
 
     def create_pdf(self, content: str, metadata: Dict[str, Any], output_path: str, doctor_name: str = None,
                    selected_title: str = None, header_image_path: str = None):
@@ -28,38 +50,123 @@ class PdfGenerator:
             content, patient_metadata, generated_date, doctor_name, current_year, selected_title, header_image_path
         )
 
-        stylesheets = []
-        if self.css_path:
-            stylesheets.append(CSS(self.css_path))
+        stylesheets = self._get_stylesheets()
+
+        # weasyprint (cffi/Pango) se importa la prima folosire, nu la pornirea aplicatiei
+        from weasyprint import HTML
 
         # Pe Windows, folosim base_url pentru căile relative
         html_obj = HTML(string=html_content, base_url=Path.cwd().as_uri())
-        html_obj.write_pdf(output_path, stylesheets=stylesheets)
+        html_obj.write_pdf(output_path, stylesheets=stylesheets, cache=self._image_cache, **self.pdf_options)
+
+    def _get_stylesheets(self) -> list:
+        if not self.css_path:
+            return []
+        try:
+            return [self._get_cached_asset("css", self.css_path, self._load_stylesheet)]
+        except OSError as e:
+            print(f"Error loading PDF stylesheet: {e}")
+            return []
+
+    def _load_stylesheet(self, path: str):
+        from weasyprint import CSS
+        return CSS(filename=path)
+
+    def warm_up(self, header_image_path: str = None):
+        # Incarca weasyprint si pregateste CSS-ul, sablonul si antetul inainte de primul PDF
+        self._get_stylesheets()
+        self._get_template()
+        if header_image_path and os.path.exists(header_image_path):
+            self._image_to_base64(header_image_path)
+
+    def _get_template(self) -> ReportTemplate:
+        # Recompilat doar cand fisierul sablonului se schimba pe disc
+        return self._get_cached_asset("template", self.template_path, ReportTemplate.from_file)
+
+    def _get_cached_asset(self, kind: str, path: str, loader: Callable[[str], Any]) -> Any:
+        stat = os.stat(path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        key = (kind, os.path.abspath(path))
+
+        with self._asset_lock:
+            cached = self._asset_cache.get(key)
+            if cached and cached[0] == signature:
+                return cached[1]
+
+        value = loader(path)
+
+        with self._asset_lock:
+            self._asset_cache[key] = (signature, value)
+        return value
+
+    def clear_asset_cache(self):
+        with self._asset_lock:
+            self._asset_cache.clear()
+            self._image_cache.clear()
 
     def _image_to_base64(self, image_path: str) -> str:
         try:
-            print(f"Converting image to base64: {image_path}")
-            with open(image_path, 'rb') as image_file:
-                image_data = base64.b64encode(image_file.read()).decode('utf-8')
-                
-                ext = os.path.splitext(image_path)[1].lower()
-                if ext == '.png':
-                    mime_type = 'image/png'
-                elif ext in ['.jpg', '.jpeg']:
-                    mime_type = 'image/jpeg'
-                elif ext == '.gif':
-                    mime_type = 'image/gif'
-                else:
-                    mime_type = 'image/png'
-                
-                base64_string = f"data:{mime_type};base64,{image_data}"
-                print(f"Successfully converted to base64, length: {len(base64_string)}")
-                return base64_string
-                
+            return self._get_cached_asset("image", image_path, self._load_image_as_base64)
         except Exception as e:
             print(f"Error converting image to base64: {e}")
             return ""
 
+    def _load_image_as_base64(self, image_path: str) -> str:
+        print(f"Converting image to base64: {image_path}")
+        with open(image_path, 'rb') as image_file:
+            image_bytes = image_file.read()
+
+        ext = os.path.splitext(image_path)[1].lower()
+        if ext == '.png':
+            mime_type = 'image/png'
+        elif ext in ['.jpg', '.jpeg']:
+            mime_type = 'image/jpeg'
+        elif ext == '.gif':
+            mime_type = 'image/gif'
+        else:
+            mime_type = 'image/png'
+
+        image_bytes, mime_type = self._optimize_header_image(image_bytes, mime_type)
+        image_data = base64.b64encode(image_bytes).decode('utf-8')
+
+        base64_string = f"data:{mime_type};base64,{image_data}"
+        print(f"Successfully converted to base64, length: {len(base64_string)}")
+        return base64_string
+
+    def _optimize_header_image(self, image_bytes: bytes, mime_type: str) -> Tuple[bytes, str]:
+        # Antetul se redimensioneaza o singura data (rezultatul e cache-uit), nu la fiecare PDF
+        try:
+            from PIL import Image
+        except ImportError:
+            return image_bytes, mime_type
+
+        try:
+            with Image.open(BytesIO(image_bytes)) as image:
+                image.load()
+                resized = bool(self.header_max_width and image.width > self.header_max_width)
+                if resized:
+                    height = max(1, round(image.height * self.header_max_width / image.width))
+                    image = image.resize((self.header_max_width, height), Image.Resampling.LANCZOS)
+
+                output = BytesIO()
+                if mime_type == 'image/jpeg':
+                    image.convert('RGB').save(output, 'JPEG', quality=self.pdf_options.get("jpeg_quality", 85),
+                                              optimize=True)
+                    optimized_mime = 'image/jpeg'
+                else:
+                    image.save(output, 'PNG', optimize=True)
+                    optimized_mime = 'image/png'
+        except Exception as e:
+            print(f"Warning: Could not optimize header image: {e}")
+            return image_bytes, mime_type
+
+        optimized = output.getvalue()
+        if not resized and len(optimized) >= len(image_bytes):
+            return image_bytes, mime_type
+
+        print(f"Header image optimized: {len(image_bytes)} -> {len(optimized)} bytes")
+        return optimized, optimized_mime
+
     def _get_windows_file_uri(self, file_path: str) -> str:
         """Convertește calea Windows în URI valid pentru WeasyPrint"""
         try:
@@ -116,163 +223,21 @@ class PdfGenerator:
             print("❌ Header image not found, using placeholder")
             header_content = '<div class="header-placeholder"><!-- ANTET SPITAL --></div>'
 
-        return f"""
-        <!DOCTYPE html>
-        <html lang="ro">
-        <head>
-            <meta charset="UTF-8">
-            <title>{exam_title}</title>
-        </head>
-        <body>
-            <div class="page-container">
-                <!-- PARTEA STÂNGĂ - IDENTICĂ CU IMAGINEA -->
-                <div class="left-panel">
-                    <div class="lab-title">
-                        <strong>Laborator<br>MEDICINA<br>NUCLEARĂ</strong>
-                    </div>
-
-                    <div class="prof-name">
-                        <strong>Prof. dr.<br>Valeriu Rusu</strong>
-                    </div>
-
-                    <div class="address">
-                        B-dul Independentei<br>
-                        nr. 1, etaj, cod 700111<br>
-                        tel./programări:<br>
-                        <strong>0232 240 822,<br>
-                        int.120</strong><br>
-                        sau <strong>0770 936 586</strong><br>
-                        e-mail:<br>
-                        <strong>laboratornucleara<br>
-                        @spitalspiridon.ro</strong>
-                    </div>
-
-                    <div class="section-header">
-                        <strong>Sef laborator</strong><br>
-                        <strong>Prof. dr. Cipriana<br>
-                        STEFANESCU –</strong><br>
-                        medic primar<br>
-                        medicina nucleara si<br>
-                        endocrinologie
-                    </div>
-
-                    <div class="section-header">
-                        <strong><u>Medici</u></strong><br>
-                        <strong>Ana Maria STATESCU</strong><br>
-                        – medic primar med.<br>
-                        nucl.<br>
-                        <strong>Irena GRIEROSU</strong><br>
-                        – sef lucr. dr., medic<br>
-                        primar med. nucl.<br>
-                        <strong>Cati-Raluca<br>
-                        STOLNICEANU</strong><br>
-                        – asist. univ. dr.,<br>
-                        medic primar med.nucl.<br>
-                        <strong>Wael JALLOUL</strong><br>
-                        – asist. univ. dr., medic<br>
-                        medic primar med.nucl.
-                    </div>
-
-                    <div class="section-header">
-                        <strong><u>Fizician</u></strong><br>
-                        <strong>Vlad GHIZDOVAT</strong>
-                    </div>
-
-                    <div class="section-header">
-                        <strong><u>Medici rezidenti</u></strong><br>
-                        <strong>Laura PINTILIE<br>
-                        Radu CONSTANTIN<br>
-                        Larisa Elena RAU<br>
-                        Angela OARZA<br>
-                        Oana OLARIU<br>
-                        Raluca Rafaela ION<br>
-                        Ana Maria NISTOR<br>
-                        Sabina DEJMASU<br>
-                        Malina EPURE</strong>
-                    </div>
-
-                    <div class="section-header">
-                        <strong><u>Asistenta sefa</u></strong><br>
-                        <strong>Alina TIMOFTI</strong>
-                    </div>
-
-                    <div class="section-header">
-                        <strong><u>Asistenti</u></strong><br>
-                        <strong>Ofelia PERJU<br>
-                        Alina STEFAN<br>
-                        Monica PENISOARA<br>
-                        Otilia LISMAN<br>
-                        Laura VARZAR</strong>
-                    </div>
-
-                    <div class="section-header">
-                        <strong><u>Personal auxiliar</u></strong><br>
-                        <strong>Irina ATASIEI<br>
-                        Genoveva SPATARU</strong>
-                    </div>
-
-                    <div class="section-header">
-                        <strong><u>Registrator medical</u></strong><br>
-                        <strong>Lupascu Adrian</strong>
-                    </div>
-                </div>
-
-                <!-- PARTEA DREAPTĂ - IDENTICĂ CU IMAGINEA -->
-                <div class="right-panel">
-                    <!-- SPAȚIU PENTRU ANTETUL SPITALULUI -->
-                    <div class="hospital-header-space">
-                        {header_content}<br><br><br><br>
-                    </div>
-
-                    <!-- DATELE PACIENTULUI -->
-                    <div class="patient-section">
-                        <div class="patient-data">
-                            <strong>Nume:</strong> {patient_name}<br>
-                            <strong>CNP:</strong> {cnp}<br>
-                            <strong>Dosar nr.:</strong> {dosar_nr}<br>
-                            <strong>Gamma camera:</strong> {gamma_camera}<br>
-                            <strong>Investigatie la recomandarea:</strong> {referring_doctor}<br> 
-                            <strong>Diagnostic de trimitere:</strong> {diagnosis}<br>
-                            <strong>Doza:</strong> {dose_mbq} <strong>Radiofarmaceutic:</strong> <strong>{radiopharmaceutical}</strong>
-                        </div>
-
-                        <div class="exam-date-right">
-                            <strong>Data {self._format_date(exam_date)}</strong>
-                        </div>
-                    </div>
-
-                    <!-- TITLUL EXAMINĂRII -->
-                    <div class="main-title">
-                        <h1>{exam_title}</h1>
-                    </div>
-
-                    <!-- CONȚINUTUL EXAMINĂRII -->
-                    <div class="examination-content">
-                        {self._format_content_for_html(content)}
-                    </div>
-
-                    <!-- SEMNĂTURILE -->
-                    <div class="signatures-section">
-                        <div class="signature-left-bottom">
-                            <strong>Sef laborator</strong><br>
-                            Medic primar Medicina Nucleara<br>
-                            <strong>Prof. dr. Cipriana STEFANESCU</strong>
-                        </div>
-
-                        <div class="signature-right-bottom">
-                            Medic specialist Medicina Nucleara<br>
-                            <strong>{doctor_name if doctor_name else "Dr. [Nume Medic]"}</strong>
-                        </div>
-                    </div>
-
-                    <div class="resident-signature-bottom">
-                        <strong>Medic rezident Medicina Nucleara</strong>
-                    </div>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
+        return self._get_template().render({
+            "exam_title": exam_title,
+            "header_content": header_content,
+            "patient_name": patient_name,
+            "cnp": cnp,
+            "dosar_nr": dosar_nr,
+            "gamma_camera": gamma_camera,
+            "referring_doctor": referring_doctor,
+            "diagnosis": diagnosis,
+            "dose_mbq": dose_mbq,
+            "radiopharmaceutical": radiopharmaceutical,
+            "exam_date": self._format_date(exam_date),
+            "content": self._format_content_for_html(content),
+            "doctor_name": doctor_name if doctor_name else "Dr. [Nume Medic]"
+        })
 
     def _filter_patient_metadata(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
         patient_fields = {
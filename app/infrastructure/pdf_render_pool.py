@@ -0,0 +1,71 @@
+import multiprocessing
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Dict, Any, Optional
+
+# Generatorul fiecarui proces din pool; creat o singura data, in initializer
+_worker_generator = None
+
+
+def _init_worker(css_path: str, template_path: str = None, pdf_options: Dict[str, Any] = None,
+                 header_max_width: int = 1200):
+    global _worker_generator
+    from app.infrastructure.pdf_generator import PdfGenerator
+    _worker_generator = PdfGenerator(css_path, template_path, pdf_options, header_max_width)
+
+
+def _warm_up_worker(header_image_path: str = None) -> int:
+    _worker_generator.warm_up(header_image_path)
+    return os.getpid()
+
+
+def _render_in_worker(content: str, metadata: Dict[str, Any], output_path: str, doctor_name: str = None,
+                      selected_title: str = None, header_image_path: str = None) -> str:
+    _worker_generator.create_pdf(content, metadata, output_path, doctor_name, selected_title, header_image_path)
+    return output_path
+
+
+class PdfRenderPool:
+    """Renders PDFs in separate processes so WeasyPrint layout never blocks
+    the GUI thread. Each worker keeps its own warm PdfGenerator."""
+
+    def __init__(self, css_path: str, max_workers: int = 2, template_path: str = None,
+                 pdf_options: Dict[str, Any] = None, header_max_width: int = 1200):
+        self._css_path = css_path
+        self._template_path = template_path
+        self._pdf_options = dict(pdf_options or {})
+        self._header_max_width = header_max_width
+        self._max_workers = max(1, max_workers)
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def submit(self, content: str, metadata: Dict[str, Any], output_path: str, doctor_name: str = None,
+               selected_title: str = None, header_image_path: str = None) -> Future:
+        return self._get_executor().submit(
+            _render_in_worker, content, dict(metadata), output_path, doctor_name, selected_title, header_image_path
+        )
+
+    def warm_up(self, header_image_path: str = None):
+        executor = self._get_executor()
+        for _ in range(self._max_workers):
+            executor.submit(_warm_up_worker, header_image_path)
+
+    def configure(self, pdf_options: Dict[str, Any]):
+        # Optiunile sunt fixate in initializer; procesele se recreeaza la urmatorul submit
+        self._pdf_options = dict(pdf_options)
+        self.shutdown()
+
+    def shutdown(self, wait: bool = False):
+        if self._executor:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # "spawn" pe toate platformele: fork-ul unui proces Qt nu este sigur
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self._css_path, self._template_path, self._pdf_options, self._header_max_width)
+            )
+        return self._executor
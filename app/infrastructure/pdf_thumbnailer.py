@@ -0,0 +1,54 @@
+import os
+import threading
+from typing import Optional
+
+
+class PdfThumbnailer:
+    """Low-resolution PNG of a PDF's first page, cached by the PDF's SHA-256.
+
+    Rasterizes with QtPdf (WeasyPrint no longer renders PNG), so it must run
+    in the GUI process, where a QGuiApplication exists. Lookups take the hash
+    the report archive already keeps, so reading a thumbnail never re-reads the PDF.
+    """
+
+    def __init__(self, cache_dir: str, width: int = 240):
+        self._cache_dir = cache_dir
+        self._width = width
+        self._lock = threading.Lock()  # pdfium nu este thread-safe
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def thumbnail_path(self, content_hash: str) -> str:
+        return os.path.join(self._cache_dir, f"{content_hash}.png")
+
+    def get_thumbnail(self, content_hash: str) -> Optional[str]:
+        thumbnail_path = self.thumbnail_path(content_hash)
+        return thumbnail_path if os.path.exists(thumbnail_path) else None
+
+    def create_thumbnail(self, pdf_path: str, content_hash: str) -> Optional[str]:
+        thumbnail_path = self.thumbnail_path(content_hash)
+        if os.path.exists(thumbnail_path):
+            return thumbnail_path
+
+        from PyQt6.QtCore import QSize
+        from PyQt6.QtPdf import QPdfDocument
+
+        with self._lock:
+            document = QPdfDocument()
+            try:
+                if document.load(pdf_path) != QPdfDocument.Error.None_ or document.pageCount() == 0:
+                    print(f"Warning: Could not load {pdf_path} for thumbnail")
+                    return None
+
+                page_size = document.pagePointSize(0)
+                height = int(self._width * page_size.height() / page_size.width()) if page_size.width() else self._width
+                image = document.render(0, QSize(self._width, height))
+            finally:
+                document.close()
+
+        # Scriere atomica: un thumbnail partial nu trebuie sa ajunga in cache
+        temp_path = f"{thumbnail_path}.tmp"
+        if not image.save(temp_path, "PNG"):
+            print(f"Warning: Could not save thumbnail for {pdf_path}")
+            return None
+        os.replace(temp_path, thumbnail_path)
+        return thumbnail_path
@@ -0,0 +1,144 @@
+import json
+import os
+import shutil
+import threading
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+from app.utils.file_hash import file_sha256
+
+
+class ReportArchive:
+    """Content-addressed store for generated reports.
+
+    Each distinct PDF is kept once under objects/<aa>/<sha256>.pdf; the
+    human-readable names under names/ are hard links (or symlinks, or copies
+    as a last resort) to those objects. An append-only index.jsonl records
+    study UID, author, title and hash; it is loaded into dicts at startup so
+    lookups by study or hash are O(1).
+    """
+
+    INDEX_FILE = "index.jsonl"
+
+    def __init__(self, root_dir: str):
+        self._root_dir = root_dir
+        self._objects_dir = os.path.join(root_dir, "objects")
+        self._names_dir = os.path.join(root_dir, "names")
+        self._index_path = os.path.join(root_dir, self.INDEX_FILE)
+        self._lock = threading.Lock()
+
+        self._latest_by_study: Dict[str, Dict[str, Any]] = {}
+        self._reports_by_study: Dict[str, List[Dict[str, Any]]] = {}
+        self._entry_by_hash: Dict[str, Dict[str, Any]] = {}
+
+        os.makedirs(self._objects_dir, exist_ok=True)
+        os.makedirs(self._names_dir, exist_ok=True)
+        self._load_index()
+
+    def store(self, pdf_path: str, study_uid: str, author: str = None, title: str = None,
+              content_hash: str = None) -> Dict[str, Any]:
+        content_hash = content_hash or file_sha256(pdf_path)
+
+        with self._lock:
+            object_path = self._object_path(content_hash)
+            if not os.path.exists(object_path):
+                # Copie, nu link: un export ulterior peste acelasi fisier ar modifica si obiectul
+                os.makedirs(os.path.dirname(object_path), exist_ok=True)
+                temp_path = f"{object_path}.tmp"
+                shutil.copyfile(pdf_path, temp_path)
+                os.replace(temp_path, object_path)
+
+            name_path = self._name_path(os.path.basename(pdf_path), content_hash)
+            if not os.path.exists(name_path):
+                self._link_or_copy(object_path, name_path)
+
+            latest = self._latest_by_study.get(study_uid)
+            if latest and latest["hash"] == content_hash:
+                # Re-export identic: nimic nou de indexat
+                return latest
+
+            entry = {
+                "hash": content_hash,
+                "study_uid": study_uid,
+                "author": author or "",
+                "title": title or "",
+                "name": os.path.relpath(name_path, self._root_dir),
+                "created_at": datetime.now().isoformat()
+            }
+            with open(self._index_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+            self._add_entry(entry)
+            return entry
+
+    def latest_for_study(self, study_uid: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._latest_by_study.get(study_uid)
+
+    def reports_for_study(self, study_uid: str) -> List[Dict[str, Any]]:
+        with self._lock:
+            return list(self._reports_by_study.get(study_uid, []))
+
+    def find_by_hash(self, content_hash: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._entry_by_hash.get(content_hash)
+
+    def object_path(self, content_hash: str) -> Optional[str]:
+        path = self._object_path(content_hash)
+        return path if os.path.exists(path) else None
+
+    def _object_path(self, content_hash: str) -> str:
+        return os.path.join(self._objects_dir, content_hash[:2], f"{content_hash}.pdf")
+
+    def _name_path(self, filename: str, content_hash: str) -> str:
+        name_path = os.path.join(self._names_dir, filename)
+        if not os.path.exists(name_path) or self._same_content(name_path, content_hash):
+            return name_path
+
+        # Acelasi nume, continut diferit: adaugam un sufix din hash
+        base, ext = os.path.splitext(filename)
+        return os.path.join(self._names_dir, f"{base}_{content_hash[:8]}{ext}")
+
+    def _same_content(self, path: str, content_hash: str) -> bool:
+        try:
+            return os.path.samefile(path, self._object_path(content_hash))
+        except OSError:
+            return False
+
+    def _link_or_copy(self, source: str, target: str):
+        try:
+            os.link(source, target)
+            return
+        except OSError:
+            pass
+
+        try:
+            os.symlink(os.path.abspath(source), target)
+            return
+        except OSError:
+            pass
+
+        shutil.copy2(source, target)
+
+    def _add_entry(self, entry: Dict[str, Any]):
+        study_uid = entry["study_uid"]
+        self._latest_by_study[study_uid] = entry
+        self._reports_by_study.setdefault(study_uid, []).append(entry)
+        self._entry_by_hash.setdefault(entry["hash"], entry)
+
+    def _load_index(self):
+        if not os.path.exists(self._index_path):
+            return
+
+        try:
+            with open(self._index_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        self._add_entry(json.loads(line))
+                    except (ValueError, KeyError) as e:
+                        print(f"Warning: Skipping corrupt report index line: {e}")
+        except OSError as e:
+            print(f"Error loading report archive index: {e}")
@@ -0,0 +1,47 @@
+import re
+from typing import Dict, Any, List, Tuple
+
+
+class ReportTemplate:
+    """Minimal Jinja-like template: {{ field }} placeholders and {# comments #}.
+
+    The source is split once into static fragments and field slots, so a
+    render is a single join over pre-built strings. Values are inserted as-is
+    (the report fields are already HTML).
+    """
+
+    _COMMENT = re.compile(r"\{#.*?#\}\n?", re.DOTALL)
+    _PLACEHOLDER = re.compile(r"\{\{\s*([A-Za-z_][A-Za-z0-9_]*)\s*\}\}")
+
+    def __init__(self, source: str):
+        self._parts, self._slots = self._compile(self._COMMENT.sub("", source))
+
+    @classmethod
+    def from_file(cls, path: str) -> "ReportTemplate":
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(f.read())
+
+    @property
+    def fields(self) -> List[str]:
+        return sorted(set(name for _, name in self._slots))
+
+    def render(self, values: Dict[str, Any]) -> str:
+        parts = self._parts.copy()
+        for index, name in self._slots:
+            value = values.get(name)
+            parts[index] = "" if value is None else str(value)
+        return "".join(parts)
+
+    def _compile(self, source: str) -> Tuple[List[str], List[Tuple[int, str]]]:
+        parts = []
+        slots = []
+        position = 0
+
+        for match in self._PLACEHOLDER.finditer(source):
+            parts.append(source[position:match.start()])
+            slots.append((len(parts), match.group(1)))
+            parts.append("")
+            position = match.end()
+
+        parts.append(source[position:])
+        return parts, slots
@@ -1,3 +1,4 @@
+import multiprocessing
 import sys
 import os
 
@@ -17,6 +18,14 @@ def setup_application():
 
     print("Application directories created successfully")
 
+    if getattr(settings, 'DB_AUTO_MIGRATE', False):
+        try:
+            applied = Container.get_migration_runner().upgrade()
+            if applied:
+                print(f"Database migrations applied: {applied}")
+        except Exception as e:
+            print(f"Warning: Could not apply database migrations: {e}")
+
 
 def log_session_info():
     try:
@@ -55,6 +64,8 @@ def main():
 
         print("Application started successfully")
 
+        app.aboutToQuit.connect(Container.shutdown)
+
         sys.exit(app.exec())
 
     except Exception as e:
@@ -65,4 +76,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Necesar pentru pool-ul de randare PDF in executabilul PyInstaller
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
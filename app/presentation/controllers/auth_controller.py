@@ -1,3 +1,5 @@
+from PyQt6.QtCore import QObject, pyqtSignal
+
 from app.core.interfaces.auth_interface import IAuthService
 from app.core.interfaces.session_interface import ISessionService
 from app.services.notification_service import NotificationService
@@ -22,10 +24,21 @@ class AuthController:
             self._notification_service.show_error(parent_widget, "Eroare", f"Eroare la logare: {e}")
             return False
 
+    def authenticate(self, username: str, password: str):
+        # Ruleaza pe thread-ul LoginWorker: cautarea in baza de date si bcrypt nu blocheaza fereastra
+        return self._auth_service.authenticate(username, password)
+
+    def complete_login(self, user):
+        self._session_service.login(user)
+
     def logout(self, parent_widget) -> bool:
         if self._notification_service.ask_confirmation(
                 parent_widget, "Confirm Logout", "Esti sigur ca vrei sa te deloghezi?"
         ):
+            # Urmatoarea logare a aceluiasi utilizator trece din nou prin bcrypt
+            user = self._session_service.get_current_user()
+            if user:
+                self._auth_service.clear_verification_cache(user.username)
             self._session_service.logout()
             return True
         return False
@@ -34,4 +47,26 @@ class AuthController:
         return self._session_service.get_current_user()
 
     def is_authenticated(self) -> bool:
-        return self._session_service.is_authenticated()
\ No newline at end of file
+        return self._session_service.is_authenticated()
+
+
+class LoginWorker(QObject):
+    login_succeeded = pyqtSignal(object)
+    login_failed = pyqtSignal(str, str)  # titlu, mesaj
+
+    def __init__(self, auth_controller: AuthController, username: str, password: str):
+        super().__init__()
+        self._auth_controller = auth_controller
+        self._username = username
+        self._password = password
+
+    def run(self):
+        try:
+            user = self._auth_controller.authenticate(self._username, self._password)
+            self.login_succeeded.emit(user)
+        except AuthenticationError as e:
+            self.login_failed.emit("Logarea a esuat", str(e))
+        except Exception as e:
+            self.login_failed.emit("Eroare", f"Eroare la logare: {e}")
+        finally:
+            self._password = None
@@ -1,6 +1,7 @@
 import re
 import os
-from typing import List, Dict, Any, Optional
+from concurrent.futures import Future, as_completed
+from typing import List, Dict, Any, Optional, Callable, Tuple
 from datetime import datetime
 from PyQt6.QtCore import pyqtSignal, QObject
 
@@ -10,15 +11,20 @@ from app.services.notification_service import NotificationService
 from app.core.exceptions.pacs_exceptions import PacsConnectionError, PacsDataError
 from app.core.exceptions.pdf_exceptions import PdfGenerationError
 from app.config.settings import Settings
+from app.utils.formatters import Formatters
+from app.services.study_history_service import StudyHistoryService
 
 
 class HybridPacsController:
-    def __init__(self, hybrid_pacs_service: IPacsService, pdf_service: IPdfService):
+    def __init__(self, hybrid_pacs_service: IPacsService, pdf_service: IPdfService,
+                 study_history_service: Optional[StudyHistoryService] = None):
         self._pacs_service = hybrid_pacs_service
         self._pdf_service = pdf_service
+        self._study_history_service = study_history_service
         self._notification_service = NotificationService()
         self._settings = Settings()
         self._last_generated_pdf_path: Optional[str] = None
+        self._render_watchers = set()
 
     def load_studies(self) -> List[str]:
         try:
@@ -40,7 +46,7 @@ class HybridPacsController:
 
     def export_pdf(self, study_id: str, result_text: str, parent_widget, current_user,
                selected_title: str = None, header_image_path: str = None, 
-               custom_path: str = None) -> bool:
+               custom_path: str = None, on_completed: Callable[[str], None] = None) -> bool:
         try:
             metadata = self.get_study_metadata(study_id)
 
@@ -62,15 +68,26 @@ class HybridPacsController:
             settings = Settings()
             header_image_path = settings.HEADER_IMAGE_PATH if os.path.exists(settings.HEADER_IMAGE_PATH) else None
 
-            # Trimite calea completă la pdf_service
-            self._pdf_service.generate_pdf(result_text, metadata, pdf_path, doctor_name, selected_title, header_image_path)
-            self._last_generated_pdf_path = pdf_path
+            # Randarea ruleaza in pool-ul de procese; rezultatul vine prin semnal pe thread-ul GUI
+            future = self._pdf_service.generate_pdf_async(
+                result_text, metadata, pdf_path, doctor_name, selected_title, header_image_path
+            )
 
-            # Save examination result to study
-            self._save_examination_result_to_study(study_id, result_text)
+            def handle_completed(path: str):
+                self._last_generated_pdf_path = path
+
+                # Save examination result to study
+                self._save_examination_result_to_study(study_id, result_text)
+                self._record_report(study_id, metadata, path, doctor_name, selected_title)
+
+                self._notification_service.show_info(parent_widget, "Succes", f"Fisier PDF salvat: {os.path.basename(path)}")
+                if on_completed:
+                    on_completed(path)
 
-            filename = os.path.basename(pdf_path)
-            self._notification_service.show_info(parent_widget, "Succes", f"Fisier PDF salvat: {filename}")
+            def handle_failed(message: str):
+                self._notification_service.show_error(parent_widget, "Eroare", f"Nu am putut genera fisierul PDF: {message}")
+
+            self._watch_render(future, handle_completed, handle_failed)
             return True
 
         except (PacsDataError, PdfGenerationError) as e:
@@ -87,21 +104,166 @@ class HybridPacsController:
             metadata = self.get_study_metadata(study_id)
             doctor_name = current_user.get_full_name_with_title() if current_user else None
 
-            preview_path = self._pdf_service.preview_pdf(result_text, metadata, doctor_name, selected_title, header_image_path)
+            future = self._pdf_service.preview_pdf_async(result_text, metadata, doctor_name, selected_title, header_image_path)
 
-            import sys
-            import subprocess
-            if sys.platform.startswith("linux"):
-                subprocess.run(["xdg-open", preview_path])
-            elif sys.platform == "win32":
-                os.startfile(preview_path)
+            def handle_failed(message: str):
+                self._notification_service.show_error(
+                    parent_widget, "Eroare", f"Nu am putut genera fisierul PDF pentru previzualizare: {message}"
+                )
 
+            self._watch_render(future, self._open_pdf_viewer, handle_failed)
             return True
 
         except (PacsDataError, PdfGenerationError) as e:
             self._notification_service.show_error(parent_widget, "Eroare", str(e))
             return False
 
+    def render_live_preview(self, metadata: Dict[str, Any], result_text: str, current_user,
+                            selected_title: str = None, header_image_path: str = None,
+                            on_ready: Callable[[str], None] = None, on_failed: Callable[[str], None] = None):
+        # Metadatele vin din view (studiul selectat), fara request la PACS la fiecare modificare
+        doctor_name = current_user.get_full_name_with_title() if current_user else None
+        future = self._pdf_service.preview_pdf_async(result_text, metadata, doctor_name, selected_title, header_image_path)
+        self._watch_render(future, on_ready or (lambda path: None), on_failed or (lambda message: None))
+
+    def get_report_history(self, metadata: Dict[str, Any]) -> List[Dict[str, Any]]:
+        study_uid = (metadata or {}).get("Study Instance UID")
+        if not study_uid or study_uid == "N/A" or not hasattr(self._pdf_service, 'get_report_history'):
+            return []
+        try:
+            return self._pdf_service.get_report_history(study_uid)
+        except Exception as e:
+            print(f"Warning: Could not load report history: {e}")
+            return []
+
+    def open_report(self, pdf_path: str):
+        self._open_pdf_viewer(pdf_path)
+
+    def add_report_listener(self, listener):
+        if hasattr(self._pdf_service, 'add_report_listener'):
+            self._pdf_service.add_report_listener(listener)
+
+    def remove_report_listener(self, listener):
+        if hasattr(self._pdf_service, 'remove_report_listener'):
+            self._pdf_service.remove_report_listener(listener)
+
+    def _open_pdf_viewer(self, pdf_path: str):
+        import sys
+        import subprocess
+        if sys.platform.startswith("linux"):
+            subprocess.Popen(["xdg-open", pdf_path])
+        elif sys.platform == "win32":
+            os.startfile(pdf_path)
+
+    def _watch_render(self, future: Future, on_completed: Callable[[str], None], on_failed: Callable[[str], None]):
+        watcher = PdfRenderWatcher(future)
+        self._render_watchers.add(watcher)
+
+        def release():
+            self._render_watchers.discard(watcher)
+
+        watcher.render_completed.connect(on_completed)
+        watcher.render_failed.connect(on_failed)
+        watcher.render_completed.connect(release)
+        watcher.render_failed.connect(release)
+        watcher.start()
+
+    def export_pdfs(self, studies: List, output_dir: str, current_user, selected_title: str = None,
+                    progress_callback: Callable[[int, str], None] = None) -> Dict[str, List[Tuple[str, str]]]:
+        # studies: QueuedStudy din queue sau simple study ID-uri
+        report = {"exported": [], "failed": []}
+        if not studies:
+            return report
+
+        os.makedirs(output_dir, exist_ok=True)
+
+        results = {}
+        missing_results = []
+        for study in studies:
+            if isinstance(study, str):
+                results[study] = ""
+                missing_results.append(study)
+            else:
+                results[study.study_id] = study.examination_result
+
+        if missing_results:
+            if progress_callback:
+                progress_callback(0, "Se încarcă rezultatele...")
+            results.update(self._get_examination_results(missing_results))
+
+        if progress_callback:
+            progress_callback(0, "Se încarcă metadatele...")
+
+        if hasattr(self._pacs_service, 'get_studies_metadata'):
+            metadata_by_id, errors = self._pacs_service.get_studies_metadata(list(results.keys()))
+        else:
+            metadata_by_id, errors = {}, {}
+            for study_id in results:
+                try:
+                    metadata_by_id[study_id] = self.get_study_metadata(study_id)
+                except Exception as e:
+                    errors[study_id] = str(e)
+
+        for study_id, error in errors.items():
+            report["failed"].append((study_id, error))
+
+        doctor_name = current_user.get_full_name_with_title() if current_user else None
+        settings = Settings()
+        header_image_path = settings.HEADER_IMAGE_PATH if os.path.exists(settings.HEADER_IMAGE_PATH) else None
+        timestamp = datetime.now().strftime("%H%M%S")
+
+        futures = {}
+        used_paths = set()
+        for study_id, metadata in metadata_by_id.items():
+            label = f"{metadata.get('Patient Name', study_id)} ({metadata.get('Study Date', 'N/A')})"
+            result_text = results.get(study_id, "")
+            if not result_text or not result_text.strip():
+                report["failed"].append((label, "Rezultatul explorării este gol"))
+                continue
+
+            pdf_path = self._unique_pdf_path(output_dir, Formatters.format_filename(
+                metadata.get("Patient Name", study_id), metadata.get("Study Date", ""), timestamp
+            ), used_paths)
+
+            future = self._pdf_service.generate_pdf_async(
+                result_text, metadata, pdf_path, doctor_name, selected_title, header_image_path
+            )
+            futures[future] = (study_id, label)
+
+        # PDF-urile se randeaza in paralel in pool; raportam progresul pe masura ce se termina
+        total = len(futures)
+        for i, future in enumerate(as_completed(futures)):
+            study_id, label = futures[future]
+            try:
+                pdf_path = future.result()
+                report["exported"].append((label, pdf_path))
+                self._record_report(study_id, metadata_by_id[study_id], pdf_path, doctor_name, selected_title)
+            except Exception as e:
+                report["failed"].append((label, str(e)))
+
+            if progress_callback:
+                progress_callback(int((i + 1) / total * 100), label)
+
+        return report
+
+    def _get_examination_results(self, study_ids: List[str]) -> Dict[str, str]:
+        if hasattr(self._pacs_service, 'get_examination_results'):
+            try:
+                return self._pacs_service.get_examination_results(study_ids)
+            except Exception as e:
+                print(f"Warning: Could not load examination results in batch: {e}")
+        return {study_id: self.get_examination_result_from_study(study_id) for study_id in study_ids}
+
+    def _unique_pdf_path(self, output_dir: str, filename: str, used_paths: set) -> str:
+        base, ext = os.path.splitext(filename)
+        pdf_path = os.path.join(output_dir, filename)
+        counter = 1
+        while pdf_path in used_paths or os.path.exists(pdf_path):
+            pdf_path = os.path.join(output_dir, f"{base}_{counter}{ext}")
+            counter += 1
+        used_paths.add(pdf_path)
+        return pdf_path
+
     def add_study_to_queue(self, study_id: str, examination_result: str, parent_widget) -> bool:
         try:
             if not study_id:
@@ -159,6 +321,10 @@ class HybridPacsController:
                 confirm_message += f"• {local_studies_count} studii locale (din computer)\n"
             if pacs_studies_count > 0:
                 confirm_message += f"• {pacs_studies_count} studii PACS (remote)\n"
+            already_sent = self._get_sent_study_ids_for_confirmation(
+                [qs.study_id for qs in queued_studies], target_url)
+            if already_sent:
+                confirm_message += f"• {len(already_sent)} studii au fost deja trimise la acest PACS\n"
             confirm_message += f"\nTarget PACS: {target_url}\n"
             confirm_message += "Toate rezultatele vor fi incluse în metadata DICOM."
 
@@ -246,12 +412,43 @@ class HybridPacsController:
             else:
                 print(f"Failed to send {study_type} study {study_id}")
 
+            self._record_transfer(study_id, target_url, success, with_result=bool(examination_result))
             return success
 
         except Exception as e:
             print(f"Error sending study {study_id}: {e}")
+            self._record_transfer(study_id, target_url, False, str(e), bool(examination_result))
             return False
 
+    def get_sent_study_ids(self, study_ids: List[str], target_url: str = None) -> set:
+        if not self._study_history_service:
+            return set()
+        try:
+            return self._study_history_service.get_sent_study_ids(study_ids, target_url)
+        except Exception as e:
+            print(f"Warning: Could not check transfer history: {e}")
+            return set()
+
+    def _get_sent_study_ids_for_confirmation(self, study_ids: List[str], target_url: str) -> set:
+        # Ruleaza pe thread-ul GUI: o baza de date lenta nu trebuie sa blocheze dialogul
+        if not self._study_history_service:
+            return set()
+        try:
+            return self._study_history_service.get_sent_study_ids_quick(study_ids, target_url)
+        except Exception as e:
+            print(f"Warning: Skipping already-sent check: {e or type(e).__name__}")
+            return set()
+
+    def _record_report(self, study_id: str, metadata: Dict[str, Any], pdf_path: str, author: str = None,
+                       title_text: str = None):
+        if self._study_history_service:
+            self._study_history_service.record_report(study_id, metadata, pdf_path, author, title_text)
+
+    def _record_transfer(self, study_id: str, target_url: str, success: bool, error_message: str = None,
+                         with_result: bool = False):
+        if self._study_history_service:
+            self._study_history_service.record_transfer(study_id, target_url, success, error_message, with_result)
+
     def get_examination_result_from_study(self, study_id: str) -> str:
         try:
             if hasattr(self._pacs_service, 'get_examination_result_from_study'):
@@ -297,6 +494,23 @@ class HybridPacsController:
             )
             return False, None
 
+    def mark_study_used(self, study_id: str):
+        if hasattr(self._pacs_service, 'mark_study_used'):
+            self._pacs_service.mark_study_used(study_id)
+
+    def set_pinned_studies(self, study_ids: List[str]):
+        # Studiile locale din queue sunt protejate de evacuarea automata
+        if hasattr(self._pacs_service, 'set_pinned_studies'):
+            self._pacs_service.set_pinned_studies(study_ids)
+
+    def add_local_studies_listener(self, listener):
+        if hasattr(self._pacs_service, 'add_local_studies_listener'):
+            self._pacs_service.add_local_studies_listener(listener)
+
+    def remove_local_studies_listener(self, listener):
+        if hasattr(self._pacs_service, 'remove_local_studies_listener'):
+            self._pacs_service.remove_local_studies_listener(listener)
+
     def clear_local_studies(self, parent_widget) -> bool:
         try:
             if hasattr(self._pacs_service, 'get_local_studies_count'):
@@ -343,6 +557,25 @@ class HybridPacsController:
             print(f"Warning: Could not save examination result to study {study_id}: {e}")
 
 
+class PdfRenderWatcher(QObject):
+    render_completed = pyqtSignal(str)
+    render_failed = pyqtSignal(str)
+
+    def __init__(self, future: Future):
+        super().__init__()
+        self._future = future
+
+    def start(self):
+        # Callback-ul ruleaza pe thread-ul executorului; semnalele ajung pe thread-ul GUI (queued connection)
+        self._future.add_done_callback(self._on_done)
+
+    def _on_done(self, future: Future):
+        try:
+            self.render_completed.emit(future.result())
+        except Exception as e:
+            self.render_failed.emit(str(e))
+
+
 class StudiesWorker(QObject):
     studies_loaded = pyqtSignal(list)
     error_occurred = pyqtSignal(str)
@@ -430,4 +663,31 @@ class QueueSenderWorker(QObject):
                 self.sending_completed.emit(False, message)
 
         except Exception as e:
-            self.sending_completed.emit(False, f"Eroare critică: {str(e)}")
\ No newline at end of file
+            self.sending_completed.emit(False, f"Eroare critică: {str(e)}")
+
+
+class BulkPdfExportWorker(QObject):
+    progress_updated = pyqtSignal(int, str)
+    export_completed = pyqtSignal(dict)
+    error_occurred = pyqtSignal(str)
+
+    def __init__(self, pacs_controller, studies: List, output_dir: str, current_user, selected_title: str = None):
+        super().__init__()
+        self._pacs_controller = pacs_controller
+        self._studies = studies
+        self._output_dir = output_dir
+        self._current_user = current_user
+        self._selected_title = selected_title
+
+    def run(self):
+        try:
+            report = self._pacs_controller.export_pdfs(
+                self._studies,
+                self._output_dir,
+                self._current_user,
+                self._selected_title,
+                progress_callback=self.progress_updated.emit
+            )
+            self.export_completed.emit(report)
+        except Exception as e:
+            self.error_occurred.emit(str(e))
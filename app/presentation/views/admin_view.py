@@ -9,6 +9,7 @@ from app.presentation.views.base_view import CenteredView
 from app.presentation.widgets.report_title_management_widget import ReportTitleManagementWidget
 from app.presentation.widgets.user_management_widget import UserManagementWidget
 from app.presentation.widgets.pacs_management_widget import PacsManagementWidget
+from app.presentation.widgets.health_status_widget import HealthStatusWidget
 from app.services.notification_service import NotificationService
 from app.presentation.styles.style_manager import load_style
 
@@ -48,6 +49,7 @@ class AdminView(CenteredView):
 
         header_layout.addWidget(title_label)
         header_layout.addStretch()
+        header_layout.addWidget(HealthStatusWidget.create(self))
         header_layout.addWidget(user_info_label)
         header_layout.addWidget(self.logout_button)
 
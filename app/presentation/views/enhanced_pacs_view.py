@@ -7,20 +7,28 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QHBoxLayout, QPushButton, QProgressBar,
     QScrollArea, QSizePolicy, QSplitter, QTabWidget, QFrame, QApplication, QFileDialog
 )
-from PyQt6.QtCore import QThread, Qt
+from PyQt6.QtCore import QThread, Qt, QTimer, pyqtSignal
 from PyQt6.QtGui import QKeySequence, QShortcut
 
 from app.presentation.controllers.auth_controller import AuthController
-from app.presentation.controllers.hybrid_pacs_controller import HybridPacsController, StudiesWorker, QueueSenderWorker
+from app.presentation.controllers.hybrid_pacs_controller import (
+    HybridPacsController, StudiesWorker, QueueSenderWorker, BulkPdfExportWorker
+)
 from app.presentation.widgets.study_list_widget import SearchableStudyListWidget, StudyQueueWidget
 from app.presentation.widgets.metadata_widget import MetadataWidget, ResultWidget
-from app.presentation.widgets.local_file_widgets import LocalFileManagerWidget, LocalFileDropWidget
+from app.presentation.widgets.local_file_widgets import LocalFileManagerWidget, LocalFileDropWidget, DicomScanWorker
+from app.presentation.widgets.pdf_preview_widget import PdfPreviewWidget
+from app.presentation.widgets.report_history_widget import ReportHistoryWidget
 from app.services.notification_service import NotificationService
 from app.presentation.styles.style_manager import load_style
 from app.config.settings import Settings
 
 
 class EnhancedPacsView(QWidget):
+    # Evacuarea ruleaza pe thread-ul ei; semnalul aduce notificarea pe thread-ul GUI
+    local_studies_evicted = pyqtSignal(list)
+    report_archived = pyqtSignal(str)  # study UID
+
     def __init__(self, pacs_controller: HybridPacsController, auth_controller: AuthController):
         super().__init__()
         self._pacs_controller = pacs_controller
@@ -28,6 +36,20 @@ class EnhancedPacsView(QWidget):
         self._notification_service = NotificationService()
         self._settings = Settings()
         self.last_generated_pdf_path = None
+
+        # Previzualizare live: re-randare debounced doar cand se schimba datele de intrare
+        self._current_metadata = None
+        self._live_preview_inputs = None
+        self._live_preview_request = 0
+        self._live_preview_timer = QTimer()
+        self._live_preview_timer.setSingleShot(True)
+        self._live_preview_timer.setInterval(800)
+        self._live_preview_timer.timeout.connect(self._render_live_preview)
+
+        self._local_studies_listener = self.local_studies_evicted.emit
+        self.local_studies_evicted.connect(self._on_local_studies_evicted)
+        self._report_listener = self.report_archived.emit
+        self.report_archived.connect(self._on_report_archived)
         self.setWindowTitle("Enhanced PACS Viewer")
         self.setGeometry(100, 100, 1800, 900)
         self._setup_ui()
@@ -124,6 +146,14 @@ class EnhancedPacsView(QWidget):
         self.metadata_widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
         metadata_layout.addWidget(self.metadata_widget)
 
+        reports_label = QLabel("Previous Reports")
+        reports_label.setObjectName("SectionTitle")
+        metadata_layout.addWidget(reports_label)
+
+        self.report_history_widget = ReportHistoryWidget()
+        self.report_history_widget.report_open_requested.connect(self._pacs_controller.open_report)
+        metadata_layout.addWidget(self.report_history_widget)
+
         # Right side - Queue
         queue_widget = QWidget()
         queue_layout = QVBoxLayout(queue_widget)
@@ -133,6 +163,7 @@ class EnhancedPacsView(QWidget):
         queue_layout.addWidget(queue_label)
 
         self.queue_widget = StudyQueueWidget()
+        self.queue_widget.queue_changed.connect(self._on_queue_changed)
         self.queue_widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
         queue_layout.addWidget(self.queue_widget)
 
@@ -147,8 +178,13 @@ class EnhancedPacsView(QWidget):
         self.send_queue_button.setObjectName("SendPACSButton")
         self.send_queue_button.clicked.connect(self._send_queue_to_pacs)
 
+        self.export_queue_pdfs_button = QPushButton("Export PDFs")
+        self.export_queue_pdfs_button.setObjectName("GeneratePDFButton")
+        self.export_queue_pdfs_button.clicked.connect(self._export_queue_pdfs)
+
         queue_buttons_layout.addWidget(self.add_to_queue_button)
         queue_buttons_layout.addWidget(self.send_queue_button)
+        queue_buttons_layout.addWidget(self.export_queue_pdfs_button)
         queue_buttons_layout.addStretch()
 
         queue_layout.addLayout(queue_buttons_layout)
@@ -164,10 +200,21 @@ class EnhancedPacsView(QWidget):
         results_label.setObjectName("SectionTitle")
         scroll_layout.addWidget(results_label)
 
+        result_splitter = QSplitter(Qt.Orientation.Horizontal)
+
         self.result_widget = ResultWidget()
         self.result_widget.setMinimumHeight(400)
         self.result_widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
-        scroll_layout.addWidget(self.result_widget)
+        self.result_widget.text_edit.textChanged.connect(self._schedule_live_preview)
+        self.result_widget.title_combo.currentTextChanged.connect(self._schedule_live_preview)
+
+        self.pdf_preview_widget = PdfPreviewWidget()
+        self.pdf_preview_widget.setMinimumHeight(400)
+
+        result_splitter.addWidget(self.result_widget)
+        result_splitter.addWidget(self.pdf_preview_widget)
+        result_splitter.setSizes([500, 400])
+        scroll_layout.addWidget(result_splitter)
 
         # PDF action buttons
         pdf_buttons_layout = QHBoxLayout()
@@ -313,8 +360,11 @@ class EnhancedPacsView(QWidget):
 
     def _on_study_selected(self, study_id: str):
         try:
+            self._pacs_controller.mark_study_used(study_id)
             metadata = self._pacs_controller.get_study_metadata(study_id)
+            self._current_metadata = metadata
             self.metadata_widget.display_metadata(metadata)
+            self._refresh_report_history()
 
             self.result_widget.update_from_metadata(metadata)
 
@@ -325,41 +375,105 @@ class EnhancedPacsView(QWidget):
             else:
                 self.result_widget.clear_result()
 
+            self._schedule_live_preview()
+
         except Exception as e:
+            self._current_metadata = None
+            self.pdf_preview_widget.clear_preview()
+            self.report_history_widget.clear_reports()
             self._notification_service.show_error(self, "Error", f"Error loading study data:\n{e}")
 
+    def _refresh_report_history(self):
+        self.report_history_widget.set_reports(self._pacs_controller.get_report_history(self._current_metadata))
+
+    def _on_report_archived(self, study_uid: str):
+        # Raportul (sau thumbnail-ul lui) e gata; reafisam doar daca e studiul selectat
+        if self._current_metadata and self._current_metadata.get("Study Instance UID") == study_uid:
+            self._refresh_report_history()
+
+    def _on_queue_changed(self, study_ids: list):
+        self._pacs_controller.set_pinned_studies(study_ids)
+
     def _on_local_studies_updated(self):
         self._load_studies()
 
+    def _on_local_studies_evicted(self, study_ids: list):
+        print(f"Local studies evicted: {len(study_ids)}")
+        if hasattr(self, 'local_file_manager'):
+            self.local_file_manager.refresh_studies()
+        self._load_studies()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._pacs_controller.add_local_studies_listener(self._local_studies_listener)
+        self._pacs_controller.add_report_listener(self._report_listener)
+        if hasattr(self, 'local_file_manager'):
+            # Studiile evacuate cat timp fereastra a fost ascunsa
+            self.local_file_manager.refresh_studies()
+
+    def hideEvent(self, event):
+        # Fereastra ascunsa (ex. dupa logout) nu mai primeste notificari
+        self._pacs_controller.remove_local_studies_listener(self._local_studies_listener)
+        self._pacs_controller.remove_report_listener(self._report_listener)
+        super().hideEvent(event)
+
     def _handle_dropped_files(self, file_paths: list):
         if hasattr(self._pacs_controller._pacs_service, '_local_file_service'):
             local_file_service = self._pacs_controller._pacs_service._local_file_service
 
-            # Filter DICOM files
-            dicom_files = []
-            for file_path in file_paths:
-                if local_file_service._is_dicom_file(file_path):
-                    dicom_files.append(file_path)
-
-            if dicom_files:
-                self._notification_service.show_info(
-                    self,
-                    "Files Dropped",
-                    f"Loading {len(dicom_files)} DICOM files..."
-                )
-
-                # Switch to local files tab to show progress
-                self.tab_widget.setCurrentIndex(1)
-
-                # Trigger loading through local file manager
-                if hasattr(self, 'local_file_manager'):
-                    self.local_file_manager._load_files_in_background(dicom_files)
-            else:
-                self._notification_service.show_warning(
-                    self,
-                    "No DICOM Files",
-                    "No valid DICOM files found in the dropped files."
-                )
+            # Filter DICOM files in background
+            self.progress_bar.setVisible(True)
+            self.progress_bar.setValue(0)
+            self.drop_widget.setEnabled(False)
+
+            self.scan_thread = QThread()
+            self.scan_worker = DicomScanWorker(local_file_service, file_paths)
+            self.scan_worker.moveToThread(self.scan_thread)
+
+            self.scan_thread.started.connect(self.scan_worker.run)
+            self.scan_worker.progress_updated.connect(self._update_scan_progress)
+            self.scan_worker.scan_completed.connect(self._on_dropped_files_scanned)
+            self.scan_worker.error_occurred.connect(self._on_dropped_files_scan_error)
+
+            self.scan_worker.scan_completed.connect(self.scan_thread.quit)
+            self.scan_worker.scan_completed.connect(self.scan_worker.deleteLater)
+            self.scan_worker.error_occurred.connect(self.scan_thread.quit)
+            self.scan_worker.error_occurred.connect(self.scan_worker.deleteLater)
+            self.scan_thread.finished.connect(self.scan_thread.deleteLater)
+
+            self.scan_thread.start()
+
+    def _update_scan_progress(self, progress: int, message: str):
+        self.progress_bar.setValue(progress)
+
+    def _on_dropped_files_scanned(self, dicom_files: list):
+        self.progress_bar.setVisible(False)
+        self.drop_widget.setEnabled(True)
+
+        if dicom_files:
+            self._notification_service.show_info(
+                self,
+                "Files Dropped",
+                f"Loading {len(dicom_files)} DICOM files..."
+            )
+
+            # Switch to local files tab to show progress
+            self.tab_widget.setCurrentIndex(1)
+
+            # Trigger loading through local file manager
+            if hasattr(self, 'local_file_manager'):
+                self.local_file_manager._load_files_in_background(dicom_files)
+        else:
+            self._notification_service.show_warning(
+                self,
+                "No DICOM Files",
+                "No valid DICOM files found in the dropped files."
+            )
+
+    def _on_dropped_files_scan_error(self, error_message: str):
+        self.progress_bar.setVisible(False)
+        self.drop_widget.setEnabled(True)
+        self._notification_service.show_error(self, "Error", error_message)
 
     def _export_pdf(self):
         study_id = self.study_list.get_selected_study_id()
@@ -417,14 +531,15 @@ class EnhancedPacsView(QWidget):
         settings = Settings()
         header_image_path = settings.HEADER_IMAGE_PATH
 
-        # Trimite calea completă specificată de utilizator
-        success = self._pacs_controller.export_pdf(
+        # Trimite calea completă specificată de utilizator; PDF-ul se genereaza in fundal
+        self._pacs_controller.export_pdf(
             study_id, result_text, self, current_user, selected_title, 
-            header_image_path, custom_path=file_path
+            header_image_path, custom_path=file_path,
+            on_completed=self._on_pdf_exported
         )
-        
-        if success:
-            self.last_generated_pdf_path = file_path
+
+    def _on_pdf_exported(self, file_path: str):
+        self.last_generated_pdf_path = file_path
 
     def _preview_pdf(self):
         study_id = self.study_list.get_selected_study_id()
@@ -440,6 +555,46 @@ class EnhancedPacsView(QWidget):
 
         self._pacs_controller.preview_pdf(study_id, result_text, self, current_user, selected_title, header_image_path)
 
+    def _schedule_live_preview(self):
+        self._live_preview_timer.start()
+
+    def _render_live_preview(self):
+        if not self._current_metadata:
+            return
+
+        result_text = self.result_widget.get_result_text()
+        if not result_text.strip():
+            self._live_preview_inputs = None
+            self.pdf_preview_widget.clear_preview()
+            return
+
+        selected_title = self.result_widget.get_selected_title()
+        inputs = (result_text, selected_title, id(self._current_metadata))
+        if inputs == self._live_preview_inputs:
+            return
+        self._live_preview_inputs = inputs
+
+        self._live_preview_request += 1
+        request = self._live_preview_request
+        self.pdf_preview_widget.set_status("⏳ Se actualizează previzualizarea...")
+
+        current_user = self._auth_controller.get_current_user() if self._auth_controller else None
+        self._pacs_controller.render_live_preview(
+            self._current_metadata, result_text, current_user, selected_title, self._settings.HEADER_IMAGE_PATH,
+            on_ready=lambda path: self._on_live_preview_ready(request, path),
+            on_failed=lambda message: self._on_live_preview_failed(request, message)
+        )
+
+    def _on_live_preview_ready(self, request: int, pdf_path: str):
+        # Ignora rezultatele depasite de o cerere mai noua
+        if request == self._live_preview_request:
+            self.pdf_preview_widget.show_pdf(pdf_path)
+
+    def _on_live_preview_failed(self, request: int, error_message: str):
+        if request == self._live_preview_request:
+            self._live_preview_inputs = None
+            self.pdf_preview_widget.set_status(f"Eroare la previzualizare: {error_message}")
+
     def _print_pdf(self):
         if not self.last_generated_pdf_path or not os.path.exists(self.last_generated_pdf_path):
             self._notification_service.show_warning(self, "Warning", "No PDF to print. Generate a PDF first.")
@@ -569,6 +724,93 @@ class EnhancedPacsView(QWidget):
         else:
             self._notification_service.show_error(self, "Eroare trimitere", message)
 
+    def _export_queue_pdfs(self):
+        queued_studies = self.queue_widget.get_queued_studies()
+
+        if not queued_studies:
+            self._notification_service.show_warning(self, "Queue gol", "Nu sunt studii în queue pentru export.")
+            return
+
+        if self._last_save_directory and os.path.exists(self._last_save_directory):
+            start_directory = self._last_save_directory
+        else:
+            start_directory = self._settings.PDF_OUTPUT_DIR
+            os.makedirs(start_directory, exist_ok=True)
+
+        output_dir = QFileDialog.getExistingDirectory(self, "Alege folderul pentru rapoartele PDF", start_directory)
+        if not output_dir:
+            return
+
+        self._last_save_directory = output_dir
+
+        current_user = self._auth_controller.get_current_user() if self._auth_controller else None
+        selected_title = self.result_widget.get_selected_title()
+
+        self.progress_bar.setVisible(True)
+        self.progress_bar.setValue(0)
+        self.export_queue_pdfs_button.setEnabled(False)
+        self.export_queue_pdfs_button.setText("⏳ Export...")
+
+        self.export_thread = QThread()
+        self.export_worker = BulkPdfExportWorker(
+            self._pacs_controller,
+            queued_studies,
+            output_dir,
+            current_user,
+            selected_title
+        )
+        self.export_worker.moveToThread(self.export_thread)
+
+        self.export_thread.started.connect(self.export_worker.run)
+        self.export_worker.progress_updated.connect(self._update_export_progress)
+        self.export_worker.export_completed.connect(self._on_queue_pdfs_exported)
+        self.export_worker.error_occurred.connect(self._on_queue_pdfs_export_error)
+
+        # Cleanup
+        self.export_worker.export_completed.connect(self.export_thread.quit)
+        self.export_worker.error_occurred.connect(self.export_thread.quit)
+        self.export_thread.finished.connect(self.export_worker.deleteLater)
+        self.export_thread.finished.connect(self.export_thread.deleteLater)
+
+        self.export_thread.start()
+
+    def _update_export_progress(self, progress: int, current_study: str):
+        self.progress_bar.setValue(progress)
+        if progress < 100:
+            self.export_queue_pdfs_button.setText(f"⏳ Export... {progress}%")
+
+    def _finish_queue_pdfs_export(self):
+        self.progress_bar.setVisible(False)
+        self.export_queue_pdfs_button.setEnabled(True)
+        self.export_queue_pdfs_button.setText("Export PDFs")
+
+    def _on_queue_pdfs_exported(self, report: dict):
+        self._finish_queue_pdfs_export()
+
+        exported = report.get("exported", [])
+        failed = report.get("failed", [])
+        total = len(exported) + len(failed)
+
+        if exported:
+            self.last_generated_pdf_path = exported[-1][1]
+
+        message = f"Exportate: {len(exported)}/{total} rapoarte PDF."
+        if failed:
+            message += "\n\nStudii cu erori:\n" + "\n".join(f"{label} - {error}" for label, error in failed[:5])
+            if len(failed) > 5:
+                message += f"\n... și încă {len(failed) - 5} studii"
+
+        if not failed:
+            self._notification_service.show_info(self, "Export finalizat", message)
+        elif exported:
+            self._notification_service.show_warning(self, "Export parțial", message)
+        else:
+            self._notification_service.show_error(self, "Eroare export", message)
+
+    def _on_queue_pdfs_export_error(self, error_message: str):
+        self._finish_queue_pdfs_export()
+        self._notification_service.show_error(self, "Eroare export", error_message)
+
     def refresh_all(self):
         self._load_studies()
         if hasattr(self, 'local_file_manager'):
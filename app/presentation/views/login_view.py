@@ -1,8 +1,8 @@
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QThread
 from PyQt6.QtWidgets import (
     QWidget, QFormLayout, QLineEdit, QPushButton, QVBoxLayout, QLabel, QHBoxLayout
 )
-from app.presentation.controllers.auth_controller import AuthController
+from app.presentation.controllers.auth_controller import AuthController, LoginWorker
 from app.core.entities.user import UserRole
 from app.presentation.styles.style_manager import load_style
 from app.presentation.views.base_view import CenteredView
@@ -103,9 +103,38 @@ class LoginView(CenteredView):
             )
             return
 
-        if self._auth_controller.login(username, password, self):
-            user = self._auth_controller.get_current_user()
-            self._open_main_window(user.role)
+        self._set_login_in_progress(True)
+
+        self.login_thread = QThread()
+        self.login_worker = LoginWorker(self._auth_controller, username, password)
+        self.login_worker.moveToThread(self.login_thread)
+
+        self.login_thread.started.connect(self.login_worker.run)
+        self.login_worker.login_succeeded.connect(self._on_login_succeeded)
+        self.login_worker.login_failed.connect(self._on_login_failed)
+
+        self.login_worker.login_succeeded.connect(self.login_thread.quit)
+        self.login_worker.login_succeeded.connect(self.login_worker.deleteLater)
+        self.login_worker.login_failed.connect(self.login_thread.quit)
+        self.login_worker.login_failed.connect(self.login_worker.deleteLater)
+        self.login_thread.finished.connect(self.login_thread.deleteLater)
+
+        self.login_thread.start()
+
+    def _on_login_succeeded(self, user):
+        self._auth_controller.complete_login(user)
+        self._open_main_window(user.role)
+
+    def _on_login_failed(self, title: str, message: str):
+        self._set_login_in_progress(False)
+        self._notification_service.show_error(self, title, message)
+        self.password_input.setFocus()
+
+    def _set_login_in_progress(self, in_progress: bool):
+        self.login_button.setEnabled(not in_progress)
+        self.login_button.setText("Se conectează..." if in_progress else "Conectează-te")
+        self.username_input.setEnabled(not in_progress)
+        self.password_input.setEnabled(not in_progress)
 
     def _open_main_window(self, role: UserRole):
         from app.di.container import Container
@@ -119,6 +148,7 @@ class LoginView(CenteredView):
                 Container.get_auth_controller(),
                 Container.get_pacs_controller()
             )
+            Container.start_pdf_warm_up()
         else:
             self._notification_service.show_warning(self, "Atentie", "Rol necunoscut.")
 
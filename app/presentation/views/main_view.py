@@ -6,6 +6,7 @@ from app.presentation.controllers.hybrid_pacs_controller import HybridPacsContro
 from app.presentation.views.base_view import CenteredView
 from app.presentation.views.enhanced_pacs_view import EnhancedPacsView
 from app.presentation.views.patients_view import PatientsView
+from app.presentation.widgets.health_status_widget import HealthStatusWidget
 from app.presentation.styles.style_manager import load_style
 
 
@@ -52,6 +53,7 @@ class MainView(CenteredView):
         nav_bar.addWidget(self.studies_button)
         nav_bar.addWidget(self.patients_button)
         nav_bar.addStretch()
+        nav_bar.addWidget(HealthStatusWidget.create(self))
         nav_bar.addWidget(self.user_label)
         nav_bar.addWidget(self.logout_button)
 
@@ -0,0 +1,78 @@
+from typing import Dict, Any
+
+from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtWidgets import QWidget, QHBoxLayout, QLabel
+
+
+class HealthStatusWidget(QWidget):
+    # Monitorul apeleaza listener-ul pe thread-ul lui; semnalul aduce statusul pe thread-ul GUI
+    status_changed = pyqtSignal(dict)
+
+    COLORS = {"up": "#16a34a", "down": "#dc2626", "unknown": "#9ca3af"}
+
+    def __init__(self, health_monitor, parent=None):
+        super().__init__(parent)
+        self.setObjectName("HealthStatusWidget")
+        self._health_monitor = health_monitor
+        self._labels: Dict[str, QLabel] = {}
+
+        self._layout = QHBoxLayout(self)
+        self._layout.setContentsMargins(0, 0, 0, 0)
+        self._layout.setSpacing(10)
+
+        self.status_changed.connect(self._update_status)
+        self._listener = self.status_changed.emit
+        self._listening = False
+
+        if health_monitor:
+            listener = self._listener
+            self.destroyed.connect(lambda: health_monitor.remove_listener(listener))
+            self._update_status(health_monitor.get_status())
+
+    @classmethod
+    def create(cls, parent=None) -> "HealthStatusWidget":
+        from app.di.container import Container
+        try:
+            health_monitor = Container.get_health_monitor()
+        except Exception as e:
+            print(f"Warning: Health monitor unavailable: {e}")
+            health_monitor = None
+        return cls(health_monitor, parent)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        # Ferestrele inchise la logout nu sunt sterse; ascultam doar cat timp widget-ul e vizibil
+        if self._health_monitor and not self._listening:
+            self._health_monitor.add_listener(self._listener)
+            self._listening = True
+            self._update_status(self._health_monitor.get_status())
+
+    def hideEvent(self, event):
+        self._stop_listening()
+        super().hideEvent(event)
+
+    def _stop_listening(self):
+        if self._listening:
+            self._health_monitor.remove_listener(self._listener)
+            self._listening = False
+
+    def _update_status(self, status: Dict[str, Dict[str, Any]]):
+        for name in list(self._labels):
+            if name not in status:
+                self._labels.pop(name).deleteLater()
+
+        for name, endpoint in status.items():
+            label = self._labels.get(name)
+            if label is None:
+                label = QLabel()
+                self._labels[name] = label
+                self._layout.addWidget(label)
+
+            color = self.COLORS.get(endpoint["state"], self.COLORS["unknown"])
+            label.setText(f"<span style='color: {color};'>●</span> {endpoint['label']}")
+
+            if endpoint["state"] == "up":
+                tooltip = f"{name}\nDisponibil ({endpoint['latency_ms']} ms)"
+            else:
+                tooltip = f"{name}\nIndisponibil: {endpoint['error']}"
+            label.setToolTip(f"{tooltip}\nVerificat la {endpoint['checked_at'].strftime('%H:%M:%S')}")
@@ -17,15 +17,19 @@ class LocalFileLoaderWorker(QObject):
     error_occurred = pyqtSignal(str)
     finished = pyqtSignal()
 
-    def __init__(self, local_file_service, file_paths: List[str] = None, folder_path: str = None):
+    def __init__(self, local_file_service, file_paths: List[str] = None, folder_path: str = None,
+                 archive_path: str = None):
         super().__init__()
         self._local_file_service = local_file_service
         self._file_paths = file_paths or []
         self._folder_path = folder_path
+        self._archive_path = archive_path
 
     def run(self):
         try:
-            if self._folder_path:
+            if self._archive_path:
+                self._load_archive()
+            elif self._folder_path:
                 self._load_folder()
             else:
                 self._load_files()
@@ -44,6 +48,16 @@ class LocalFileLoaderWorker(QObject):
         except Exception as e:
             self.error_occurred.emit(f"Error loading folder: {e}")
 
+    def _load_archive(self):
+        self.progress_updated.emit(0, f"Indexing archive: {os.path.basename(self._archive_path)}")
+
+        try:
+            studies = self._local_file_service.load_archive(self._archive_path)
+            self.folder_loaded.emit(studies)
+            self.progress_updated.emit(100, f"Loaded {len(studies)} studies from archive")
+        except Exception as e:
+            self.error_occurred.emit(f"Error loading archive: {e}")
+
     def _load_files(self):
         total_files = len(self._file_paths)
 
@@ -62,6 +76,28 @@ class LocalFileLoaderWorker(QObject):
         self.progress_updated.emit(100, f"Loaded {total_files} files")
 
 
+class DicomScanWorker(QObject):
+    progress_updated = pyqtSignal(int, str)
+    scan_completed = pyqtSignal(list)
+    error_occurred = pyqtSignal(str)
+
+    def __init__(self, local_file_service, paths: List[str]):
+        super().__init__()
+        self._local_file_service = local_file_service
+        self._paths = paths
+
+    def run(self):
+        try:
+            dicom_files = self._local_file_service.filter_dicom_files(self._paths, self._report_progress)
+            self.scan_completed.emit(dicom_files)
+        except Exception as e:
+            self.error_occurred.emit(f"Error scanning dropped files: {e}")
+
+    def _report_progress(self, scanned: int, total: int):
+        progress = int((scanned / total) * 100) if total else 100
+        self.progress_updated.emit(progress, f"Scanning: {scanned}/{total} files")
+
+
 class LocalFileManagerWidget(QWidget):
     studies_updated = pyqtSignal()
 
@@ -97,12 +133,17 @@ class LocalFileManagerWidget(QWidget):
         self.load_folder_button.setObjectName("LoadFolderButton")
         self.load_folder_button.clicked.connect(self._load_dicom_folder)
 
+        self.load_archive_button = QPushButton("Load Archive")
+        self.load_archive_button.setObjectName("LoadArchiveButton")
+        self.load_archive_button.clicked.connect(self._load_dicom_archive)
+
         self.clear_button = QPushButton("Clear All")
         self.clear_button.setObjectName("ClearButton")
         self.clear_button.clicked.connect(self._clear_local_studies)
 
         buttons_layout.addWidget(self.load_files_button)
         buttons_layout.addWidget(self.load_folder_button)
+        buttons_layout.addWidget(self.load_archive_button)
         buttons_layout.addWidget(self.clear_button)
         buttons_layout.addStretch()
 
@@ -156,6 +197,41 @@ class LocalFileManagerWidget(QWidget):
         if folder_path:
             self._load_folder_in_background(folder_path)
 
+    def _load_dicom_archive(self):
+        archive_path, _ = QFileDialog.getOpenFileName(
+            self,
+            "Select DICOM Archive",
+            "",
+            "Archives (*.zip *.tar *.tar.gz *.tgz *.tar.bz2 *.tar.xz);;All Files (*)"
+        )
+
+        if archive_path:
+            self._load_archive_in_background(archive_path)
+
+    def _load_archive_in_background(self, archive_path: str):
+        self._show_loading_state(True, f"Indexing archive: {os.path.basename(archive_path)}")
+
+        self.loader_thread = QThread()
+        self.loader_worker = LocalFileLoaderWorker(
+            self._local_file_service,
+            archive_path=archive_path
+        )
+        self.loader_worker.moveToThread(self.loader_thread)
+
+        # Connect signals
+        self.loader_thread.started.connect(self.loader_worker.run)
+        self.loader_worker.progress_updated.connect(self._update_loading_progress)
+        self.loader_worker.folder_loaded.connect(self._on_folder_loaded)
+        self.loader_worker.error_occurred.connect(self._on_loading_error)
+        self.loader_worker.finished.connect(self._on_loading_finished)
+
+        # Cleanup
+        self.loader_worker.finished.connect(self.loader_thread.quit)
+        self.loader_worker.finished.connect(self.loader_worker.deleteLater)
+        self.loader_thread.finished.connect(self.loader_thread.deleteLater)
+
+        self.loader_thread.start()
+
     def _load_files_in_background(self, file_paths: List[str]):
         self._show_loading_state(True, f"Loading {len(file_paths)} files...")
 
@@ -214,12 +290,16 @@ class LocalFileManagerWidget(QWidget):
         # Disable buttons during loading
         self.load_files_button.setEnabled(not loading)
         self.load_folder_button.setEnabled(not loading)
+        self.load_archive_button.setEnabled(not loading)
         self.clear_button.setEnabled(not loading)
 
     def _update_loading_progress(self, progress: int, message: str):
         self.progress_bar.setValue(progress)
         self.status_label.setText(message)
 
+    def refresh_studies(self):
+        self._update_local_studies_display()
+
     def _on_file_loaded(self, file_data: Dict[str, Any]):
         self._update_local_studies_display()
 
@@ -323,6 +403,7 @@ class LocalFileManagerWidget(QWidget):
 
     def _view_local_study_details(self, study_id: str):
         try:
+            self._local_file_service.mark_study_used(study_id)
             metadata = self._local_file_service.get_local_study_metadata(study_id)
             instances = self._local_file_service.get_local_study_instances(study_id)
             examination_result = self._local_file_service.get_examination_result_from_local_study(study_id)
@@ -438,19 +519,13 @@ class LocalFileDropWidget(QFrame):
     def dropEvent(self, event):
         self.setStyleSheet("")  # Reset style
 
+        # Folderele sunt parcurse de DicomScanWorker, nu pe thread-ul GUI
         file_paths = []
         urls = event.mimeData().urls()
 
         for url in urls:
             if url.isLocalFile():
-                file_path = url.toLocalFile()
-                if os.path.isfile(file_path):
-                    file_paths.append(file_path)
-                elif os.path.isdir(file_path):
-                    for root, dirs, files in os.walk(file_path):
-                        for file in files:
-                            full_path = os.path.join(root, file)
-                            file_paths.append(full_path)
+                file_paths.append(url.toLocalFile())
 
         if file_paths:
             self.files_dropped.emit(file_paths)
@@ -1,11 +1,13 @@
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QFormLayout, QLineEdit, QCheckBox,
     QPushButton, QHBoxLayout, QLabel, QGroupBox, QTableWidget,
-    QTableWidgetItem, QHeaderView, QSplitter, QComboBox
+    QHeaderView, QSplitter, QComboBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer
 
+from app.config.settings import Settings
 from app.di.container import Container
+from app.presentation.widgets.paged_table_loader import PagedTableLoader
 from app.services.notification_service import NotificationService
 
 
@@ -15,6 +17,7 @@ class PacsManagementWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._notification_service = NotificationService()
+        self._settings = Settings()
         self._needs_restart = False
 
         # Editing state
@@ -23,6 +26,7 @@ class PacsManagementWidget(QWidget):
 
         self._setup_ui()
         self._load_pacs_urls()
+        self._load_pacs_combos()
 
     def _setup_ui(self):
         layout = QVBoxLayout(self)
@@ -57,6 +61,11 @@ class PacsManagementWidget(QWidget):
         self.pacs_search_input.setObjectName("SearchInput")
         self.pacs_search_input.textChanged.connect(self._filter_pacs)
 
+        self._pacs_search_timer = QTimer(self)
+        self._pacs_search_timer.setSingleShot(True)
+        self._pacs_search_timer.setInterval(self._settings.ADMIN_SEARCH_DELAY_MS)
+        self._pacs_search_timer.timeout.connect(self._apply_pacs_search)
+
         self.clear_pacs_search_button = QPushButton("x")
         self.clear_pacs_search_button.setObjectName("ClearSearchButton")
         self.clear_pacs_search_button.setMaximumWidth(25)
@@ -86,6 +95,22 @@ class PacsManagementWidget(QWidget):
         self.pacs_table.itemSelectionChanged.connect(self._on_pacs_selected)
         self.pacs_table.itemDoubleClicked.connect(self._on_pacs_double_clicked)
 
+        header = self.pacs_table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)  # ID
+        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)  # Name
+        header.setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)  # URL
+        header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)  # Username
+
+        pacs_service = Container.get_pacs_url_service()
+        self._pacs_loader = PagedTableLoader(
+            self.pacs_table,
+            pacs_service.get_pacs_page,
+            pacs_service.count_pacs_urls,
+            lambda pacs: [pacs.id, pacs.name, pacs.url, pacs.username],
+            lambda pacs: pacs.id,
+            self._settings.ADMIN_TABLE_PAGE_SIZE
+        )
+
         layout.addWidget(self.pacs_table)
 
         # PACS actions
@@ -216,7 +241,8 @@ class PacsManagementWidget(QWidget):
         return widget
 
     def refresh_data(self):
-        self._load_pacs_urls()
+        self._clear_pacs_search()
+        self._load_pacs_combos()
 
     def focus_search(self):
         self.pacs_search_input.setFocus()
@@ -228,73 +254,44 @@ class PacsManagementWidget(QWidget):
     def edit_selected(self):
         self._edit_selected_pacs()
 
-    def _load_pacs_urls(self):
+    def _load_pacs_urls(self, filter_text: str = None):
         try:
-            pacs_service = Container.get_pacs_url_service()
-            pacs_urls = pacs_service.get_all_pacs_urls()
-
-            self.pacs_table.setRowCount(len(pacs_urls))
-
-            for row, pacs in enumerate(pacs_urls):
-                self.pacs_table.setItem(row, 0, QTableWidgetItem(str(pacs.id)))
-                self.pacs_table.setItem(row, 1, QTableWidgetItem(pacs.name))
-                self.pacs_table.setItem(row, 2, QTableWidgetItem(pacs.url))
-                self.pacs_table.setItem(row, 3, QTableWidgetItem(pacs.username))
-
-            # Adjust column widths
-            header = self.pacs_table.horizontalHeader()
-            header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)  # ID
-            header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)  # Name
-            header.setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)  # URL
-            header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)  # Username
-
-            self._clear_pacs_search()
-            self._load_pacs_combos()
-
+            self._pacs_loader.reload(filter_text)
+            self._update_pacs_results_label()
         except Exception as e:
             self._notification_service.show_error(self, "Eroare", f"Nu s-au putut incarca URL-urile PACS: {e}")
 
     def _filter_pacs(self, text: str):
         self.clear_pacs_search_button.setVisible(bool(text.strip()))
+        self._pacs_search_timer.start()
 
-        if not text.strip():
-            self._show_all_pacs()
-            return
-
-        visible_count = 0
-        total_count = self.pacs_table.rowCount()
+    def _apply_pacs_search(self):
+        self._load_pacs_urls(self.pacs_search_input.text())
 
-        for row in range(total_count):
-            name_item = self.pacs_table.item(row, 1)  # Name column
-            url_item = self.pacs_table.item(row, 2)  # URL column
-
-            name_match = text.lower() in name_item.text().lower() if name_item else False
-            url_match = text.lower() in url_item.text().lower() if url_item else False
-
-            if name_match or url_match:
-                self.pacs_table.setRowHidden(row, False)
-                visible_count += 1
-            else:
-                self.pacs_table.setRowHidden(row, True)
+    def _update_pacs_results_label(self):
+        search_text = self._pacs_loader.filter_text
+        if not search_text:
+            self.pacs_results_label.setVisible(False)
+            return
 
+        visible_count = self._pacs_loader.total_count
         if visible_count == 0:
-            self.pacs_results_label.setText(f"Nu s-au găsit PACS-uri pentru '{text}'")
+            self.pacs_results_label.setText(f"Nu s-au găsit PACS-uri pentru '{search_text}'")
             self.pacs_results_label.setStyleSheet("color: #dc2626; font-size: 11px; padding: 2px;")
         else:
+            total_count = Container.get_pacs_url_service().count_pacs_urls()
             self.pacs_results_label.setText(f"Găsite {visible_count} din {total_count} PACS-uri")
             self.pacs_results_label.setStyleSheet("color: #059669; font-size: 11px; padding: 2px;")
 
         self.pacs_results_label.setVisible(True)
 
-    def _show_all_pacs(self):
-        for row in range(self.pacs_table.rowCount()):
-            self.pacs_table.setRowHidden(row, False)
-        self.pacs_results_label.setVisible(False)
-
     def _clear_pacs_search(self):
+        self._pacs_search_timer.stop()
+        self.pacs_search_input.blockSignals(True)
         self.pacs_search_input.clear()
+        self.pacs_search_input.blockSignals(False)
         self.clear_pacs_search_button.setVisible(False)
-        self._show_all_pacs()
+        self._load_pacs_urls()
 
     def _on_pacs_selected(self):
         current_row = self.pacs_table.currentRow()
@@ -373,11 +370,13 @@ class PacsManagementWidget(QWidget):
                 return
 
             # Create PACS
-            pacs_service.create_pacs_url(name, url, username, password)
+            pacs = pacs_service.create_pacs_url(name, url, username, password)
 
             self._notification_service.show_info(self, "Succes", f"PACS '{name}' a fost creat cu succes.")
             self._clear_pacs_form()
-            self._load_pacs_urls()
+            self._pacs_loader.upsert(pacs)
+            self._update_pacs_results_label()
+            self._load_pacs_combos()
             self.pacs_updated.emit()
 
         except Exception as e:
@@ -404,9 +403,13 @@ class PacsManagementWidget(QWidget):
             )
 
             if success:
+                pacs = pacs_service.get_pacs_by_id(self._editing_pacs_id)
                 self._notification_service.show_info(self, "Succes", f"PACS '{name}' a fost actualizat cu succes.")
                 self._cancel_pacs_edit()
-                self._load_pacs_urls()
+                if pacs:
+                    self._pacs_loader.upsert(pacs)
+                    self._update_pacs_results_label()
+                self._load_pacs_combos()
                 self.pacs_updated.emit()
             else:
                 self._notification_service.show_error(self, "Eroare", "Nu s-a putut actualiza PACS-ul.")
@@ -461,7 +464,9 @@ class PacsManagementWidget(QWidget):
                         if self._editing_pacs_mode and self._editing_pacs_id == pacs_id:
                             self._cancel_pacs_edit()
 
-                        self._load_pacs_urls()
+                        self._pacs_loader.remove(pacs_id)
+                        self._update_pacs_results_label()
+                        self._load_pacs_combos()
                         self.pacs_updated.emit()
                     else:
                         self._notification_service.show_error(self, "Eroare", "Nu s-a putut sterge PACS-ul.")
@@ -0,0 +1,170 @@
+from typing import Any, Callable, List, Optional
+
+from PyQt6.QtCore import QObject, Qt, QTimer
+from PyQt6.QtWidgets import QTableWidget, QTableWidgetItem
+
+
+class PagedTableLoader(QObject):
+    """Fills a QTableWidget page by page; the next page is fetched when the user scrolls near the bottom.
+
+    Column 0 holds the entity id and is used to update or remove a single row after an edit,
+    so the table does not have to be reloaded. Without a sort_key matching the query's ORDER BY,
+    edits re-read the loaded rows instead of placing them locally.
+    """
+
+    SCROLL_THRESHOLD = 10  # randuri ramase pana la capat cand cerem pagina urmatoare
+
+    def __init__(self, table: QTableWidget,
+                 fetch_page: Callable[[int, int, Optional[str]], List[Any]],
+                 count: Callable[[Optional[str]], int],
+                 row_values: Callable[[Any], List[str]],
+                 sort_key: Optional[Callable[[Any], Any]] = None,
+                 page_size: int = 100):
+        super().__init__(table)
+        self._table = table
+        self._fetch_page = fetch_page
+        self._count = count
+        self._row_values = row_values
+        self._sort_key = sort_key
+        self._page_size = max(1, page_size)
+        self._filter_text: Optional[str] = None
+        self._total_count = 0
+        self._loaded_ids = set()
+        self._loading = False
+
+        table.verticalScrollBar().valueChanged.connect(self._on_scrolled)
+
+    @property
+    def filter_text(self) -> Optional[str]:
+        return self._filter_text
+
+    @property
+    def total_count(self) -> int:
+        return self._total_count
+
+    @property
+    def has_more(self) -> bool:
+        return self._table.rowCount() < self._total_count
+
+    def reload(self, filter_text: str = None) -> int:
+        self._filter_text = filter_text.strip() if filter_text and filter_text.strip() else None
+        self._total_count = self._count(self._filter_text)
+        self._clear_rows()
+        self.fetch_more()
+
+        # Daca prima pagina nu umple tabelul nu apare scrollbar, deci nici semnalul de scroll
+        QTimer.singleShot(0, self._fill_viewport)
+        return self._total_count
+
+    def fetch_more(self) -> int:
+        if self._loading or not self.has_more:
+            return 0
+
+        self._loading = True
+        try:
+            entities = self._fetch_page(self._table.rowCount(), self._page_size, self._filter_text)
+            added = 0
+            for entity in entities:
+                # Un rand inserat local poate reveni in pagina urmatoare
+                if str(self._row_values(entity)[0]) not in self._loaded_ids:
+                    self._insert_row(self._table.rowCount(), entity)
+                    added += 1
+
+            if len(entities) < self._page_size:
+                # Randuri sterse din alta parte intre timp
+                self._total_count = self._table.rowCount()
+            return added
+        finally:
+            self._loading = False
+
+    def upsert(self, entity):
+        """Shows a created or updated entity at its sorted position."""
+        if self._filter_text or self._sort_key is None:
+            # Nu stim local daca entitatea mai corespunde filtrului / unde o pune ORDER BY-ul
+            self.refresh()
+            return
+
+        all_loaded = not self.has_more
+        existing_row = self.find_row(self._row_values(entity)[0])
+        if existing_row >= 0:
+            self._remove_row(existing_row)
+        else:
+            self._total_count += 1
+
+        key = self._sort_key(entity)
+        for row in range(self._table.rowCount()):
+            if key < self._table.item(row, 0).data(Qt.ItemDataRole.UserRole):
+                self._insert_row(row, entity)
+                return
+
+        # Dupa ultimul rand incarcat se adauga doar daca nu mai sunt pagini; altfel vine la scroll
+        if all_loaded:
+            self._insert_row(self._table.rowCount(), entity)
+
+    def remove(self, entity_id):
+        row = self.find_row(entity_id)
+        if row >= 0:
+            self._remove_row(row)
+        self._total_count = max(self._total_count - 1, self._table.rowCount())
+
+    def refresh(self):
+        """Re-reads the rows already loaded with one query, keeping the scroll position."""
+        scroll_bar = self._table.verticalScrollBar()
+        scroll_value = scroll_bar.value()
+        loaded_count = max(self._table.rowCount(), self._page_size)
+
+        self._total_count = self._count(self._filter_text)
+        entities = self._fetch_page(0, loaded_count, self._filter_text)
+
+        self._clear_rows()
+        for entity in entities:
+            self._insert_row(self._table.rowCount(), entity)
+        scroll_bar.setValue(scroll_value)
+
+    def find_row(self, entity_id) -> int:
+        entity_id = str(entity_id)
+        if entity_id not in self._loaded_ids:
+            return -1
+        for row in range(self._table.rowCount()):
+            item = self._table.item(row, 0)
+            if item and item.text() == entity_id:
+                return row
+        return -1
+
+    def _insert_row(self, row: int, entity):
+        self._table.insertRow(row)
+
+        values = self._row_values(entity)
+        for column, value in enumerate(values):
+            item = QTableWidgetItem(str(value) if value is not None else "")
+            if column == 0 and self._sort_key is not None:
+                item.setData(Qt.ItemDataRole.UserRole, self._sort_key(entity))
+            self._table.setItem(row, column, item)
+        self._loaded_ids.add(str(values[0]))
+
+    def _remove_row(self, row: int):
+        item = self._table.item(row, 0)
+        if item:
+            self._loaded_ids.discard(item.text())
+        self._table.removeRow(row)
+
+    def _clear_rows(self):
+        self._table.setRowCount(0)
+        self._loaded_ids.clear()
+
+    def _on_scrolled(self, value: int):
+        scroll_bar = self._table.verticalScrollBar()
+        if value >= scroll_bar.maximum() - self.SCROLL_THRESHOLD and self.has_more:
+            self._load_more_safely()
+
+    def _fill_viewport(self):
+        while self.has_more and self._table.verticalScrollBar().maximum() == 0:
+            if not self._load_more_safely():
+                break
+
+    def _load_more_safely(self) -> int:
+        try:
+            return self.fetch_more()
+        except Exception as e:
+            print(f"Error loading table page: {e}")
+            return 0
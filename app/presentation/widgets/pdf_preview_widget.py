@@ -0,0 +1,56 @@
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel
+from PyQt6.QtCore import Qt
+from PyQt6.QtPdf import QPdfDocument
+from PyQt6.QtPdfWidgets import QPdfView
+
+
+class PdfPreviewWidget(QWidget):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setObjectName("PdfPreviewWidget")
+        self._current_path = None
+        self._setup_ui()
+
+    def _setup_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        self.status_label = QLabel("Previzualizarea apare după completarea rezultatului.")
+        self.status_label.setStyleSheet("color: #6b7280; font-size: 11px; font-style: italic;")
+        self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(self.status_label)
+
+        self.document = QPdfDocument(self)
+
+        self.pdf_view = QPdfView(self)
+        self.pdf_view.setDocument(self.document)
+        self.pdf_view.setPageMode(QPdfView.PageMode.MultiPage)
+        self.pdf_view.setZoomMode(QPdfView.ZoomMode.FitToWidth)
+        layout.addWidget(self.pdf_view)
+
+    def show_pdf(self, pdf_path: str):
+        if pdf_path == self._current_path:
+            self.set_status("")
+            return
+
+        # QPdfView pastreaza paginile deja randate; reincarcam doar cand fisierul e altul
+        self.document.close()
+        if self.document.load(pdf_path) != QPdfDocument.Error.None_:
+            self._current_path = None
+            self.set_status("Nu am putut încărca previzualizarea.")
+            return
+
+        self._current_path = pdf_path
+        self.set_status("")
+
+    def set_status(self, text: str):
+        self.status_label.setText(text)
+        self.status_label.setVisible(bool(text))
+
+    def clear_preview(self):
+        self.document.close()
+        self._current_path = None
+        self.set_status("Previzualizarea apare după completarea rezultatului.")
+
+    def current_pdf_path(self) -> str:
+        return self._current_path
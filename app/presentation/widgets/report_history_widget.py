@@ -0,0 +1,76 @@
+from datetime import datetime
+from typing import Any, Dict, List
+
+from PyQt6.QtCore import QSize, Qt, pyqtSignal
+from PyQt6.QtGui import QIcon, QPixmap
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QListWidget, QListWidgetItem
+
+
+class ReportHistoryWidget(QWidget):
+    """Previously generated reports for the selected study, as page-1 thumbnails."""
+
+    report_open_requested = pyqtSignal(str)  # calea PDF-ului arhivat
+
+    ICON_SIZE = QSize(96, 136)
+    EMPTY_TEXT = "Niciun raport generat pentru acest studiu."
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setObjectName("ReportHistoryWidget")
+        self._setup_ui()
+
+    def _setup_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        self.status_label = QLabel(self.EMPTY_TEXT)
+        self.status_label.setStyleSheet("color: #6b7280; font-size: 11px; font-style: italic;")
+        layout.addWidget(self.status_label)
+
+        self.list_widget = QListWidget()
+        self.list_widget.setViewMode(QListWidget.ViewMode.IconMode)
+        self.list_widget.setFlow(QListWidget.Flow.LeftToRight)
+        self.list_widget.setWrapping(False)
+        self.list_widget.setMovement(QListWidget.Movement.Static)
+        self.list_widget.setIconSize(self.ICON_SIZE)
+        self.list_widget.setFixedHeight(self.ICON_SIZE.height() + 60)
+        self.list_widget.itemDoubleClicked.connect(self._on_item_double_clicked)
+        self.list_widget.setVisible(False)
+        layout.addWidget(self.list_widget)
+
+    def set_reports(self, reports: List[Dict[str, Any]]):
+        self.list_widget.clear()
+        for report in reports:
+            item = QListWidgetItem(self._report_icon(report.get("thumbnail")), self._report_label(report))
+            item.setData(Qt.ItemDataRole.UserRole, report["path"])
+            item.setToolTip(f"{report.get('author') or '-'}\n{report.get('name', '')}\nDublu-click pentru deschidere")
+            self.list_widget.addItem(item)
+
+        self.list_widget.setVisible(bool(reports))
+        self.status_label.setVisible(not reports)
+
+    def clear_reports(self):
+        self.set_reports([])
+
+    def _report_icon(self, thumbnail_path: str) -> QIcon:
+        if thumbnail_path:
+            pixmap = QPixmap(thumbnail_path)
+            if not pixmap.isNull():
+                return QIcon(pixmap)
+        # Thumbnail-ul inca nu e gata: patrat gol pana la urmatorul refresh
+        placeholder = QPixmap(self.ICON_SIZE)
+        placeholder.fill(Qt.GlobalColor.lightGray)
+        return QIcon(placeholder)
+
+    def _report_label(self, report: Dict[str, Any]) -> str:
+        try:
+            created_at = datetime.fromisoformat(report.get("created_at", "")).strftime("%d.%m.%Y %H:%M")
+        except ValueError:
+            created_at = ""
+        title = report.get("title") or "Raport"
+        return f"{title}\n{created_at}" if created_at else title
+
+    def _on_item_double_clicked(self, item: QListWidgetItem):
+        pdf_path = item.data(Qt.ItemDataRole.UserRole)
+        if pdf_path:
+            self.report_open_requested.emit(pdf_path)
@@ -1,11 +1,13 @@
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QFormLayout, QLineEdit,
     QPushButton, QHBoxLayout, QLabel, QGroupBox, QTableWidget,
-    QTableWidgetItem, QHeaderView, QSplitter
+    QHeaderView, QSplitter
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer
 
+from app.config.settings import Settings
 from app.di.container import Container
+from app.presentation.widgets.paged_table_loader import PagedTableLoader
 from app.services.notification_service import NotificationService
 
 
@@ -15,6 +17,7 @@ class ReportTitleManagementWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._notification_service = NotificationService()
+        self._settings = Settings()
 
         # Editing state
         self._editing_title_id = None
@@ -56,6 +59,11 @@ class ReportTitleManagementWidget(QWidget):
         self.title_search_input.setObjectName("SearchInput")
         self.title_search_input.textChanged.connect(self._filter_titles)
 
+        self._title_search_timer = QTimer(self)
+        self._title_search_timer.setSingleShot(True)
+        self._title_search_timer.setInterval(self._settings.ADMIN_SEARCH_DELAY_MS)
+        self._title_search_timer.timeout.connect(self._apply_title_search)
+
         self.clear_title_search_button = QPushButton("x")
         self.clear_title_search_button.setObjectName("ClearSearchButton")
         self.clear_title_search_button.setMaximumWidth(25)
@@ -85,6 +93,22 @@ class ReportTitleManagementWidget(QWidget):
         self.titles_table.itemSelectionChanged.connect(self._on_title_selected)
         self.titles_table.itemDoubleClicked.connect(self._on_title_double_clicked)
 
+        header = self.titles_table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)  # ID
+        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)  # Title
+        header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)  # Date
+
+        report_title_service = Container.get_report_title_service()
+        self._titles_loader = PagedTableLoader(
+            self.titles_table,
+            report_title_service.get_titles_page,
+            report_title_service.count_titles,
+            self._title_row_values,
+            # Fara sort_key: ordinea din SQL (lower() / colatie) nu se poate reproduce exact in Python,
+            # asa ca dupa modificari se recitesc randurile incarcate
+            page_size=self._settings.ADMIN_TABLE_PAGE_SIZE
+        )
+
         layout.addWidget(self.titles_table)
 
         # Title actions
@@ -157,7 +181,7 @@ class ReportTitleManagementWidget(QWidget):
         self._handle_create_or_update_title()
 
     def refresh_data(self):
-        self._load_titles()
+        self._clear_title_search()
 
     def focus_search(self):
         self.title_search_input.setFocus()
@@ -169,71 +193,49 @@ class ReportTitleManagementWidget(QWidget):
     def edit_selected(self):
         self._edit_selected_title()
 
-    def _load_titles(self):
+    def _load_titles(self, filter_text: str = None):
         try:
-            report_title_service = Container.get_report_title_service()
-            titles = report_title_service.get_all_titles()
-
-            self.titles_table.setRowCount(len(titles))
-
-            for row, title in enumerate(titles):
-                self.titles_table.setItem(row, 0, QTableWidgetItem(str(title.id)))
-                self.titles_table.setItem(row, 1, QTableWidgetItem(title.title_text))
-
-                # Format date
-                created_at = title.created_at.strftime("%d.%m.%Y %H:%M") if title.created_at else "N/A"
-                self.titles_table.setItem(row, 2, QTableWidgetItem(created_at))
-
-            # Adjust column widths
-            header = self.titles_table.horizontalHeader()
-            header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)  # ID
-            header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)  # Title
-            header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)  # Date
-
-            self._clear_title_search()
-
+            self._titles_loader.reload(filter_text)
+            self._update_title_results_label()
         except Exception as e:
             self._notification_service.show_error(self, "Eroare", f"Nu s-au putut incarca titlurile: {e}")
 
+    def _title_row_values(self, title):
+        # Format date
+        created_at = title.created_at.strftime("%d.%m.%Y %H:%M") if title.created_at else "N/A"
+        return [title.id, title.title_text, created_at]
+
     def _filter_titles(self, text: str):
         self.clear_title_search_button.setVisible(bool(text.strip()))
+        self._title_search_timer.start()
 
-        if not text.strip():
-            self._show_all_titles()
-            return
-
-        visible_count = 0
-        total_count = self.titles_table.rowCount()
-
-        for row in range(total_count):
-            title_item = self.titles_table.item(row, 1)  # Title column
+    def _apply_title_search(self):
+        self._load_titles(self.title_search_input.text())
 
-            title_match = text.lower() in title_item.text().lower() if title_item else False
-
-            if title_match:
-                self.titles_table.setRowHidden(row, False)
-                visible_count += 1
-            else:
-                self.titles_table.setRowHidden(row, True)
+    def _update_title_results_label(self):
+        search_text = self._titles_loader.filter_text
+        if not search_text:
+            self.title_results_label.setVisible(False)
+            return
 
+        visible_count = self._titles_loader.total_count
         if visible_count == 0:
-            self.title_results_label.setText(f"Nu s-au găsit titluri pentru '{text}'")
+            self.title_results_label.setText(f"Nu s-au găsit titluri pentru '{search_text}'")
             self.title_results_label.setStyleSheet("color: #dc2626; font-size: 11px; padding: 2px;")
         else:
+            total_count = Container.get_report_title_service().count_titles()
             self.title_results_label.setText(f"Găsite {visible_count} din {total_count} titluri")
             self.title_results_label.setStyleSheet("color: #059669; font-size: 11px; padding: 2px;")
 
         self.title_results_label.setVisible(True)
 
-    def _show_all_titles(self):
-        for row in range(self.titles_table.rowCount()):
-            self.titles_table.setRowHidden(row, False)
-        self.title_results_label.setVisible(False)
-
     def _clear_title_search(self):
+        self._title_search_timer.stop()
+        self.title_search_input.blockSignals(True)
         self.title_search_input.clear()
+        self.title_search_input.blockSignals(False)
         self.clear_title_search_button.setVisible(False)
-        self._show_all_titles()
+        self._load_titles()
 
     def _on_title_selected(self):
         current_row = self.titles_table.currentRow()
@@ -309,10 +311,11 @@ class ReportTitleManagementWidget(QWidget):
 
         try:
             report_title_service = Container.get_report_title_service()
-            report_title_service.create_title(title_text)
+            title = report_title_service.create_title(title_text)
 
             self._clear_title_form()
-            self._load_titles()
+            self._titles_loader.upsert(title)
+            self._update_title_results_label()
             self.titles_updated.emit()
             self.title_text_input.setFocus()
 
@@ -337,10 +340,11 @@ class ReportTitleManagementWidget(QWidget):
 
         try:
             report_title_service = Container.get_report_title_service()
-            report_title_service.update_title(self._editing_title_id, title_text)
+            title = report_title_service.update_title(self._editing_title_id, title_text)
 
             self._cancel_title_edit()
-            self._load_titles()
+            self._titles_loader.upsert(title)
+            self._update_title_results_label()
             self.titles_updated.emit()
 
         except ValueError as e:
@@ -365,7 +369,8 @@ class ReportTitleManagementWidget(QWidget):
                     if self._editing_mode and self._editing_title_id == title_id:
                         self._cancel_title_edit()
 
-                    self._load_titles()
+                    self._titles_loader.remove(title_id)
+                    self._update_title_results_label()
                     self.titles_updated.emit()
 
                 except ValueError as e:
@@ -220,6 +220,7 @@ class SearchableStudyListWidget(QWidget):
 
 
 class StudyQueueWidget(QWidget):
+    queue_changed = pyqtSignal(list)  # study IDs currently in queue
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -324,6 +325,7 @@ class StudyQueueWidget(QWidget):
     def _update_queue_count(self):
         count = len(self.queued_studies)
         self.queue_count_label.setText(f"({count} studii)" if count != 1 else "(1 studiu)")
+        self.queue_changed.emit([qs.study_id for qs in self.queued_studies])
 
     def _show_queue_context_menu(self, position):
         item = self.queue_list.itemAt(position)
@@ -1,12 +1,14 @@
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QFormLayout, QLineEdit, QComboBox,
     QPushButton, QHBoxLayout, QLabel, QGroupBox, QTableWidget,
-    QTableWidgetItem, QHeaderView, QSplitter
+    QHeaderView, QSplitter
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer
 
+from app.config.settings import Settings
 from app.di.container import Container
 from app.core.entities.user import User, UserRole
+from app.presentation.widgets.paged_table_loader import PagedTableLoader
 from app.services.notification_service import NotificationService
 from app.utils.validators import Validators
 
@@ -18,6 +20,7 @@ class UserManagementWidget(QWidget):
         super().__init__(parent)
         self._auth_controller = auth_controller
         self._notification_service = NotificationService()
+        self._settings = Settings()
 
         # Editing state
         self._editing_user_id = None
@@ -60,6 +63,11 @@ class UserManagementWidget(QWidget):
         self.user_search_input.setObjectName("SearchInput")
         self.user_search_input.textChanged.connect(self._filter_users)
 
+        self._user_search_timer = QTimer(self)
+        self._user_search_timer.setSingleShot(True)
+        self._user_search_timer.setInterval(self._settings.ADMIN_SEARCH_DELAY_MS)
+        self._user_search_timer.timeout.connect(self._apply_user_search)
+
         self.clear_user_search_button = QPushButton("x")
         self.clear_user_search_button.setObjectName("ClearSearchButton")
         self.clear_user_search_button.setMaximumWidth(25)
@@ -88,6 +96,23 @@ class UserManagementWidget(QWidget):
         self.users_table.itemSelectionChanged.connect(self._on_user_selected)
         self.users_table.itemDoubleClicked.connect(self._on_user_double_clicked)
 
+        header = self.users_table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)  # ID
+        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)  # Username
+        header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)  # Title
+        header.setSectionResizeMode(3, QHeaderView.ResizeMode.Stretch)  # Full Name
+        header.setSectionResizeMode(4, QHeaderView.ResizeMode.ResizeToContents)  # Role
+
+        user_repo = Container.get_user_repository()
+        self._users_loader = PagedTableLoader(
+            self.users_table,
+            user_repo.find_page,
+            user_repo.count,
+            self._user_row_values,
+            lambda user: user.id,
+            self._settings.ADMIN_TABLE_PAGE_SIZE
+        )
+
         layout.addWidget(self.users_table)
 
         # User actions
@@ -201,7 +226,7 @@ class UserManagementWidget(QWidget):
             self.title_input.setPlaceholderText("Dr., Univ. Dr., Prof. Dr., etc. (opțional)")
 
     def refresh_data(self):
-        self._load_users()
+        self._clear_user_search()
 
     def focus_search(self):
         self.user_search_input.setFocus()
@@ -213,87 +238,56 @@ class UserManagementWidget(QWidget):
     def edit_selected(self):
         self._edit_selected_user()
 
-    def _load_users(self):
+    def _load_users(self, filter_text: str = None):
         try:
-            user_repo = Container.get_user_repository()
-            users = user_repo.find_all()
-
-            self.users_table.setRowCount(len(users))
-
-            for row, user in enumerate(users):
-                self.users_table.setItem(row, 0, QTableWidgetItem(str(user.id)))
-                self.users_table.setItem(row, 1, QTableWidgetItem(user.username))
-
-                # Title column
-                title_text = user.title if user.title else ""
-                self.users_table.setItem(row, 2, QTableWidgetItem(title_text))
-
-                # Full name column
-                full_name = ""
-                if user.first_name or user.last_name:
-                    full_name = f"{user.first_name or ''} {user.last_name or ''}".strip()
-                self.users_table.setItem(row, 3, QTableWidgetItem(full_name))
-
-                # Role column
-                self.users_table.setItem(row, 4, QTableWidgetItem(user.role.value.title()))
-
-            # Adjust column widths
-            header = self.users_table.horizontalHeader()
-            header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)  # ID
-            header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)  # Username
-            header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)  # Title
-            header.setSectionResizeMode(3, QHeaderView.ResizeMode.Stretch)  # Full Name
-            header.setSectionResizeMode(4, QHeaderView.ResizeMode.ResizeToContents)  # Role
-
-            self._clear_user_search()
-
+            self._users_loader.reload(filter_text)
+            self._update_user_results_label()
         except Exception as e:
             self._notification_service.show_error(self, "Eroare",
                                                   f"Nu s-au putut incarca conturile utilizatorilor: {e}")
 
-    def _filter_users(self, text: str):
-        self.clear_user_search_button.setVisible(bool(text.strip()))
+    def _user_row_values(self, user: User):
+        # Title column
+        title_text = user.title if user.title else ""
 
-        if not text.strip():
-            self._show_all_users()
-            return
+        # Full name column
+        full_name = ""
+        if user.first_name or user.last_name:
+            full_name = f"{user.first_name or ''} {user.last_name or ''}".strip()
 
-        visible_count = 0
-        total_count = self.users_table.rowCount()
+        return [user.id, user.username, title_text, full_name, user.role.value.title()]
 
-        for row in range(total_count):
-            username_item = self.users_table.item(row, 1)
-            fullname_item = self.users_table.item(row, 3)
-            title_item = self.users_table.item(row, 2)
+    def _filter_users(self, text: str):
+        self.clear_user_search_button.setVisible(bool(text.strip()))
+        self._user_search_timer.start()
 
-            username_match = text.lower() in username_item.text().lower() if username_item else False
-            fullname_match = text.lower() in fullname_item.text().lower() if fullname_item else False
-            title_match = text.lower() in title_item.text().lower() if title_item else False
+    def _apply_user_search(self):
+        self._load_users(self.user_search_input.text())
 
-            if username_match or fullname_match or title_match:
-                self.users_table.setRowHidden(row, False)
-                visible_count += 1
-            else:
-                self.users_table.setRowHidden(row, True)
+    def _update_user_results_label(self):
+        search_text = self._users_loader.filter_text
+        if not search_text:
+            self.user_results_label.setVisible(False)
+            return
 
+        visible_count = self._users_loader.total_count
         if visible_count == 0:
-            self.user_results_label.setText(f"Nu s-au găsit utilizatori pentru '{text}'")
+            self.user_results_label.setText(f"Nu s-au găsit utilizatori pentru '{search_text}'")
             self.user_results_label.setStyleSheet("color: #dc2626; font-size: 11px; padding: 2px;")
         else:
+            total_count = Container.get_user_repository().count()
             self.user_results_label.setText(f"Găsiți {visible_count} din {total_count} utilizatori")
             self.user_results_label.setStyleSheet("color: #059669; font-size: 11px; padding: 2px;")
 
         self.user_results_label.setVisible(True)
 
-    def _show_all_users(self):
-        for row in range(self.users_table.rowCount()):
-            self.users_table.setRowHidden(row, False)
-        self.user_results_label.setVisible(False)
-
     def _clear_user_search(self):
+        self._user_search_timer.stop()
+        self.user_search_input.blockSignals(True)
         self.user_search_input.clear()
+        self.user_search_input.blockSignals(False)
         self.clear_user_search_button.setVisible(False)
-        self._show_all_users()
+        self._load_users()
 
     def _on_user_selected(self):
         current_row = self.users_table.currentRow()
@@ -431,13 +425,14 @@ class UserManagementWidget(QWidget):
                 title=title if title and role == UserRole.DOCTOR else None  # Only set title for doctors
             )
 
-            user_repo.create(new_user)
+            created_user = user_repo.create(new_user)
 
             display_name = new_user.get_full_name_with_title() if new_user.title else f"{username}"
             self._notification_service.show_info(self, "Succes",
                                                  f"Utilizatorul '{display_name}' a fost creat cu succes.")
             self._clear_form()
-            self._load_users()
+            self._users_loader.upsert(created_user)
+            self._update_user_results_label()
             self.user_updated.emit()
 
         except Exception as e:
@@ -519,14 +514,18 @@ class UserManagementWidget(QWidget):
                 title=title if title and role == UserRole.DOCTOR else None  # Only set title for doctors
             )
 
-            user_repo.update(updated_user)
+            updated_user = user_repo.update(updated_user)
+            # Parola sau username-ul schimbat nu trebuie acceptat din cache-ul de verificare
+            auth_service.clear_verification_cache(current_user.username)
+            auth_service.clear_verification_cache(username)
 
             display_name = updated_user.get_full_name_with_title() if updated_user.title else f"{username}"
             self._notification_service.show_info(self, "Succes",
                                                  f"Utilizatorul '{display_name}' a fost actualizat cu succes.")
 
             self._cancel_edit()
-            self._load_users()
+            self._users_loader.upsert(updated_user)
+            self._update_user_results_label()
             self.user_updated.emit()
 
         except Exception as e:
@@ -557,12 +556,14 @@ class UserManagementWidget(QWidget):
                     user_repo = Container.get_user_repository()
 
                     if user_repo.delete(user_id):
+                        Container.get_auth_service().clear_verification_cache(username)
                         self._notification_service.show_info(self, "Succes", "Utilizator sters cu succes.")
 
                         if self._editing_mode and self._editing_user_id == user_id:
                             self._cancel_edit()
 
-                        self._load_users()
+                        self._users_loader.remove(user_id)
+                        self._update_user_results_label()
                         self.user_updated.emit()
                     else:
                         self._notification_service.show_error(self, "Eroare", "Eroare la stergerea utilizatorului")
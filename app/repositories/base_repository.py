@@ -1,17 +1,51 @@
 from abc import ABC, abstractmethod
-from typing import TypeVar, Generic, Optional, List
+from typing import TypeVar, Generic, Optional, List, ContextManager
 from sqlalchemy.orm import Session
 
 T = TypeVar('T')
 
 
 class BaseRepository(ABC, Generic[T]):
-    def __init__(self, db_config):
+    # False pentru tabelele care nu sunt copiate in replica locala
+    REPLICATED = True
+
+    def __init__(self, db_config, replica=None):
         self._db_config = db_config
+        self._replica = replica if self.REPLICATED else None
 
     def _get_session(self) -> Session:
         return self._db_config.get_session()
 
+    def _session_scope(self) -> ContextManager[Session]:
+        return self._db_config.session_scope()
+
+    def _read_scope(self) -> ContextManager[Session]:
+        # Citirile merg la replica SQLite locala cand exista; scrierile raman pe server.
+        # In interiorul unei unitati de lucru citim din aceeasi tranzactie ca scrierile.
+        if self._replica and self._replica.is_ready and not self._db_config.in_unit_of_work():
+            return self._replica.session_scope()
+        return self._session_scope()
+
+    def _write_through(self, *entities):
+        # Replica primeste randurile doar dupa commit-ul unitatii de lucru
+        if self._replica:
+            replica = self._replica
+            self._db_config.after_commit(lambda: replica.upsert(*entities))
+
+    def _write_through_delete(self, model, entity_id: int):
+        if self._replica:
+            replica = self._replica
+            self._db_config.after_commit(lambda: replica.remove(model, entity_id))
+
+    def _like_pattern(self, filter_text: str) -> str:
+        # Cautare "contine", fara ca % sau _ din text sa fie interpretate ca wildcard
+        escaped = filter_text.strip().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        return f"%{escaped}%"
+
+    def session_scope(self) -> ContextManager[Session]:
+        """Groups several repository calls into one transaction, committed when the outermost scope exits."""
+        return self._db_config.session_scope()
+
     @abstractmethod
     def find_by_id(self, entity_id: int) -> Optional[T]:
         pass
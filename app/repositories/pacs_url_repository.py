@@ -1,63 +1,78 @@
-from typing import Optional, List
+from datetime import datetime
+from typing import Optional, List, Tuple, Iterable
 
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import func, or_
 
 from app.database.models import PacsUrl
 from app.repositories.base_repository import BaseRepository
 
 
 class PacsUrlRepository(BaseRepository[PacsUrl]):
+    # Parolele PACS nu ajung in replica locala: find_by_id / find_by_ids (folosite pentru
+    # configuratia de conectare) citesc de pe server; listele, numararea si versiunea din replica.
+    # PacsUrlService pastreaza configuratia in cache cat timp versiunea din replica nu se schimba.
 
     def find_by_id(self, entity_id: int) -> Optional[PacsUrl]:
-        session = self._get_session()
-        try:
+        with self._session_scope() as session:
             return session.query(PacsUrl).filter_by(id=entity_id).first()
-        finally:
-            session.close()
 
     def create(self, entity: PacsUrl) -> PacsUrl:
-        session = self._get_session()
-        try:
+        with self._session_scope() as session:
             session.add(entity)
-            session.commit()
+            session.flush()
             session.refresh(entity)
+            self._write_through(entity)
             return entity
-        except SQLAlchemyError as e:
-            session.rollback()
-            raise e
-        finally:
-            session.close()
 
     def update(self, entity: PacsUrl) -> PacsUrl:
-        session = self._get_session()
-        try:
-            session.merge(entity)
-            session.commit()
+        with self._session_scope() as session:
+            merged = session.merge(entity)
+            session.flush()
+            self._write_through(merged)
             return entity
-        except SQLAlchemyError as e:
-            session.rollback()
-            raise e
-        finally:
-            session.close()
 
     def delete(self, entity_id: int) -> bool:
-        session = self._get_session()
-        try:
+        with self._session_scope() as session:
             pacs_url = session.query(PacsUrl).filter_by(id=entity_id).first()
             if not pacs_url:
                 return False
             session.delete(pacs_url)
-            session.commit()
+            session.flush()
+            self._write_through_delete(PacsUrl, entity_id)
             return True
-        except SQLAlchemyError as e:
-            session.rollback()
-            raise e
-        finally:
-            session.close()
 
     def find_all(self) -> List[PacsUrl]:
-        session = self._get_session()
-        try:
+        with self._read_scope() as session:
             return session.query(PacsUrl).all()
-        finally:
-            session.close()
+
+    def find_by_ids(self, entity_ids: Iterable[int]) -> List[PacsUrl]:
+        entity_ids = list(set(entity_ids))
+        if not entity_ids:
+            return []
+
+        with self._session_scope() as session:
+            return session.query(PacsUrl).filter(PacsUrl.id.in_(entity_ids)).all()
+
+    def find_page(self, offset: int, limit: int, filter_text: str = None) -> List[PacsUrl]:
+        with self._read_scope() as session:
+            query = self._filtered_query(session.query(PacsUrl), filter_text)
+            return query.order_by(PacsUrl.id).offset(offset).limit(limit).all()
+
+    def count(self, filter_text: str = None) -> int:
+        with self._read_scope() as session:
+            return self._filtered_query(session.query(func.count(PacsUrl.id)), filter_text).scalar()
+
+    def get_version(self) -> Tuple[int, Optional[datetime]]:
+        # (numar randuri, ultimul updated_at) - se schimba la orice insert/update/delete
+        with self._read_scope() as session:
+            count, last_updated = session.query(func.count(PacsUrl.id), func.max(PacsUrl.updated_at)).one()
+            return count, last_updated
+
+    def _filtered_query(self, query, filter_text: Optional[str]):
+        if not filter_text or not filter_text.strip():
+            return query
+        pattern = self._like_pattern(filter_text)
+        return query.filter(or_(
+            PacsUrl.name.ilike(pattern, escape="\\"),
+            PacsUrl.url.ilike(pattern, escape="\\")
+        ))
@@ -0,0 +1,51 @@
+from typing import Optional, List
+
+from app.database.models import ReportRecord
+from app.repositories.base_repository import BaseRepository
+
+
+class ReportRecordRepository(BaseRepository[ReportRecord]):
+
+    def find_by_id(self, entity_id: int) -> Optional[ReportRecord]:
+        with self._session_scope() as session:
+            return session.query(ReportRecord).filter_by(id=entity_id).first()
+
+    def create(self, entity: ReportRecord) -> ReportRecord:
+        with self._session_scope() as session:
+            session.add(entity)
+            session.flush()
+            session.refresh(entity)
+            return entity
+
+    def update(self, entity: ReportRecord) -> ReportRecord:
+        with self._session_scope() as session:
+            session.merge(entity)
+            session.flush()
+            return entity
+
+    def delete(self, entity_id: int) -> bool:
+        with self._session_scope() as session:
+            record = session.query(ReportRecord).filter_by(id=entity_id).first()
+            if not record:
+                return False
+            session.delete(record)
+            session.flush()
+            return True
+
+    def find_all(self) -> List[ReportRecord]:
+        with self._session_scope() as session:
+            return session.query(ReportRecord).order_by(ReportRecord.created_at.desc()).all()
+
+    def find_by_study_id(self, study_id: str) -> List[ReportRecord]:
+        with self._session_scope() as session:
+            return (session.query(ReportRecord)
+                    .filter_by(study_id=study_id)
+                    .order_by(ReportRecord.created_at.desc())
+                    .all())
+
+    def find_latest_for_study(self, study_id: str) -> Optional[ReportRecord]:
+        with self._session_scope() as session:
+            return (session.query(ReportRecord)
+                    .filter_by(study_id=study_id)
+                    .order_by(ReportRecord.created_at.desc())
+                    .first())
@@ -1,5 +1,7 @@
-from typing import Optional, List
-from sqlalchemy.exc import SQLAlchemyError
+from datetime import datetime
+from typing import Optional, List, Tuple
+
+from sqlalchemy import func
 
 from app.repositories.base_repository import BaseRepository
 from app.database.models import ReportTitle
@@ -8,62 +10,60 @@ from app.database.models import ReportTitle
 class ReportTitleRepository(BaseRepository[ReportTitle]):
 
     def find_by_id(self, entity_id: int) -> Optional[ReportTitle]:
-        session = self._get_session()
-        try:
+        with self._read_scope() as session:
             return session.query(ReportTitle).filter_by(id=entity_id).first()
-        finally:
-            session.close()
 
     def create(self, entity: ReportTitle) -> ReportTitle:
-        session = self._get_session()
-        try:
+        with self._session_scope() as session:
             session.add(entity)
-            session.commit()
+            session.flush()
             session.refresh(entity)
+            self._write_through(entity)
             return entity
-        except SQLAlchemyError as e:
-            session.rollback()
-            raise e
-        finally:
-            session.close()
 
     def update(self, entity: ReportTitle) -> ReportTitle:
-        session = self._get_session()
-        try:
-            session.merge(entity)
-            session.commit()
+        with self._session_scope() as session:
+            merged = session.merge(entity)
+            session.flush()
+            self._write_through(merged)
             return entity
-        except SQLAlchemyError as e:
-            session.rollback()
-            raise e
-        finally:
-            session.close()
 
     def delete(self, entity_id: int) -> bool:
-        session = self._get_session()
-        try:
+        with self._session_scope() as session:
             report_title = session.query(ReportTitle).filter_by(id=entity_id).first()
             if not report_title:
                 return False
             session.delete(report_title)
-            session.commit()
+            session.flush()
+            self._write_through_delete(ReportTitle, entity_id)
             return True
-        except SQLAlchemyError as e:
-            session.rollback()
-            raise e
-        finally:
-            session.close()
 
     def find_all(self) -> List[ReportTitle]:
-        session = self._get_session()
-        try:
-            return session.query(ReportTitle).order_by(ReportTitle.title_text).all()
-        finally:
-            session.close()
+        with self._read_scope() as session:
+            # Ordine explicita, aceeasi pe MySQL si pe replica SQLite (care compara BINARY)
+            return session.query(ReportTitle).order_by(func.lower(ReportTitle.title_text), ReportTitle.id).all()
 
     def find_by_title_text(self, title_text: str) -> Optional[ReportTitle]:
-        session = self._get_session()
-        try:
+        with self._read_scope() as session:
             return session.query(ReportTitle).filter_by(title_text=title_text).first()
-        finally:
-            session.close()
\ No newline at end of file
+
+    def find_page(self, offset: int, limit: int, filter_text: str = None) -> List[ReportTitle]:
+        with self._read_scope() as session:
+            query = self._filtered_query(session.query(ReportTitle), filter_text)
+            query = query.order_by(func.lower(ReportTitle.title_text), ReportTitle.id)
+            return query.offset(offset).limit(limit).all()
+
+    def count(self, filter_text: str = None) -> int:
+        with self._read_scope() as session:
+            return self._filtered_query(session.query(func.count(ReportTitle.id)), filter_text).scalar()
+
+    def get_version(self) -> Tuple[int, Optional[datetime]]:
+        # (numar randuri, ultimul updated_at) - se schimba la orice insert/update/delete
+        with self._read_scope() as session:
+            count, last_updated = session.query(func.count(ReportTitle.id), func.max(ReportTitle.updated_at)).one()
+            return count, last_updated
+
+    def _filtered_query(self, query, filter_text: Optional[str]):
+        if not filter_text or not filter_text.strip():
+            return query
+        return query.filter(ReportTitle.title_text.ilike(self._like_pattern(filter_text), escape="\\"))
@@ -1,5 +1,6 @@
-from typing import Optional, List
-from sqlalchemy.exc import SQLAlchemyError
+from datetime import datetime
+from typing import Optional, List, Tuple, Dict, Iterable
+from sqlalchemy import func
 from app.database.models import AppSettings
 from app.repositories.base_repository import BaseRepository
 
@@ -7,73 +8,48 @@ from app.repositories.base_repository import BaseRepository
 class SettingsRepository(BaseRepository[AppSettings]):
 
     def find_by_id(self, entity_id: int) -> Optional[AppSettings]:
-        session = self._get_session()
-        try:
+        with self._read_scope() as session:
             return session.query(AppSettings).filter_by(id=entity_id).first()
-        finally:
-            session.close()
 
     def create(self, entity: AppSettings) -> AppSettings:
-        session = self._get_session()
-        try:
+        with self._session_scope() as session:
             session.add(entity)
-            session.commit()
+            session.flush()
             session.refresh(entity)
+            self._write_through(entity)
             return entity
-        except SQLAlchemyError as e:
-            session.rollback()
-            raise e
-        finally:
-            session.close()
 
     def update(self, entity: AppSettings) -> AppSettings:
-        session = self._get_session()
-        try:
-            session.merge(entity)
-            session.commit()
+        with self._session_scope() as session:
+            merged = session.merge(entity)
+            session.flush()
+            self._write_through(merged)
             return entity
-        except SQLAlchemyError as e:
-            session.rollback()
-            raise e
-        finally:
-            session.close()
 
     def delete(self, entity_id: int) -> bool:
-        session = self._get_session()
-        try:
+        with self._session_scope() as session:
             setting = session.query(AppSettings).filter_by(id=entity_id).first()
             if not setting:
                 return False
             session.delete(setting)
-            session.commit()
+            session.flush()
+            self._write_through_delete(AppSettings, entity_id)
             return True
-        except SQLAlchemyError as e:
-            session.rollback()
-            raise e
-        finally:
-            session.close()
 
     def find_all(self) -> List[AppSettings]:
-        session = self._get_session()
-        try:
+        with self._read_scope() as session:
             return session.query(AppSettings).all()
-        finally:
-            session.close()
 
     def find_by_key(self, setting_key: str) -> Optional[AppSettings]:
-        session = self._get_session()
-        try:
+        with self._read_scope() as session:
             return session.query(AppSettings).filter_by(setting_key=setting_key).first()
-        finally:
-            session.close()
 
     def get_value(self, setting_key: str, default_value: str = None) -> Optional[str]:
         setting = self.find_by_key(setting_key)
         return setting.setting_value if setting else default_value
 
     def set_value(self, setting_key: str, setting_value: str, description: str = None) -> bool:
-        session = self._get_session()
-        try:
+        with self._session_scope() as session:
             setting = session.query(AppSettings).filter_by(setting_key=setting_key).first()
 
             if setting:
@@ -90,11 +66,54 @@ class SettingsRepository(BaseRepository[AppSettings]):
                 )
                 session.add(setting)
 
-            session.commit()
+            session.flush()
+            self._write_through(setting)
             return True
-        except SQLAlchemyError as e:
-            session.rollback()
-            raise e
-        finally:
-            session.close()
-            
\ No newline at end of file
+
+    def get_values(self, setting_keys: Iterable[str]) -> Dict[str, Optional[str]]:
+        setting_keys = list(setting_keys)
+        if not setting_keys:
+            return {}
+
+        with self._read_scope() as session:
+            settings = session.query(AppSettings).filter(AppSettings.setting_key.in_(setting_keys)).all()
+            values = {setting.setting_key: setting.setting_value for setting in settings}
+            return {key: values.get(key) for key in setting_keys}
+
+    def set_values(self, values: Dict[str, str], descriptions: Dict[str, str] = None) -> bool:
+        # O singura tranzactie: fie se salveaza toate cheile, fie niciuna
+        if not values:
+            return True
+
+        descriptions = descriptions or {}
+        with self._session_scope() as session:
+            existing = {
+                setting.setting_key: setting
+                for setting in session.query(AppSettings).filter(AppSettings.setting_key.in_(list(values))).all()
+            }
+
+            for setting_key, setting_value in values.items():
+                setting = existing.get(setting_key)
+                description = descriptions.get(setting_key)
+                if setting:
+                    setting.setting_value = setting_value
+                    if description:
+                        setting.description = description
+                else:
+                    setting = AppSettings(
+                        setting_key=setting_key,
+                        setting_value=setting_value,
+                        description=description
+                    )
+                    session.add(setting)
+                    existing[setting_key] = setting
+
+            session.flush()
+            self._write_through(*existing.values())
+            return True
+
+    def get_version(self) -> Tuple[int, Optional[datetime]]:
+        # (numar randuri, ultimul updated_at) - se schimba la orice insert/update/delete
+        with self._read_scope() as session:
+            count, last_updated = session.query(func.count(AppSettings.id), func.max(AppSettings.updated_at)).one()
+            return count, last_updated
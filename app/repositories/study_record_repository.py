@@ -0,0 +1,63 @@
+from typing import Optional, List, Dict, Any
+
+from sqlalchemy.exc import IntegrityError
+
+from app.database.models import StudyRecord
+from app.repositories.base_repository import BaseRepository
+
+
+class StudyRecordRepository(BaseRepository[StudyRecord]):
+
+    def find_by_id(self, entity_id: int) -> Optional[StudyRecord]:
+        with self._session_scope() as session:
+            return session.query(StudyRecord).filter_by(id=entity_id).first()
+
+    def create(self, entity: StudyRecord) -> StudyRecord:
+        with self._session_scope() as session:
+            session.add(entity)
+            session.flush()
+            session.refresh(entity)
+            return entity
+
+    def update(self, entity: StudyRecord) -> StudyRecord:
+        with self._session_scope() as session:
+            session.merge(entity)
+            session.flush()
+            return entity
+
+    def delete(self, entity_id: int) -> bool:
+        with self._session_scope() as session:
+            record = session.query(StudyRecord).filter_by(id=entity_id).first()
+            if not record:
+                return False
+            session.delete(record)
+            session.flush()
+            return True
+
+    def find_all(self) -> List[StudyRecord]:
+        with self._session_scope() as session:
+            return session.query(StudyRecord).order_by(StudyRecord.updated_at.desc()).all()
+
+    def find_by_study_id(self, study_id: str) -> Optional[StudyRecord]:
+        with self._session_scope() as session:
+            return session.query(StudyRecord).filter_by(study_id=study_id).first()
+
+    def upsert(self, study_id: str, values: Dict[str, Any]) -> StudyRecord:
+        # Campurile None nu suprascriu ce stim deja despre studiu
+        with self._session_scope() as session:
+            record = session.query(StudyRecord).filter_by(study_id=study_id).first()
+            if not record:
+                try:
+                    # Savepoint: daca alta statie a inserat acelasi studiu intre timp, tranzactia continua
+                    with session.begin_nested():
+                        record = StudyRecord(study_id=study_id)
+                        session.add(record)
+                except IntegrityError:
+                    record = session.query(StudyRecord).filter_by(study_id=study_id).one()
+
+            for field, value in values.items():
+                if value is not None:
+                    setattr(record, field, value)
+
+            session.flush()
+            return record
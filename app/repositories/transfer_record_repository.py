@@ -0,0 +1,56 @@
+from typing import Optional, List, Iterable, Set
+
+from app.database.models import TransferRecord
+from app.repositories.base_repository import BaseRepository
+
+
+class TransferRecordRepository(BaseRepository[TransferRecord]):
+
+    def find_by_id(self, entity_id: int) -> Optional[TransferRecord]:
+        with self._session_scope() as session:
+            return session.query(TransferRecord).filter_by(id=entity_id).first()
+
+    def create(self, entity: TransferRecord) -> TransferRecord:
+        with self._session_scope() as session:
+            session.add(entity)
+            session.flush()
+            session.refresh(entity)
+            return entity
+
+    def update(self, entity: TransferRecord) -> TransferRecord:
+        with self._session_scope() as session:
+            session.merge(entity)
+            session.flush()
+            return entity
+
+    def delete(self, entity_id: int) -> bool:
+        with self._session_scope() as session:
+            record = session.query(TransferRecord).filter_by(id=entity_id).first()
+            if not record:
+                return False
+            session.delete(record)
+            session.flush()
+            return True
+
+    def find_all(self) -> List[TransferRecord]:
+        with self._session_scope() as session:
+            return session.query(TransferRecord).order_by(TransferRecord.sent_at.desc()).all()
+
+    def find_by_study_id(self, study_id: str) -> List[TransferRecord]:
+        with self._session_scope() as session:
+            return (session.query(TransferRecord)
+                    .filter_by(study_id=study_id)
+                    .order_by(TransferRecord.sent_at.desc())
+                    .all())
+
+    def find_sent_study_ids(self, study_ids: Iterable[str], target_url: str = None) -> Set[str]:
+        study_ids = list(set(study_ids))
+        if not study_ids:
+            return set()
+
+        with self._session_scope() as session:
+            query = (session.query(TransferRecord.study_id)
+                     .filter(TransferRecord.study_id.in_(study_ids), TransferRecord.success.is_(True)))
+            if target_url:
+                query = query.filter(TransferRecord.target_url == target_url)
+            return {study_id for (study_id,) in query.distinct()}
@@ -1,5 +1,6 @@
 from typing import Optional, List
-from sqlalchemy.exc import SQLAlchemyError
+
+from sqlalchemy import func, or_
 
 from app.core.interfaces.auth_interface import IUserRepository
 from app.core.entities.user import User, UserRole
@@ -11,28 +12,23 @@ from app.database.models import User as UserModel, RoleEnum
 
 class UserRepository(BaseRepository[User], IUserRepository):
     def find_by_username(self, username: str) -> Optional[User]:
-        session = self._get_session()
-        try:
+        # Autentificarea citeste de pe server: replica locala nu are hash-urile parolelor
+        with self._session_scope() as session:
             user_model = session.query(UserModel).filter_by(username=username).first()
             if user_model:
                 return self._map_to_entity(user_model)
             return None
-        finally:
-            session.close()
 
     def find_by_id(self, user_id: int) -> Optional[User]:
-        session = self._get_session()
-        try:
+        # Editarea pastreaza hash-ul existent, deci are nevoie de parola de pe server
+        with self._session_scope() as session:
             user_model = session.query(UserModel).filter_by(id=user_id).first()
             if user_model:
                 return self._map_to_entity(user_model)
             return None
-        finally:
-            session.close()
 
     def create(self, user: User) -> User:
-        session = self._get_session()
-        try:
+        with self._session_scope() as session:
             existing = session.query(UserModel).filter_by(username=user.username).first()
             if existing:
                 raise UserAlreadyExistsError(f"Utilizatorul cu username-ul '{user.username}' exista deja.")
@@ -47,19 +43,14 @@ class UserRepository(BaseRepository[User], IUserRepository):
             )
 
             session.add(user_model)
-            session.commit()
+            session.flush()
             session.refresh(user_model)
+            self._write_through(user_model)
 
             return self._map_to_entity(user_model)
-        except SQLAlchemyError as e:
-            session.rollback()
-            raise e
-        finally:
-            session.close()
 
     def update(self, user: User) -> User:
-        session = self._get_session()
-        try:
+        with self._session_scope() as session:
             user_model = session.query(UserModel).filter_by(id=user.id).first()
             if not user_model:
                 raise UserNotFoundError(f"Utilizatorul cu username-ul {user.username} nu a fost gasit.")
@@ -71,39 +62,50 @@ class UserRepository(BaseRepository[User], IUserRepository):
             user_model.last_name = user.last_name
             user_model.title = user.title
 
-            session.commit()
+            session.flush()
             session.refresh(user_model)
+            self._write_through(user_model)
 
             return self._map_to_entity(user_model)
-        except SQLAlchemyError as e:
-            session.rollback()
-            raise e
-        finally:
-            session.close()
 
     def delete(self, user_id: int) -> bool:
-        session = self._get_session()
-        try:
+        with self._session_scope() as session:
             user_model = session.query(UserModel).filter_by(id=user_id).first()
             if not user_model:
                 return False
 
             session.delete(user_model)
-            session.commit()
+            session.flush()
+            self._write_through_delete(UserModel, user_id)
             return True
-        except SQLAlchemyError as e:
-            session.rollback()
-            raise e
-        finally:
-            session.close()
 
+    # find_all / find_page / count citesc din replica: parola din entitatile returnate este goala
     def find_all(self) -> List[User]:
-        session = self._get_session()
-        try:
+        with self._read_scope() as session:
             user_models = session.query(UserModel).all()
             return [self._map_to_entity(model) for model in user_models]
-        finally:
-            session.close()
+
+    def find_page(self, offset: int, limit: int, filter_text: str = None) -> List[User]:
+        with self._read_scope() as session:
+            query = self._filtered_query(session.query(UserModel), filter_text)
+            user_models = query.order_by(UserModel.id).offset(offset).limit(limit).all()
+            return [self._map_to_entity(model) for model in user_models]
+
+    def count(self, filter_text: str = None) -> int:
+        with self._read_scope() as session:
+            return self._filtered_query(session.query(func.count(UserModel.id)), filter_text).scalar()
+
+    def _filtered_query(self, query, filter_text: Optional[str]):
+        if not filter_text or not filter_text.strip():
+            return query
+        pattern = self._like_pattern(filter_text)
+        # "Prenume Nume", ca in coloana din tabelul de administrare
+        full_name = func.coalesce(UserModel.first_name, "") + " " + func.coalesce(UserModel.last_name, "")
+        return query.filter(or_(
+            UserModel.username.ilike(pattern, escape="\\"),
+            full_name.ilike(pattern, escape="\\"),
+            UserModel.title.ilike(pattern, escape="\\")
+        ))
 
     def _map_to_entity(self, user_model: UserModel) -> User:
         return User(
@@ -114,4 +116,4 @@ class UserRepository(BaseRepository[User], IUserRepository):
             first_name=user_model.first_name,
             last_name=user_model.last_name,
             title=user_model.title  # Map title field
-        )
\ No newline at end of file
+        )
@@ -1,13 +1,23 @@
+import hashlib
+import hmac
+import secrets
+import threading
+import time
 import bcrypt
-from typing import Optional
+from typing import Optional, Dict, Tuple
 from app.core.interfaces.auth_interface import IAuthService, IUserRepository
 from app.core.entities.user import User
 from app.core.exceptions.auth_exceptions import AuthenticationError
 
 
 class AuthService(IAuthService):
-    def __init__(self, user_repository: IUserRepository):
+    def __init__(self, user_repository: IUserRepository, verification_cache_ttl: float = 0):
         self._user_repository = user_repository
+        # Verificari bcrypt reusite recent (re-autentificare / deblocare); 0 = dezactivat
+        self._verification_cache_ttl = verification_cache_ttl
+        self._verification_cache: Dict[str, Tuple[bytes, str, float]] = {}
+        self._verification_lock = threading.Lock()
+        self._cache_key = secrets.token_bytes(32)  # doar in memorie, nou la fiecare pornire
 
     def authenticate(self, username: str, password: str) -> Optional[User]:
         if not username or not password:
@@ -17,13 +27,55 @@ class AuthService(IAuthService):
         if not user:
             raise AuthenticationError(f"Utilizatorul {user} este inexistent.")
 
+        if self._is_recently_verified(username, password, user.password):
+            return user
+
         if not self.verify_password(password, user.password):
             raise AuthenticationError("Username-ul sau parola sunt gresite.")
 
+        self._remember_verification(username, password, user.password)
         return user
 
+    def clear_verification_cache(self, username: str = None):
+        with self._verification_lock:
+            if username is None:
+                self._verification_cache.clear()
+            else:
+                self._verification_cache.pop(username, None)
+
     def hash_password(self, password: str) -> str:
         return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
 
     def verify_password(self, password: str, hashed_password: str) -> bool:
-        return bcrypt.checkpw(password.encode("utf-8"), hashed_password.encode("utf-8"))
\ No newline at end of file
+        return bcrypt.checkpw(password.encode("utf-8"), hashed_password.encode("utf-8"))
+
+    def _password_digest(self, password: str) -> bytes:
+        return hmac.new(self._cache_key, password.encode("utf-8"), hashlib.sha256).digest()
+
+    def _is_recently_verified(self, username: str, password: str, hashed_password: str) -> bool:
+        if self._verification_cache_ttl <= 0:
+            return False
+
+        with self._verification_lock:
+            entry = self._verification_cache.get(username)
+        if not entry:
+            return False
+
+        digest, cached_hash, expires_at = entry
+        # O parola schimbata intre timp (alt hash in baza de date) invalideaza intrarea
+        if time.monotonic() > expires_at or cached_hash != hashed_password:
+            self.clear_verification_cache(username)
+            return False
+
+        return hmac.compare_digest(digest, self._password_digest(password))
+
+    def _remember_verification(self, username: str, password: str, hashed_password: str):
+        if self._verification_cache_ttl <= 0:
+            return
+
+        with self._verification_lock:
+            self._verification_cache[username] = (
+                self._password_digest(password),
+                hashed_password,
+                time.monotonic() + self._verification_cache_ttl
+            )
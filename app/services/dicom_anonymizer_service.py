@@ -2,14 +2,18 @@ import pydicom
 from io import BytesIO
 import hashlib
 
+from app.core.exceptions.pacs_exceptions import PacsDataError
+from app.infrastructure.mapped_file import as_dicom_stream
+
 
 class DicomAnonymizer:
     def __init__(self):
         pass
 
-    def anonymize_dicom(self, dicom_data: bytes) -> bytes:
+    def anonymize_dicom(self, dicom_data):
         try:
-            dataset = pydicom.dcmread(BytesIO(dicom_data))
+            # Accepta bytes, un stream sau un MappedFile (fara copie in memorie)
+            dataset = pydicom.dcmread(as_dicom_stream(dicom_data))
 
             # Genereaza ID anonim unic
             anonymous_id = self.generate_anonymous_id(dataset)
@@ -43,8 +47,9 @@ class DicomAnonymizer:
             return output.getvalue()
 
         except Exception as e:
+            # Nu trimitem niciodata datele originale daca anonimizarea a esuat
             print(f"Error anonymizing DICOM: {e}")
-            return dicom_data
+            raise PacsDataError(f"Nu am putut anonimiza fisierul DICOM: {e}") from e
 
     def generate_anonymous_id(self, dataset) -> str:
         try:
@@ -0,0 +1,116 @@
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, Any, List, Optional, Tuple
+
+import requests
+
+from app.config.database import DatabaseConfig
+from app.infrastructure.circuit_breaker import CircuitBreakerRegistry
+from app.infrastructure.http_client import HttpClient
+
+
+class HealthMonitor:
+    """Background probes for the database and the configured PACS servers.
+
+    Every `interval` seconds it runs SELECT 1 on the database and GET /system
+    on the source and target PACS, with short timeouts. Results feed the same
+    circuit breakers the repositories and HttpClient use, so an outage is
+    detected (and a recovery noticed) without a user request running into
+    the full timeout. Listeners receive the status dict after every round.
+    """
+
+    UP = "up"
+    DOWN = "down"
+    UNKNOWN = "unknown"
+
+    def __init__(self, circuit_breakers: CircuitBreakerRegistry, database_config: DatabaseConfig,
+                 pacs_endpoints: Callable[[], List[Tuple[str, str, tuple]]], interval: float = 15,
+                 probe_timeout: float = 3):
+        self._circuit_breakers = circuit_breakers
+        self._database_config = database_config
+        self._pacs_endpoints = pacs_endpoints  # () -> [(eticheta, url, auth)]
+        self._interval = interval
+        self._probe_timeout = probe_timeout
+        self._status: Dict[str, Dict[str, Any]] = {}
+        self._listeners: List[Callable[[Dict[str, Dict[str, Any]]], None]] = []
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="health-monitor", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+
+    def add_listener(self, listener: Callable[[Dict[str, Dict[str, Any]]], None]):
+        with self._lock:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[Dict[str, Dict[str, Any]]], None]):
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def get_status(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {name: dict(status) for name, status in self._status.items()}
+
+    def is_available(self, name: str) -> bool:
+        status = self.get_status().get(name)
+        return not status or status["state"] != self.DOWN
+
+    def check_now(self) -> Dict[str, Dict[str, Any]]:
+        status = {"database": self._probe("Baza de date", "database", self._database_config.ping)}
+
+        try:
+            endpoints = self._pacs_endpoints()
+        except Exception as e:
+            print(f"Warning: Could not load PACS endpoints for health check: {e}")
+            endpoints = []
+
+        for label, url, auth in endpoints:
+            name = HttpClient.endpoint_name(url)
+            status[name] = self._probe(label, name, lambda: self._ping_pacs(url, auth))
+
+        with self._lock:
+            self._status = status
+            listeners = list(self._listeners)
+
+        for listener in listeners:
+            try:
+                listener(self.get_status())
+            except Exception as e:
+                print(f"Warning: Health listener failed: {e}")
+
+        return self.get_status()
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            self.check_now()
+            self._stop_event.wait(self._interval)
+
+    def _probe(self, label: str, breaker_name: str, probe: Callable[[], None]) -> Dict[str, Any]:
+        breaker = self._circuit_breakers.get(breaker_name)
+        started = time.perf_counter()
+        try:
+            probe()
+        except Exception as e:
+            breaker.record_failure(e)
+            return {"label": label, "state": self.DOWN, "error": str(e), "latency_ms": None,
+                    "breaker": breaker.state, "checked_at": datetime.now()}
+
+        breaker.record_success()
+        return {"label": label, "state": self.UP, "error": None,
+                "latency_ms": round((time.perf_counter() - started) * 1000, 1),
+                "breaker": breaker.state, "checked_at": datetime.now()}
+
+    def _ping_pacs(self, url: str, auth: tuple):
+        # Orice raspuns HTTP inseamna ca serverul ruleaza; 401 indica doar credentiale gresite
+        requests.get(f"{url.rstrip('/')}/system", auth=auth, timeout=self._probe_timeout)
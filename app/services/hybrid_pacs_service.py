@@ -1,4 +1,5 @@
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Iterable, Tuple
 from app.core.interfaces.pacs_interface import IPacsService
 from app.services.local_file_service import LocalFileService
 from app.services.pacs_service import PacsService
@@ -34,6 +35,24 @@ class HybridPacsService(IPacsService):
         else:
             return self._pacs_service.get_study_metadata(study_id)
 
+    def get_studies_metadata(self, study_ids: Iterable[str]) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, str]]:
+        metadata, errors = {}, {}
+        pacs_study_ids = []
+
+        for study_id in study_ids:
+            if not self._is_local_study(study_id):
+                pacs_study_ids.append(study_id)
+                continue
+            try:
+                metadata[study_id] = self._local_file_service.get_local_study_metadata(study_id)
+            except Exception as e:
+                errors[study_id] = str(e)
+
+        pacs_metadata, pacs_errors = self._pacs_service.get_studies_metadata(pacs_study_ids)
+        metadata.update(pacs_metadata)
+        errors.update(pacs_errors)
+        return metadata, errors
+
     def get_study_instances(self, study_id: str) -> List[Dict[str, Any]]:
         if self._is_local_study(study_id):
             return self._local_file_service.get_local_study_instances(study_id)
@@ -82,6 +101,9 @@ class HybridPacsService(IPacsService):
     def load_local_dicom_folder(self, folder_path: str) -> List[Dict[str, Any]]:
         return self._local_file_service.load_dicom_folder(folder_path)
 
+    def load_local_archive(self, archive_path: str) -> List[Dict[str, Any]]:
+        return self._local_file_service.load_archive(archive_path)
+
     def clear_local_studies(self):
         self._local_file_service.clear_local_studies()
 
@@ -90,6 +112,19 @@ class HybridPacsService(IPacsService):
             return self._local_file_service.remove_local_study(study_id)
         return False
 
+    def mark_study_used(self, study_id: str):
+        if self._is_local_study(study_id):
+            self._local_file_service.mark_study_used(study_id)
+
+    def set_pinned_studies(self, study_ids: Iterable[str]):
+        self._local_file_service.set_pinned_studies(study_ids)
+
+    def add_local_studies_listener(self, listener):
+        self._local_file_service.add_studies_changed_listener(listener)
+
+    def remove_local_studies_listener(self, listener):
+        self._local_file_service.remove_studies_changed_listener(listener)
+
     def get_local_studies_count(self) -> int:
         return len(self._local_file_service.get_all_local_studies())
 
@@ -115,6 +150,27 @@ class HybridPacsService(IPacsService):
 
             return ""
 
+    def get_examination_results(self, study_ids: Iterable[str], max_workers: int = 8) -> Dict[str, str]:
+        study_ids = list(dict.fromkeys(study_ids))
+        results = {}
+        pacs_study_ids = []
+
+        for study_id in study_ids:
+            if self._is_local_study(study_id):
+                results[study_id] = self._local_file_service.get_examination_result_from_local_study(study_id)
+            else:
+                pacs_study_ids.append(study_id)
+
+        if pacs_study_ids:
+            # Fiecare studiu PACS inseamna cereri pentru instante si fisiere DICOM; le trimitem in paralel,
+            # ca get_studies_metadata
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(pacs_study_ids))) as executor:
+                for study_id, result in zip(pacs_study_ids,
+                                            executor.map(self.get_examination_result_from_study, pacs_study_ids)):
+                    results[study_id] = result
+
+        return results
+
     def _is_local_study(self, study_id: str) -> bool:
         return study_id.startswith("local_")
 
@@ -1,25 +1,44 @@
 import os
 import json
 import uuid
+import threading
 import requests
 from io import BytesIO
-from typing import List, Dict, Any, Tuple
-from datetime import datetime
+from typing import List, Dict, Any, Tuple, Iterable, Callable
+from datetime import datetime, timedelta
 from requests.auth import HTTPBasicAuth
 import pydicom
 
 from app.core.interfaces.local_file_interface import ILocalFileService
 from app.core.exceptions.pacs_exceptions import PacsDataError
+from app.infrastructure.mapped_file import MappedFile, as_dicom_stream, dicom_data_length
+from app.infrastructure.archive_reader import ArchiveReader
+from app.utils.dicom_sniffer import DicomSniffer
 
 
 class LocalFileService(ILocalFileService):
+    DICOMDIR_NAME = "DICOMDIR"
 
-    def __init__(self, cache_dir: str = "local_studies_cache"):
+    def __init__(self, cache_dir: str = "local_studies_cache", max_studies: int = 0, max_age_days: int = 0,
+                 eviction_interval: int = 0):
         self.cache_dir = cache_dir
         self.local_studies: Dict[str, Dict[str, Any]] = {}  # study_id -> study_data
         self.study_instances: Dict[str, List[Dict[str, Any]]] = {}  # study_id -> instances
         self.instance_files: Dict[str, str] = {}  # instance_id -> file_path
         self.examination_results: Dict[str, str] = {}  # study_id -> examination_result
+        self.study_last_access: Dict[str, str] = {}  # study_id -> ISO timestamp
+
+        # Politica de retentie (0 = fara limita)
+        self.max_studies = max_studies
+        self.max_age_days = max_age_days
+        self._pinned_studies = set()
+        self._studies_changed_listeners: List[Callable[[List[str]], None]] = []
+        self._lock = threading.RLock()
+        self._stop_eviction = threading.Event()
+        self._eviction_thread = None
+
+        self._sniffer = DicomSniffer()
+        self._archive_reader = ArchiveReader(self._sniffer)
 
         os.makedirs(cache_dir, exist_ok=True)
 
@@ -27,61 +46,90 @@ class LocalFileService(ILocalFileService):
         self._anonymizer = Container.get_dicom_anonymizer_service()
 
         self._load_cache()
+        self.evict_studies()
+
+        if eviction_interval > 0:
+            self.start_eviction(eviction_interval)
 
     def load_dicom_file(self, file_path: str) -> Dict[str, Any]:
+        return self._load_dicom_file(file_path, save_cache=True)
+
+    def _load_dicom_file(self, file_path: str, save_cache: bool) -> Dict[str, Any]:
         try:
             if not os.path.exists(file_path):
                 raise FileNotFoundError(f"File not found: {file_path}")
 
-            dataset = pydicom.dcmread(file_path)
-            metadata = self._extract_metadata_from_dataset(dataset)
-            study_instance_uid = getattr(dataset, 'StudyInstanceUID', str(uuid.uuid4()))
-            study_id = f"local_{abs(hash(study_instance_uid)) % 1000000}"
-            instance_id = f"local_{abs(hash(getattr(dataset, 'SOPInstanceUID', str(uuid.uuid4())))) % 1000000}"
+            dataset = pydicom.dcmread(file_path, stop_before_pixels=True)
+            result = self._register_instance(dataset, file_path)
+
+            if save_cache:
+                self._save_cache()
+
+            return result
 
+        except Exception as e:
+            raise PacsDataError(f"Error loading DICOM file {file_path}: {e}")
+
+    def _register_instance(self, dataset, file_path: str, source: str = None) -> Dict[str, Any]:
+        metadata = self._extract_metadata_from_dataset(dataset)
+        if source:
+            metadata["Source"] = source
+
+        study_instance_uid = getattr(dataset, 'StudyInstanceUID', str(uuid.uuid4()))
+        study_id = f"local_{abs(hash(study_instance_uid)) % 1000000}"
+        instance_id = f"local_{abs(hash(getattr(dataset, 'SOPInstanceUID', str(uuid.uuid4())))) % 1000000}"
+
+        instance_data = {
+            "ID": instance_id,
+            "StudyID": study_id,
+            "FilePath": file_path,
+            "SOPInstanceUID": str(getattr(dataset, 'SOPInstanceUID', instance_id)),
+            "SeriesInstanceUID": str(getattr(dataset, 'SeriesInstanceUID', str(uuid.uuid4()))),
+            "InstanceNumber": self._to_int(getattr(dataset, 'InstanceNumber', 1), 1)
+        }
+
+        with self._lock:
             self.local_studies[study_id] = metadata
             self.instance_files[instance_id] = file_path
 
             if study_id not in self.study_instances:
                 self.study_instances[study_id] = []
 
-            instance_data = {
-                "ID": instance_id,
-                "StudyID": study_id,
-                "FilePath": file_path,
-                "SOPInstanceUID": getattr(dataset, 'SOPInstanceUID', instance_id),
-                "SeriesInstanceUID": getattr(dataset, 'SeriesInstanceUID', str(uuid.uuid4())),
-                "InstanceNumber": getattr(dataset, 'InstanceNumber', 1)
-            }
-
             if not any(inst["ID"] == instance_id for inst in self.study_instances[study_id]):
                 self.study_instances[study_id].append(instance_data)
 
-            self._save_cache()
+            self.study_last_access[study_id] = datetime.now().isoformat()
 
-            return {
-                "study_id": study_id,
-                "metadata": metadata,
-                "instance_id": instance_id
-            }
-
-        except Exception as e:
-            raise PacsDataError(f"Error loading DICOM file {file_path}: {e}")
+        return {
+            "study_id": study_id,
+            "metadata": metadata,
+            "instance_id": instance_id
+        }
 
     def load_dicom_folder(self, folder_path: str) -> List[Dict[str, Any]]:
         if not os.path.exists(folder_path):
             raise PacsDataError(f"Folder not found: {folder_path}")
 
+        dicomdir_path = self.find_dicomdir(folder_path)
+        if dicomdir_path:
+            try:
+                return self.load_dicomdir(dicomdir_path)
+            except Exception as e:
+                print(f"Warning: Could not use DICOMDIR {dicomdir_path}, scanning files instead: {e}")
+
         loaded_studies = []
         study_files = {}  # study_id -> list of files
 
         for root, dirs, files in os.walk(folder_path):
             for file in files:
+                if file.upper() == self.DICOMDIR_NAME:
+                    continue
+
                 file_path = os.path.join(root, file)
 
                 if self._is_dicom_file(file_path):
                     try:
-                        result = self.load_dicom_file(file_path)
+                        result = self._load_dicom_file(file_path, save_cache=False)
                         study_id = result["study_id"]
 
                         if study_id not in study_files:
@@ -98,33 +146,141 @@ class LocalFileService(ILocalFileService):
                         print(f"Warning: Could not load {file_path}: {e}")
                         continue
 
+        self._save_cache()
+
         for study_data in loaded_studies:
             study_id = study_data["study_id"]
             study_data["file_count"] = len(study_files.get(study_id, []))
 
         return loaded_studies
 
+    def find_dicomdir(self, folder_path: str) -> str:
+        try:
+            for entry in os.listdir(folder_path):
+                entry_path = os.path.join(folder_path, entry)
+                if entry.upper() == self.DICOMDIR_NAME and os.path.isfile(entry_path):
+                    return entry_path
+        except OSError:
+            pass
+        return None
+
+    def load_dicomdir(self, dicomdir_path: str) -> List[Dict[str, Any]]:
+        # Catalogul se construieste doar din inregistrarile DICOMDIR;
+        # fisierele instantelor sunt citite abia la trimitere/previzualizare.
+        from pydicom.fileset import FileSet
+
+        print(f"LocalFileService: Reading catalog from DICOMDIR {dicomdir_path}")
+        file_set = FileSet(pydicom.dcmread(dicomdir_path))
+
+        loaded_studies = {}  # study_id -> study summary
+        for instance in file_set:
+            file_path = os.fspath(instance.path)
+            if not os.path.exists(file_path):
+                print(f"Warning: DICOMDIR references missing file {file_path}")
+                continue
+
+            result = self._register_instance(_DirectoryRecordView(instance), file_path, source="DICOMDIR")
+            study_id = result["study_id"]
+
+            if study_id not in loaded_studies:
+                loaded_studies[study_id] = {
+                    "study_id": study_id,
+                    "metadata": result["metadata"],
+                    "file_count": 0
+                }
+            loaded_studies[study_id]["file_count"] += 1
+
+        self._save_cache()
+
+        print(f"LocalFileService: DICOMDIR catalog has {len(loaded_studies)} studies")
+        return list(loaded_studies.values())
+
+    def is_archive(self, file_path: str) -> bool:
+        return ArchiveReader.is_archive(file_path)
+
+    def load_archive(self, archive_path: str) -> List[Dict[str, Any]]:
+        if not os.path.exists(archive_path):
+            raise PacsDataError(f"Archive not found: {archive_path}")
+        if not self.is_archive(archive_path):
+            raise PacsDataError(f"Unsupported archive format: {archive_path}")
+
+        print(f"LocalFileService: Indexing archive {archive_path}")
+
+        loaded_studies = {}  # study_id -> study summary
+        try:
+            for member_name, dataset in self._archive_reader.iter_dicom_headers(archive_path):
+                instance_ref = ArchiveReader.make_ref(archive_path, member_name)
+                result = self._register_instance(dataset, instance_ref, source="Archive")
+                study_id = result["study_id"]
+
+                if study_id not in loaded_studies:
+                    loaded_studies[study_id] = {
+                        "study_id": study_id,
+                        "metadata": result["metadata"],
+                        "file_count": 0
+                    }
+                loaded_studies[study_id]["file_count"] += 1
+        except Exception as e:
+            raise PacsDataError(f"Error reading archive {archive_path}: {e}")
+        finally:
+            self._save_cache()
+
+        print(f"LocalFileService: Archive has {len(loaded_studies)} studies")
+        return list(loaded_studies.values())
+
     def get_study_metadata_from_file(self, file_path: str) -> Dict[str, Any]:
         result = self.load_dicom_file(file_path)
         return result["metadata"]
 
     def get_local_study_instances(self, study_id: str) -> List[Dict[str, Any]]:
-        return self.study_instances.get(study_id, [])
+        with self._lock:
+            return list(self.study_instances.get(study_id, []))
 
     def get_local_dicom_file(self, instance_id: str) -> bytes:
-        file_path = self.instance_files.get(instance_id)
-        if not file_path or not os.path.exists(file_path):
+        with self._lock:
+            file_path = self.instance_files.get(instance_id)
+        if not self._instance_source_exists(file_path):
             raise PacsDataError(f"Local DICOM file not found for instance {instance_id}")
 
         try:
+            if ArchiveReader.is_ref(file_path):
+                with self._archive_reader.open_member(file_path) as member_file:
+                    return member_file.stream().read()
+
             with open(file_path, 'rb') as f:
                 return f.read()
         except Exception as e:
             raise PacsDataError(f"Error reading local DICOM file: {e}")
 
+    def open_local_dicom_file(self, instance_id: str):
+        with self._lock:
+            file_path = self.instance_files.get(instance_id)
+        if not self._instance_source_exists(file_path):
+            raise PacsDataError(f"Local DICOM file not found for instance {instance_id}")
+
+        try:
+            return self._open_instance_source(file_path)
+        except Exception as e:
+            raise PacsDataError(f"Error mapping local DICOM file: {e}")
+
+    def _open_instance_source(self, file_path: str):
+        # Fisierele locale sunt mapate, membrii arhivelor sunt serviti din arhiva
+        if ArchiveReader.is_ref(file_path):
+            return self._archive_reader.open_member(file_path)
+        return MappedFile(file_path).open()
+
+    def _instance_source_exists(self, file_path: str) -> bool:
+        if not file_path:
+            return False
+        if ArchiveReader.is_ref(file_path):
+            return self._archive_reader.member_exists(file_path)
+        return os.path.exists(file_path)
+
     def add_examination_result_to_local_study(self, study_id: str, examination_result: str) -> bool:
         try:
-            self.examination_results[study_id] = examination_result
+            with self._lock:
+                self.examination_results[study_id] = examination_result
+                self._touch_study(study_id)
             self._save_cache()
             return True
         except Exception as e:
@@ -132,15 +288,18 @@ class LocalFileService(ILocalFileService):
             return False
 
     def get_examination_result_from_local_study(self, study_id: str) -> str:
-        return self.examination_results.get(study_id, "")
+        with self._lock:
+            return self.examination_results.get(study_id, "")
 
     def send_local_study_to_pacs(self, study_id: str, target_url: str, target_auth: Tuple[str, str],
                                  examination_result: str = None, dicom_modifier_callback=None) -> bool:
         try:
             print(f"LocalFileService: Sending local study {study_id} to {target_url}")
 
-            if study_id not in self.local_studies:
-                raise PacsDataError(f"Local study {study_id} not found")
+            with self._lock:
+                if study_id not in self.local_studies:
+                    raise PacsDataError(f"Local study {study_id} not found")
+                self._touch_study(study_id)
 
             # Check for existing study in target PACS
             existing_study_id = self._find_existing_study_in_target(study_id, target_url, target_auth)
@@ -159,49 +318,154 @@ class LocalFileService(ILocalFileService):
             return False
 
     def get_all_local_studies(self) -> List[str]:
-        return list(self.local_studies.keys())
+        with self._lock:
+            return list(self.local_studies.keys())
 
     def get_local_study_metadata(self, study_id: str) -> Dict[str, Any]:
-        if study_id not in self.local_studies:
-            raise PacsDataError(f"Local study {study_id} not found")
-        return self.local_studies[study_id]
+        with self._lock:
+            if study_id not in self.local_studies:
+                raise PacsDataError(f"Local study {study_id} not found")
+            return self.local_studies[study_id]
 
     def clear_local_studies(self):
-        self.local_studies.clear()
-        self.study_instances.clear()
-        self.instance_files.clear()
-        self.examination_results.clear()
-        self._save_cache()
+        self._archive_reader.close_all()
+        with self._lock:
+            self.local_studies.clear()
+            self.study_instances.clear()
+            self.instance_files.clear()
+            self.examination_results.clear()
+            self.study_last_access.clear()
+            self._save_cache()
 
     def remove_local_study(self, study_id: str) -> bool:
         try:
-            if study_id in self.local_studies:
-                del self.local_studies[study_id]
-            if study_id in self.study_instances:
-                for instance in self.study_instances[study_id]:
-                    instance_id = instance.get("ID")
-                    if instance_id in self.instance_files:
-                        del self.instance_files[instance_id]
-                del self.study_instances[study_id]
-            if study_id in self.examination_results:
-                del self.examination_results[study_id]
-
-            self._save_cache()
+            with self._lock:
+                self._drop_study(study_id)
+                self._save_cache()
             return True
         except Exception as e:
             print(f"Error removing local study: {e}")
             return False
 
-    def get_examination_result_from_local_dicom_file(self, instance_id: str) -> str:
+    def mark_study_used(self, study_id: str):
+        # Doar folosirea reala (selectie, deschidere, trimitere, rezultat) conteaza pentru evacuare;
+        # listarea si afisarea studiilor nu modifica ultima accesare
+        with self._lock:
+            self._touch_study(study_id)
+
+    def set_pinned_studies(self, study_ids: Iterable[str]):
+        # Studiile din queue nu sunt niciodata evacuate
+        with self._lock:
+            self._pinned_studies = {study_id for study_id in study_ids if study_id.startswith("local_")}
+
+    def add_studies_changed_listener(self, listener: Callable[[List[str]], None]):
+        # Listener-ul primeste studiile evacuate, pe thread-ul de evacuare
+        with self._lock:
+            if listener not in self._studies_changed_listeners:
+                self._studies_changed_listeners.append(listener)
+
+    def remove_studies_changed_listener(self, listener: Callable[[List[str]], None]):
+        with self._lock:
+            if listener in self._studies_changed_listeners:
+                self._studies_changed_listeners.remove(listener)
+
+    def evict_studies(self) -> List[str]:
+        with self._lock:
+            now = datetime.now()
+            # Nu evacuam studiile din queue si nici pe cele cu un rezultat de examinare salvat
+            candidates = [
+                study_id for study_id in self.local_studies
+                if study_id not in self._pinned_studies and not self.examination_results.get(study_id)
+            ]
+            evicted = []
+
+            if self.max_age_days > 0:
+                cutoff = now - timedelta(days=self.max_age_days)
+                for study_id in candidates:
+                    if self._last_access_time(study_id) < cutoff:
+                        evicted.append(study_id)
+
+            if self.max_studies > 0:
+                remaining = [study_id for study_id in candidates if study_id not in evicted]
+                overflow = len(self.local_studies) - len(evicted) - self.max_studies
+                if overflow > 0:
+                    # LRU: cele mai vechi accesari pleaca primele
+                    remaining.sort(key=self._last_access_time)
+                    evicted.extend(remaining[:overflow])
+
+            for study_id in evicted:
+                self._drop_study(study_id)
+
+            if evicted:
+                print(f"LocalFileService: Evicted {len(evicted)} local studies")
+                self._save_cache()
+
+            listeners = list(self._studies_changed_listeners)
+
+        if evicted:
+            for listener in listeners:
+                try:
+                    listener(evicted)
+                except Exception as e:
+                    print(f"Warning: Local studies listener failed: {e}")
+
+        return evicted
+
+    def start_eviction(self, interval_seconds: int):
+        if self._eviction_thread and self._eviction_thread.is_alive():
+            return
+
+        self._stop_eviction.clear()
+        self._eviction_thread = threading.Thread(
+            target=self._eviction_loop, args=(interval_seconds,), name="local-study-eviction", daemon=True
+        )
+        self._eviction_thread.start()
+
+    def stop_eviction(self):
+        self._stop_eviction.set()
+
+    def _eviction_loop(self, interval_seconds: int):
+        while not self._stop_eviction.wait(interval_seconds):
+            try:
+                if not self.evict_studies():
+                    # Persista timpii de acces chiar daca nu s-a evacuat nimic
+                    self._save_cache()
+            except Exception as e:
+                print(f"Warning: Local study eviction failed: {e}")
+
+    def _drop_study(self, study_id: str):
+        if study_id in self.local_studies:
+            del self.local_studies[study_id]
+        if study_id in self.study_instances:
+            for instance in self.study_instances[study_id]:
+                instance_id = instance.get("ID")
+                if instance_id in self.instance_files:
+                    del self.instance_files[instance_id]
+            del self.study_instances[study_id]
+        if study_id in self.examination_results:
+            del self.examination_results[study_id]
+        self.study_last_access.pop(study_id, None)
+
+    def _touch_study(self, study_id: str):
+        if study_id in self.study_last_access:
+            self.study_last_access[study_id] = datetime.now().isoformat()
+
+    def _last_access_time(self, study_id: str) -> datetime:
         try:
-            file_path = self.instance_files.get(instance_id)
-            if not file_path or not os.path.exists(file_path):
-                return self.examination_results.get(self._get_study_id_for_instance(instance_id), "")
+            return datetime.fromisoformat(self.study_last_access[study_id])
+        except (KeyError, TypeError, ValueError):
+            return datetime.min
 
-            with open(file_path, 'rb') as f:
-                dicom_data = f.read()
+    def get_examination_result_from_local_dicom_file(self, instance_id: str) -> str:
+        try:
+            with self._lock:
+                file_path = self.instance_files.get(instance_id)
+            if not self._instance_source_exists(file_path):
+                return self.get_examination_result_from_local_study(self._get_study_id_for_instance(instance_id))
 
-            dicom_dataset = pydicom.dcmread(BytesIO(dicom_data))
+            # Tag-urile private 7777 si ImageComments sunt inainte de PixelData
+            with self._open_instance_source(file_path) as instance_file:
+                dicom_dataset = pydicom.dcmread(instance_file.stream(), stop_before_pixels=True)
 
             # Check private tags first
             if (0x7777, 0x0010) in dicom_dataset:
@@ -232,12 +496,12 @@ class LocalFileService(ILocalFileService):
 
             # Cache fallback
             study_id = self._get_study_id_for_instance(instance_id)
-            return self.examination_results.get(study_id, "")
+            return self.get_examination_result_from_local_study(study_id)
 
         except Exception as e:
             print(f"Error reading examination result from local DICOM: {e}")
             study_id = self._get_study_id_for_instance(instance_id)
-            return self.examination_results.get(study_id, "")
+            return self.get_examination_result_from_local_study(study_id)
 
     def _find_existing_study_in_target(self, source_study_id: str, target_url: str, target_auth: Tuple[str, str]) -> str:
         try:
@@ -306,30 +570,30 @@ class LocalFileService(ILocalFileService):
                 try:
                     print(f"Processing local instance {i + 1}/{total_instances}: {instance_id}")
 
-                    # Read local DICOM file
-                    dicom_data = self.get_local_dicom_file(instance_id)
-                    print(f"      📥 Read local DICOM: {len(dicom_data)} bytes")
-
-                    # Anonymize
-                    print(f"Anonymizing local DICOM data...")
-                    dicom_data = self._anonymizer.anonymize_dicom(dicom_data)
-                    print(f"Local DICOM anonymized: {len(dicom_data)} bytes")
-
-                    # Add examination result if provided
-                    if examination_result:
-                        print(f"Adding examination result: {len(examination_result)} chars")
-                        dicom_data = self._add_examination_result_to_dicom(dicom_data, examination_result)
-                        print(f"Modified local DICOM: {len(dicom_data)} bytes")
-
-                    # Send to target PACS
-                    print(f"Sending to {target_url}/instances...")
-                    response = requests.post(
-                        f"{target_url}/instances",
-                        data=dicom_data,
-                        auth=HTTPBasicAuth(*target_auth),
-                        headers={"Content-Type": "application/dicom"},
-                        timeout=30
-                    )
+                    # Map local DICOM file (page cache, no heap copy) or stream it from its archive
+                    with self.open_local_dicom_file(instance_id) as instance_file:
+                        print(f"      📥 Opened local DICOM: {len(instance_file)} bytes")
+
+                        # Anonymize
+                        print(f"Anonymizing local DICOM data...")
+                        dicom_data = self._anonymizer.anonymize_dicom(instance_file)
+                        print(f"Local DICOM anonymized: {dicom_data_length(dicom_data)} bytes")
+
+                        # Add examination result if provided
+                        if examination_result:
+                            print(f"Adding examination result: {len(examination_result)} chars")
+                            dicom_data = self._add_examination_result_to_dicom(dicom_data, examination_result)
+                            print(f"Modified local DICOM: {dicom_data_length(dicom_data)} bytes")
+
+                        # Send to target PACS
+                        print(f"Sending to {target_url}/instances...")
+                        response = requests.post(
+                            f"{target_url}/instances",
+                            data=as_dicom_stream(dicom_data) if hasattr(dicom_data, 'stream') else dicom_data,
+                            auth=HTTPBasicAuth(*target_auth),
+                            headers={"Content-Type": "application/dicom"},
+                            timeout=30
+                        )
 
                     if response.status_code == 200:
                         success_count += 1
@@ -348,9 +612,9 @@ class LocalFileService(ILocalFileService):
             print(f"Error creating new local study: {e}")
             return False
 
-    def _add_examination_result_to_dicom(self, dicom_data: bytes, examination_result: str) -> bytes:
+    def _add_examination_result_to_dicom(self, dicom_data, examination_result: str):
         try:
-            dicom_dataset = pydicom.dcmread(BytesIO(dicom_data))
+            dicom_dataset = pydicom.dcmread(as_dicom_stream(dicom_data))
 
             # Image Comments (primary method)
             if len(examination_result) <= 10240:
@@ -385,10 +649,11 @@ class LocalFileService(ILocalFileService):
             return dicom_data
 
     def _get_study_id_for_instance(self, instance_id: str) -> str:
-        for study_id, instances in self.study_instances.items():
-            for instance in instances:
-                if instance.get("ID") == instance_id:
-                    return study_id
+        with self._lock:
+            for study_id, instances in self.study_instances.items():
+                for instance in instances:
+                    if instance.get("ID") == instance_id:
+                        return study_id
         return ""
 
     def _extract_metadata_from_dataset(self, dataset) -> Dict[str, Any]:
@@ -421,6 +686,12 @@ class LocalFileService(ILocalFileService):
                 "Source": "Local File"
             }
 
+    def _to_int(self, value, default: int) -> int:
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return default
+
     def _format_date(self, date_str: str) -> str:
         if not date_str or len(date_str) < 8:
             return "Unknown"
@@ -436,42 +707,27 @@ class LocalFileService(ILocalFileService):
 
         return date_str
 
-    def _is_dicom_file(self, file_path: str) -> bool:
-        try:
-            ext = os.path.splitext(file_path)[1].lower()
-            if ext in ['.dcm', '.dicom']:
-                return True
-
-            with open(file_path, 'rb') as f:
-                header = f.read(132)
-                if len(header) >= 132 and header[128:132] == b'DICM':
-                    return True
-
-                f.seek(0)
-                try:
-                    pydicom.dcmread(f, stop_before_pixels=True)
-                    return True
-                except:
-                    return False
+    def filter_dicom_files(self, paths: List[str], progress_callback=None) -> List[str]:
+        return self._sniffer.filter_dicom_files(paths, progress_callback)
 
-        except Exception:
-            return False
-
-        return False
+    def _is_dicom_file(self, file_path: str) -> bool:
+        return self._sniffer.is_dicom_file(file_path)
 
     def _save_cache(self):
         try:
             cache_file = os.path.join(self.cache_dir, "local_studies_cache.json")
-            cache_data = {
-                "local_studies": self.local_studies,
-                "study_instances": self.study_instances,
-                "instance_files": self.instance_files,
-                "examination_results": self.examination_results,
-                "last_updated": datetime.now().isoformat()
-            }
-
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, indent=2, ensure_ascii=False)
+            with self._lock:
+                cache_data = {
+                    "local_studies": self.local_studies,
+                    "study_instances": self.study_instances,
+                    "instance_files": self.instance_files,
+                    "examination_results": self.examination_results,
+                    "study_last_access": self.study_last_access,
+                    "last_updated": datetime.now().isoformat()
+                }
+
+                with open(cache_file, 'w', encoding='utf-8') as f:
+                    json.dump(cache_data, f, indent=2, ensure_ascii=False)
 
         except Exception as e:
             print(f"Warning: Could not save cache: {e}")
@@ -487,10 +743,40 @@ class LocalFileService(ILocalFileService):
                 self.study_instances = cache_data.get("study_instances", {})
                 self.instance_files = cache_data.get("instance_files", {})
                 self.examination_results = cache_data.get("examination_results", {})
+                self.study_last_access = cache_data.get("study_last_access", {})
+
+                # Cache-uri vechi, fara timpi de acces: studiile sunt considerate accesate acum
+                now = datetime.now().isoformat()
+                for study_id in self.local_studies:
+                    self.study_last_access.setdefault(study_id, now)
 
         except Exception as e:
             print(f"Warning: Could not load cache: {e}")
             self.local_studies = {}
             self.study_instances = {}
             self.instance_files = {}
-            self.examination_results = {}
\ No newline at end of file
+            self.examination_results = {}
+            self.study_last_access = {}
+
+
+class _DirectoryRecordView:
+    """Attribute access over a DICOMDIR instance and its parent records
+    (series, study, patient), shaped like a pydicom Dataset."""
+
+    _KEYWORD_ALIASES = {
+        "SOPInstanceUID": "ReferencedSOPInstanceUIDInFile",
+        "SOPClassUID": "ReferencedSOPClassUIDInFile",
+    }
+
+    def __init__(self, file_instance):
+        self._file_instance = file_instance
+
+    def __getattr__(self, keyword: str):
+        for candidate in (keyword, self._KEYWORD_ALIASES.get(keyword)):
+            if not candidate:
+                continue
+            try:
+                return self._file_instance[candidate].value
+            except (KeyError, ValueError):
+                continue
+        raise AttributeError(keyword)
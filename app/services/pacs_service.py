@@ -1,7 +1,8 @@
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 
 import pydicom
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Tuple
 from app.core.interfaces.pacs_interface import IPacsService
 from app.infrastructure.http_client import HttpClient
 from app.core.exceptions.pacs_exceptions import PacsConnectionError, PacsDataError
@@ -66,6 +67,29 @@ class PacsService(IPacsService):
         except Exception as e:
             raise PacsDataError(f"Nu am putut incarca metadatele din studiul {study_id}: {e}")
 
+    def get_studies_metadata(self, study_ids: Iterable[str],
+                             max_workers: int = 8) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, str]]:
+        study_ids = list(dict.fromkeys(study_ids))
+        metadata, errors = {}, {}
+        if not study_ids:
+            return metadata, errors
+
+        def fetch(study_id: str):
+            try:
+                return study_id, self.get_study_metadata(study_id), None
+            except Exception as e:
+                return study_id, None, str(e)
+
+        # Cererile catre PACS sunt I/O-bound, deci le trimitem in paralel
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(study_ids))) as executor:
+            for study_id, study_metadata, error in executor.map(fetch, study_ids):
+                if error is None:
+                    metadata[study_id] = study_metadata
+                else:
+                    errors[study_id] = error
+
+        return metadata, errors
+
     def get_study_instances(self, study_id: str) -> List[Dict[str, Any]]:
         try:
             response = self._http_client.get(f"{self._pacs_url}/studies/{study_id}/instances", auth=self._pacs_auth)
@@ -1,17 +1,37 @@
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, Dict, Iterable
 from app.repositories.pacs_url_repository import PacsUrlRepository
 from app.database.models import PacsUrl
+from app.utils.versioned_cache import VersionedCache
 
 
 class PacsUrlService:
-    def __init__(self, pacs_url_repository: PacsUrlRepository):
+    def __init__(self, pacs_url_repository: PacsUrlRepository, cache_ttl: float = 30):
         self._pacs_url_repository = pacs_url_repository
+        self._cache = VersionedCache(pacs_url_repository.get_version, cache_ttl)
 
     def get_all_pacs_urls(self) -> List[PacsUrl]:
-        return self._pacs_url_repository.find_all()
+        return list(self._cache.get('all', self._pacs_url_repository.find_all))
 
     def get_pacs_by_id(self, pacs_id: int) -> Optional[PacsUrl]:
-        return self._pacs_url_repository.find_by_id(pacs_id)
+        return self._cache.get(('id', pacs_id), lambda: self._pacs_url_repository.find_by_id(pacs_id))
+
+    def get_pacs_by_ids(self, pacs_ids: Iterable[int]) -> Dict[int, Optional[PacsUrl]]:
+        def load(keys):
+            found = self._pacs_url_repository.find_by_ids(key[1] for key in keys)
+            return {('id', pacs.id): pacs for pacs in found}
+
+        cached = self._cache.get_many([('id', pacs_id) for pacs_id in pacs_ids], load)
+        return {key[1]: pacs for key, pacs in cached.items()}
+
+    def get_pacs_page(self, offset: int, limit: int, filter_text: str = None) -> List[PacsUrl]:
+        # Paginile pentru tabelele de administrare nu trec prin cache
+        return self._pacs_url_repository.find_page(offset, limit, filter_text)
+
+    def count_pacs_urls(self, filter_text: str = None) -> int:
+        return self._pacs_url_repository.count(filter_text)
+
+    def invalidate_cache(self):
+        self._cache.invalidate()
 
     def get_pacs_config_by_id(self, pacs_id: int) -> Optional[Tuple[str, Tuple[str, str]]]:
         pacs = self.get_pacs_by_id(pacs_id)
@@ -33,34 +53,45 @@ class PacsUrlService:
             password=password.strip()
         )
 
-        return self._pacs_url_repository.create(pacs_url)
+        try:
+            return self._pacs_url_repository.create(pacs_url)
+        finally:
+            self._cache.invalidate()
 
     def update_pacs_url(self, pacs_id: int, name: str, url: str, username: str, password: str) -> bool:
-        pacs_url = self._pacs_url_repository.find_by_id(pacs_id)
-        if not pacs_url:
-            return False
-
         if not all([name.strip(), url.strip(), username.strip(), password.strip()]):
             raise ValueError("All fields (name, url, username, password) are required")
 
         if not url.startswith(('http://', 'https://')):
             raise ValueError("URL must start with http:// or https://")
 
-        pacs_url.name = name.strip()
-        pacs_url.url = url.strip().rstrip('/')
-        pacs_url.username = username.strip()
-        pacs_url.password = password.strip()
-
-        self._pacs_url_repository.update(pacs_url)
-        return True
+        try:
+            with self._pacs_url_repository.session_scope():
+                pacs_url = self._pacs_url_repository.find_by_id(pacs_id)
+                if not pacs_url:
+                    return False
+
+                pacs_url.name = name.strip()
+                pacs_url.url = url.strip().rstrip('/')
+                pacs_url.username = username.strip()
+                pacs_url.password = password.strip()
+
+                self._pacs_url_repository.update(pacs_url)
+                return True
+        finally:
+            # Dupa commit, ca alte thread-uri sa nu reincarce valoarea veche in cache
+            self._cache.invalidate()
 
     def delete_pacs_url(self, pacs_id: int) -> bool:
-        pacs_url = self._pacs_url_repository.find_by_id(pacs_id)
-
-        if not pacs_url:
-            return False
-
-        return self._pacs_url_repository.delete(pacs_id)
+        try:
+            with self._pacs_url_repository.session_scope():
+                pacs_url = self._pacs_url_repository.find_by_id(pacs_id)
+                if not pacs_url:
+                    return False
+
+                return self._pacs_url_repository.delete(pacs_id)
+        finally:
+            self._cache.invalidate()
 
     def test_pacs_connection(self, pacs_id: int) -> bool:
         pacs_config = self.get_pacs_config_by_id(pacs_id)
@@ -1,22 +1,54 @@
+import hashlib
+import json
 import os
-from typing import Dict, Any
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, Optional, Tuple, List, Callable
 from datetime import datetime
 from app.core.interfaces.pdf_interface import IPdfService
 from app.infrastructure.pdf_generator import PdfGenerator
+from app.infrastructure.pdf_render_pool import PdfRenderPool
+from app.infrastructure.pdf_thumbnailer import PdfThumbnailer
+from app.infrastructure.report_archive import ReportArchive
 from app.core.exceptions.pdf_exceptions import PdfGenerationError
+from app.utils.file_hash import file_sha256
 
 
 class PdfService(IPdfService):
-    def __init__(self, pdf_generator: PdfGenerator, output_dir: str = "generated_pdfs"):
+    PREVIEW_DIR = os.path.join("tmp_pdfs", "preview")
+
+    def __init__(self, pdf_generator: PdfGenerator, output_dir: str = "generated_pdfs",
+                 render_pool: Optional[PdfRenderPool] = None,
+                 preview_max_age_hours: int = 24, preview_max_files: int = 50,
+                 report_archive: Optional[ReportArchive] = None, thumbnailer: Optional[PdfThumbnailer] = None):
         self._pdf_generator = pdf_generator
         self._output_dir = output_dir
+        self._render_pool = render_pool
+        self._fallback_executor: Optional[ThreadPoolExecutor] = None
+        self._preview_max_age_hours = preview_max_age_hours
+        self._preview_max_files = preview_max_files
+        self._pending_previews: Dict[str, Future] = {}  # content hash -> render in curs
+        self._current_preview_path: Optional[str] = None  # ultima previzualizare ceruta (afisata in UI)
+        self._preview_lock = threading.Lock()
+        self._report_archive = report_archive
+        self._thumbnailer = thumbnailer
+        self._report_listeners: List[Callable[[str], None]] = []  # primesc study UID-ul raportului arhivat
+        self._thumbnails_requested = set()  # hash-uri pentru care s-a cerut deja un thumbnail
+        self._postprocess_executor: Optional[ThreadPoolExecutor] = None
+        self._metrics = {"renders": 0, "total_seconds": 0.0, "total_bytes": 0, "last_seconds": 0.0, "last_bytes": 0}
+        self._metrics_lock = threading.Lock()
         os.makedirs(output_dir, exist_ok=True)
+        self.cleanup_previews()
 
     def generate_pdf(self, content: str, metadata: Dict[str, Any], output_path: str, doctor_name: str = None,
                  selected_title: str = None, header_image_path: str = None) -> str:
         try:
             # Nu mai concatenează cu self._output_dir - folosește calea completă primită
+            started = time.perf_counter()
             self._pdf_generator.create_pdf(content, metadata, output_path, doctor_name, selected_title, header_image_path)
+            self._record_metrics(output_path, time.perf_counter() - started)
+            self._schedule_postprocess(output_path, metadata, doctor_name, selected_title)
             return output_path
         except Exception as e:
             raise PdfGenerationError(f"Nu am putut genera fisierul PDF: {e}")
@@ -24,13 +56,339 @@ class PdfService(IPdfService):
     def preview_pdf(self, content: str, metadata: Dict[str, Any], doctor_name: str = None,
                     selected_title: str = None, header_image_path: str = None) -> str:
         try:
-            preview_dir = os.path.join("tmp_pdfs", "preview")
-            os.makedirs(preview_dir, exist_ok=True)
+            preview_path = self._preview_path(
+                self.preview_key(content, metadata, doctor_name, selected_title, header_image_path)
+            )
+            self._current_preview_path = preview_path
+            if self._reuse_preview(preview_path):
+                return preview_path
 
-            filename = f"preview_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
-            preview_path = os.path.join(preview_dir, filename)
+            # Scriem intr-un fisier temporar: un PDF partial nu trebuie gasit si refolosit dupa cheie
+            temp_path = f"{preview_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            try:
+                self._pdf_generator.create_pdf(
+                    content, metadata, temp_path, doctor_name, selected_title, header_image_path
+                )
+                os.replace(temp_path, preview_path)
+            except Exception:
+                self._remove_file(temp_path)
+                raise
 
-            self._pdf_generator.create_pdf(content, metadata, preview_path, doctor_name, selected_title, header_image_path)
+            self.cleanup_previews()
             return preview_path
         except Exception as e:
-            raise PdfGenerationError(f"Nu am putut genera fisierul PDF pentru previzualizare: {e}")
\ No newline at end of file
+            raise PdfGenerationError(f"Nu am putut genera fisierul PDF pentru previzualizare: {e}")
+
+    def generate_pdf_async(self, content: str, metadata: Dict[str, Any], output_path: str, doctor_name: str = None,
+                           selected_title: str = None, header_image_path: str = None) -> Future:
+        started = time.perf_counter()
+        future = self._submit(content, metadata, output_path, doctor_name, selected_title, header_image_path)
+
+        def on_done(done: Future):
+            if not done.cancelled() and done.exception() is None:
+                self._record_metrics(done.result(), time.perf_counter() - started)
+                self._schedule_postprocess(done.result(), metadata, doctor_name, selected_title)
+
+        future.add_done_callback(on_done)
+        return future
+
+    @property
+    def compression_options(self) -> Dict[str, Any]:
+        return dict(self._pdf_generator.pdf_options)
+
+    def set_compression_options(self, **options):
+        # ex. set_compression_options(jpeg_quality=70, optimize_images=True)
+        self._pdf_generator.pdf_options.update(options)
+        self._pdf_generator.clear_asset_cache()
+        if self._render_pool:
+            self._render_pool.configure(self._pdf_generator.pdf_options)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        with self._metrics_lock:
+            metrics = dict(self._metrics)
+        renders = metrics["renders"]
+        metrics["average_seconds"] = metrics["total_seconds"] / renders if renders else 0.0
+        metrics["average_bytes"] = metrics["total_bytes"] // renders if renders else 0
+        return metrics
+
+    def archive_report(self, pdf_path: str, metadata: Dict[str, Any], doctor_name: str = None,
+                       selected_title: str = None, content_hash: str = None) -> Optional[Dict[str, Any]]:
+        if not self._report_archive:
+            return None
+
+        study_uid = metadata.get("Study Instance UID")
+        if not study_uid or study_uid == "N/A":
+            return None
+
+        try:
+            return self._report_archive.store(pdf_path, study_uid, doctor_name, selected_title, content_hash)
+        except Exception as e:
+            print(f"Warning: Could not archive report {pdf_path}: {e}")
+            return None
+
+    def get_latest_report(self, study_uid: str) -> Optional[Dict[str, Any]]:
+        if not self._report_archive:
+            return None
+        return self._report_archive.latest_for_study(study_uid)
+
+    def get_report_history(self, study_uid: str) -> List[Dict[str, Any]]:
+        """Archived reports for a study, newest first, with "path" and "thumbnail" (None until rendered)."""
+        if not self._report_archive or not study_uid:
+            return []
+
+        reports = []
+        for entry in reversed(self._report_archive.reports_for_study(study_uid)):
+            pdf_path = self._report_archive.object_path(entry["hash"])
+            if not pdf_path:
+                continue
+
+            thumbnail = self._thumbnailer.get_thumbnail(entry["hash"]) if self._thumbnailer else None
+            if thumbnail is None and self._request_thumbnail(entry["hash"]):
+                # Rapoarte arhivate inainte de thumbnail-uri: se genereaza in fundal, listener-ii afla cand e gata
+                self._submit_postprocess(self._create_thumbnail_and_notify, pdf_path, entry["hash"], study_uid)
+            reports.append({**entry, "path": pdf_path, "thumbnail": thumbnail})
+        return reports
+
+    def add_report_listener(self, listener: Callable[[str], None]):
+        with self._preview_lock:
+            if listener not in self._report_listeners:
+                self._report_listeners.append(listener)
+
+    def remove_report_listener(self, listener: Callable[[str], None]):
+        with self._preview_lock:
+            if listener in self._report_listeners:
+                self._report_listeners.remove(listener)
+
+    def preview_pdf_async(self, content: str, metadata: Dict[str, Any], doctor_name: str = None,
+                          selected_title: str = None, header_image_path: str = None) -> Future:
+        key = self.preview_key(content, metadata, doctor_name, selected_title, header_image_path)
+        preview_path = self._preview_path(key)
+        self._current_preview_path = preview_path
+
+        with self._preview_lock:
+            pending = self._pending_previews.get(key)
+            if pending is not None:
+                return pending
+
+            # Aceleasi date de intrare -> acelasi fisier; nu mai randam inca o data
+            if self._reuse_preview(preview_path):
+                future = Future()
+                future.set_result(preview_path)
+                return future
+
+            # Randam intr-un fisier temporar; doar un PDF complet ajunge la calea din cheie (refolosita de _reuse_preview)
+            temp_path = f"{preview_path}.{os.getpid()}.tmp"
+            render = self._submit(content, metadata, temp_path, doctor_name, selected_title, header_image_path)
+            future = Future()
+            future.set_running_or_notify_cancel()  # ca la pool: o randare pornita nu se mai anuleaza
+            self._pending_previews[key] = future
+
+        def on_done(done: Future):
+            error = done.exception() if not done.cancelled() else PdfGenerationError("Randarea a fost anulata")
+            if error is None:
+                try:
+                    os.replace(temp_path, preview_path)
+                except OSError as e:
+                    error = e
+
+            with self._preview_lock:
+                self._pending_previews.pop(key, None)
+
+            if error is None:
+                self.cleanup_previews()
+                future.set_result(preview_path)
+            else:
+                self._remove_file(temp_path)
+                future.set_exception(error)
+
+        render.add_done_callback(on_done)
+        return future
+
+    def preview_key(self, content: str, metadata: Dict[str, Any], doctor_name: str = None,
+                    selected_title: str = None, header_image_path: str = None) -> str:
+        # Antetul, CSS-ul si template-ul intra in cheie cu mtime/dimensiune: o editare invalideaza cache-ul
+        asset_stamps = [
+            (path, self._file_stamp(path))
+            for path in (header_image_path, self._pdf_generator.css_path, self._pdf_generator.template_path)
+        ]
+
+        # Data intra in cheie pentru ca raportul afiseaza data generarii
+        payload = json.dumps(
+            [content, metadata, doctor_name, selected_title, asset_stamps,
+             self._pdf_generator.pdf_options, datetime.now().strftime('%Y%m%d')],
+            sort_keys=True, default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def cleanup_previews(self):
+        try:
+            entries = []
+            with os.scandir(self.PREVIEW_DIR) as it:
+                for entry in it:
+                    if not entry.is_file() or not entry.name.startswith("preview_"):
+                        continue
+                    if entry.name.endswith(".pdf"):
+                        entries.append((entry.stat().st_mtime, entry.path))
+                    elif entry.name.endswith(".tmp") and entry.stat().st_mtime < time.time() - 3600:
+                        # Ramase dupa o randare intrerupta (proces oprit)
+                        self._remove_file(entry.path)
+        except OSError:
+            return
+
+        # Previzualizarea afisata acum nu se sterge si nu ocupa un loc din limita
+        current = os.path.abspath(self._current_preview_path) if self._current_preview_path else None
+        entries = [(mtime, path) for mtime, path in entries if os.path.abspath(path) != current]
+
+        entries.sort(reverse=True)
+        cutoff = time.time() - self._preview_max_age_hours * 3600 if self._preview_max_age_hours > 0 else None
+
+        for index, (mtime, path) in enumerate(entries):
+            too_old = cutoff is not None and mtime < cutoff
+            too_many = self._preview_max_files > 0 and index >= self._preview_max_files
+            if too_old or too_many:
+                self._remove_file(path)
+
+    def warm_up(self, header_image_path: str = None):
+        if self._render_pool:
+            try:
+                self._render_pool.warm_up(header_image_path)
+                return
+            except Exception as e:
+                print(f"Warning: PDF render pool unavailable, warming up in-process: {e}")
+                self._render_pool = None
+        self._pdf_generator.warm_up(header_image_path)
+
+    def shutdown(self):
+        if self._render_pool:
+            self._render_pool.shutdown()
+        if self._fallback_executor:
+            self._fallback_executor.shutdown(wait=False, cancel_futures=True)
+            self._fallback_executor = None
+        if self._postprocess_executor:
+            self._postprocess_executor.shutdown(wait=False, cancel_futures=True)
+            self._postprocess_executor = None
+
+    def _submit(self, content: str, metadata: Dict[str, Any], output_path: str, doctor_name: str = None,
+                selected_title: str = None, header_image_path: str = None) -> Future:
+        if self._render_pool:
+            try:
+                return self._render_pool.submit(
+                    content, metadata, output_path, doctor_name, selected_title, header_image_path
+                )
+            except Exception as e:
+                print(f"Warning: PDF render pool unavailable, rendering in-process: {e}")
+                self._render_pool = None
+
+        if self._fallback_executor is None:
+            self._fallback_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pdf-render")
+        return self._fallback_executor.submit(
+            self._render_in_process, content, metadata, output_path, doctor_name, selected_title, header_image_path
+        )
+
+    def _record_metrics(self, pdf_path: str, seconds: float):
+        try:
+            size = os.path.getsize(pdf_path)
+        except OSError:
+            size = 0
+
+        with self._metrics_lock:
+            self._metrics["renders"] += 1
+            self._metrics["total_seconds"] += seconds
+            self._metrics["total_bytes"] += size
+            self._metrics["last_seconds"] = seconds
+            self._metrics["last_bytes"] = size
+
+        print(f"PDF generated: {os.path.basename(pdf_path)} ({size / 1024:.1f} KB in {seconds * 1000:.0f} ms)")
+
+    def _schedule_postprocess(self, pdf_path: str, metadata: Dict[str, Any], doctor_name: str = None,
+                              selected_title: str = None):
+        if not self._report_archive:
+            return
+
+        # Arhivarea si thumbnail-ul se fac in fundal, in procesul GUI (QtPdf are nevoie de QGuiApplication)
+        self._submit_postprocess(self._postprocess_report, pdf_path, dict(metadata), doctor_name, selected_title)
+
+    def _submit_postprocess(self, func, *args):
+        with self._preview_lock:
+            if self._postprocess_executor is None:
+                self._postprocess_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pdf-postprocess")
+            executor = self._postprocess_executor
+        executor.submit(func, *args)
+
+    def _postprocess_report(self, pdf_path: str, metadata: Dict[str, Any], doctor_name: str = None,
+                            selected_title: str = None):
+        try:
+            content_hash = file_sha256(pdf_path)
+        except OSError as e:
+            print(f"Warning: Could not hash report {pdf_path}: {e}")
+            return
+
+        entry = self.archive_report(pdf_path, metadata, doctor_name, selected_title, content_hash)
+        if not entry:
+            return
+
+        if self._request_thumbnail(content_hash):
+            # Thumbnail-ul se face din obiectul arhivat: fisierul exportat poate fi mutat sau suprascris
+            self._create_thumbnail(self._report_archive.object_path(content_hash) or pdf_path, content_hash)
+        self._notify_report_listeners(entry["study_uid"])
+
+    def _request_thumbnail(self, content_hash: str) -> bool:
+        # O singura incercare per hash: un PDF care nu se poate randa nu e reincercat la fiecare refresh
+        if not self._thumbnailer:
+            return False
+        with self._preview_lock:
+            if content_hash in self._thumbnails_requested:
+                return False
+            self._thumbnails_requested.add(content_hash)
+            return True
+
+    def _create_thumbnail(self, pdf_path: str, content_hash: str):
+        try:
+            self._thumbnailer.create_thumbnail(pdf_path, content_hash)
+        except Exception as e:
+            print(f"Warning: Could not create thumbnail for {pdf_path}: {e}")
+
+    def _create_thumbnail_and_notify(self, pdf_path: str, content_hash: str, study_uid: str):
+        self._create_thumbnail(pdf_path, content_hash)
+        self._notify_report_listeners(study_uid)
+
+    def _notify_report_listeners(self, study_uid: str):
+        with self._preview_lock:
+            listeners = list(self._report_listeners)
+        for listener in listeners:
+            try:
+                listener(study_uid)
+            except Exception as e:
+                print(f"Warning: Report listener failed: {e}")
+
+    def _render_in_process(self, content: str, metadata: Dict[str, Any], output_path: str, doctor_name: str = None,
+                           selected_title: str = None, header_image_path: str = None) -> str:
+        self._pdf_generator.create_pdf(content, metadata, output_path, doctor_name, selected_title, header_image_path)
+        return output_path
+
+    def _preview_path(self, key: str) -> str:
+        os.makedirs(self.PREVIEW_DIR, exist_ok=True)
+        return os.path.join(self.PREVIEW_DIR, f"preview_{key[:32]}.pdf")
+
+    def _reuse_preview(self, preview_path: str) -> bool:
+        try:
+            # Actualizeaza mtime-ul ca previzualizarile folosite recent sa nu fie sterse primele
+            os.utime(preview_path)
+            return True
+        except OSError:
+            return False
+
+    def _file_stamp(self, path: Optional[str]) -> Optional[Tuple[int, int]]:
+        if not path:
+            return None
+        try:
+            stat = os.stat(path)
+            return stat.st_mtime_ns, stat.st_size
+        except OSError:
+            return None
+
+    def _remove_file(self, path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
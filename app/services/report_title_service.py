@@ -1,23 +1,34 @@
 from typing import List, Optional
 from app.repositories.report_title_repository import ReportTitleRepository
 from app.database.models import ReportTitle
+from app.utils.versioned_cache import VersionedCache
 
 
 class ReportTitleService:
-    def __init__(self, report_title_repository: ReportTitleRepository):
+    def __init__(self, report_title_repository: ReportTitleRepository, cache_ttl: float = 30):
         self._repository = report_title_repository
+        self._cache = VersionedCache(report_title_repository.get_version, cache_ttl)
 
     def get_all_titles(self) -> List[ReportTitle]:
-        return self._repository.find_all()
+        return list(self._get_cached_titles())
 
     def get_all_title_texts(self) -> List[str]:
-        titles = self.get_all_titles()
-        return [title.title_text for title in titles]
+        return [title.title_text for title in self._get_cached_titles()]
 
     def get_default_title(self) -> str:
-        titles = self.get_all_titles()
+        titles = self._get_cached_titles()
         return titles[0].title_text if titles else ""
 
+    def get_titles_page(self, offset: int, limit: int, filter_text: str = None) -> List[ReportTitle]:
+        # Paginile pentru tabelele de administrare nu trec prin cache
+        return self._repository.find_page(offset, limit, filter_text)
+
+    def count_titles(self, filter_text: str = None) -> int:
+        return self._repository.count(filter_text)
+
+    def invalidate_cache(self):
+        self._cache.invalidate()
+
     def get_title_by_id(self, title_id: int) -> Optional[ReportTitle]:
         return self._repository.find_by_id(title_id)
 
@@ -25,41 +36,55 @@ class ReportTitleService:
         if not title_text.strip():
             raise ValueError("Title text cannot be empty")
 
-        # Check for duplicates
-        existing_title = self._repository.find_by_title_text(title_text.strip())
-        if existing_title:
-            raise ValueError(f"Title '{title_text}' already exists")
+        try:
+            with self._repository.session_scope():
+                # Check for duplicates
+                existing_title = self._repository.find_by_title_text(title_text.strip())
+                if existing_title:
+                    raise ValueError(f"Title '{title_text}' already exists")
 
-        title = ReportTitle(title_text=title_text.strip())
-        return self._repository.create(title)
+                title = ReportTitle(title_text=title_text.strip())
+                return self._repository.create(title)
+        finally:
+            # Dupa commit, ca alte thread-uri sa nu reincarce lista veche in cache
+            self._cache.invalidate()
 
     def update_title(self, title_id: int, new_title_text: str) -> ReportTitle:
         if not new_title_text.strip():
             raise ValueError("Title text cannot be empty")
 
-        title = self._repository.find_by_id(title_id)
-        if not title:
-            raise ValueError(f"Report title with ID {title_id} not found")
+        try:
+            with self._repository.session_scope():
+                title = self._repository.find_by_id(title_id)
+                if not title:
+                    raise ValueError(f"Report title with ID {title_id} not found")
 
-        # Check for duplicates (excluding current title)
-        existing_title = self._repository.find_by_title_text(new_title_text.strip())
-        if existing_title and existing_title.id != title_id:
-            raise ValueError(f"Title '{new_title_text}' already exists")
+                # Check for duplicates (excluding current title)
+                existing_title = self._repository.find_by_title_text(new_title_text.strip())
+                if existing_title and existing_title.id != title_id:
+                    raise ValueError(f"Title '{new_title_text}' already exists")
 
-        title.title_text = new_title_text.strip()
-        return self._repository.update(title)
+                title.title_text = new_title_text.strip()
+                return self._repository.update(title)
+        finally:
+            self._cache.invalidate()
 
     def delete_title(self, title_id: int) -> bool:
-        all_titles = self.get_all_titles()
+        try:
+            with self._repository.session_scope():
+                if self._repository.count() <= 1:
+                    raise ValueError("Cannot delete the last remaining title")
 
-        if len(all_titles) <= 1:
-            raise ValueError("Cannot delete the last remaining title")
-
-        return self._repository.delete(title_id)
+                return self._repository.delete(title_id)
+        finally:
+            self._cache.invalidate()
 
     def get_statistics(self) -> dict:
-        titles = self.get_all_titles()
         return {
-            'total_titles': len(titles),
+            'total_titles': self._repository.count(),
             'default_title': self.get_default_title()
-        }
\ No newline at end of file
+        }
+
+    def _get_cached_titles(self) -> List[ReportTitle]:
+        # Lista este partajata intre apeluri; se returneaza copii catre apelanti
+        return self._cache.get('titles', self._repository.find_all)
\ No newline at end of file
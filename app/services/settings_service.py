@@ -1,5 +1,6 @@
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Dict, Iterable
 from app.repositories.settings_repository import SettingsRepository
+from app.utils.versioned_cache import VersionedCache
 
 
 class SettingsService:
@@ -7,17 +8,40 @@ class SettingsService:
     SOURCE_PACS_ID_KEY = "source_pacs_id"
     TARGET_PACS_ID_KEY = "target_pacs_id"
 
-    def __init__(self, settings_repository: SettingsRepository):
+    def __init__(self, settings_repository: SettingsRepository, cache_ttl: float = 30):
         self._settings_repository = settings_repository
+        # Valorile se citesc din memorie; alte statii sunt detectate prin versiunea tabelei app_settings
+        self._cache = VersionedCache(settings_repository.get_version, cache_ttl)
+
+    def get_value(self, setting_key: str) -> Optional[str]:
+        return self._cache.get(setting_key, lambda: self._settings_repository.get_value(setting_key))
+
+    def set_value(self, setting_key: str, setting_value: str, description: str = None) -> bool:
+        try:
+            return self._settings_repository.set_value(setting_key, setting_value, description)
+        finally:
+            self._cache.invalidate(setting_key)
+
+    def get_values(self, setting_keys: Iterable[str]) -> Dict[str, Optional[str]]:
+        return self._cache.get_many(setting_keys, self._settings_repository.get_values)
+
+    def set_values(self, values: Dict[str, str], descriptions: Dict[str, str] = None) -> bool:
+        try:
+            return self._settings_repository.set_values(values, descriptions)
+        finally:
+            for setting_key in values:
+                self._cache.invalidate(setting_key)
+
+    def invalidate_cache(self):
+        self._cache.invalidate()
 
     def get_source_pacs_id(self) -> Optional[int]:
-        value = self._settings_repository.get_value(self.SOURCE_PACS_ID_KEY)
-        return int(value) if value and value.isdigit() else None
+        return self._parse_pacs_id(self.get_value(self.SOURCE_PACS_ID_KEY))
 
     def set_source_pacs_id(self, pacs_id: Optional[int]) -> bool:
         try:
             value = str(pacs_id) if pacs_id is not None else ""
-            return self._settings_repository.set_value(
+            return self.set_value(
                 self.SOURCE_PACS_ID_KEY,
                 value,
                 "ID-ul PACS-ului sursă pentru citirea studiilor"
@@ -27,13 +51,12 @@ class SettingsService:
             return False
 
     def get_target_pacs_id(self) -> Optional[int]:
-        value = self._settings_repository.get_value(self.TARGET_PACS_ID_KEY)
-        return int(value) if value and value.isdigit() else None
+        return self._parse_pacs_id(self.get_value(self.TARGET_PACS_ID_KEY))
 
     def set_target_pacs_id(self, pacs_id: Optional[int]) -> bool:
         try:
             value = str(pacs_id) if pacs_id is not None else ""
-            return self._settings_repository.set_value(
+            return self.set_value(
                 self.TARGET_PACS_ID_KEY,
                 value,
                 "ID-ul PACS-ului țintă pentru trimiterea studiilor"
@@ -42,6 +65,13 @@ class SettingsService:
             print(f"Error setting target PACS ID: {e}")
             return False
 
+    def get_pacs_ids(self) -> Tuple[Optional[int], Optional[int]]:
+        values = self.get_values([self.SOURCE_PACS_ID_KEY, self.TARGET_PACS_ID_KEY])
+        return (
+            self._parse_pacs_id(values.get(self.SOURCE_PACS_ID_KEY)),
+            self._parse_pacs_id(values.get(self.TARGET_PACS_ID_KEY))
+        )
+
     def get_source_pacs_config(self) -> Optional[Tuple[str, Tuple[str, str]]]:
         source_id = self.get_source_pacs_id()
         if source_id:
@@ -69,11 +99,11 @@ class SettingsService:
             from app.di.container import Container
             pacs_url_service = Container.get_pacs_url_service()
 
-            source_id = self.get_source_pacs_id()
-            target_id = self.get_target_pacs_id()
+            source_id, target_id = self.get_pacs_ids()
 
-            source_pacs = pacs_url_service.get_pacs_by_id(source_id) if source_id else None
-            target_pacs = pacs_url_service.get_pacs_by_id(target_id) if target_id else None
+            pacs_by_id = pacs_url_service.get_pacs_by_ids(pacs_id for pacs_id in (source_id, target_id) if pacs_id)
+            source_pacs = pacs_by_id.get(source_id) if source_id else None
+            target_pacs = pacs_by_id.get(target_id) if target_id else None
 
             return {
                 'source_pacs_id': source_id,
@@ -96,17 +126,14 @@ class SettingsService:
 
     def reset_pacs_settings(self) -> bool:
         try:
-            success1 = self.set_source_pacs_id(None)
-            success2 = self.set_target_pacs_id(None)
-            return success1 and success2
+            return self.set_values({self.SOURCE_PACS_ID_KEY: "", self.TARGET_PACS_ID_KEY: ""})
         except Exception as e:
             print(f"Error resetting PACS settings: {e}")
             return False
 
     def validate_pacs_settings(self) -> Tuple[bool, str]:
         try:
-            source_id = self.get_source_pacs_id()
-            target_id = self.get_target_pacs_id()
+            source_id, target_id = self.get_pacs_ids()
 
             if not source_id:
                 return False, "PACS sursă nu este setat"
@@ -118,15 +145,18 @@ class SettingsService:
             from app.di.container import Container
             pacs_url_service = Container.get_pacs_url_service()
 
-            source_pacs = pacs_url_service.get_pacs_by_id(source_id)
-            if not source_pacs:
+            pacs_by_id = pacs_url_service.get_pacs_by_ids([source_id, target_id])
+
+            if not pacs_by_id.get(source_id):
                 return False, f"PACS sursă cu ID {source_id} nu mai există"
 
-            target_pacs = pacs_url_service.get_pacs_by_id(target_id)
-            if not target_pacs:
+            if not pacs_by_id.get(target_id):
                 return False, f"PACS țintă cu ID {target_id} nu mai există"
 
             return True, "Setările PACS sunt valide"
 
         except Exception as e:
-            return False, f"Eroare la validarea setărilor: {e}"
\ No newline at end of file
+            return False, f"Eroare la validarea setărilor: {e}"
+
+    def _parse_pacs_id(self, value: Optional[str]) -> Optional[int]:
+        return int(value) if value and value.isdigit() else None
@@ -0,0 +1,141 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Iterable, Set
+
+from app.database.models import StudyRecord, ReportRecord, TransferRecord
+from app.utils.file_hash import file_sha256
+from app.repositories.study_record_repository import StudyRecordRepository
+from app.repositories.report_record_repository import ReportRecordRepository
+from app.repositories.transfer_record_repository import TransferRecordRepository
+from app.services.session_service import SessionService
+
+
+class StudyHistoryService:
+    """Persists which studies were reported and sent, by whom and when.
+
+    Records are written as side effects of export and send, on a background
+    thread, so a slow database never delays the GUI and a failed write never
+    fails the export or the transfer. Lookups made from the GUI wait at most
+    `lookup_timeout` seconds.
+    """
+
+    def __init__(self, study_repository: StudyRecordRepository, report_repository: ReportRecordRepository,
+                 transfer_repository: TransferRecordRepository, session_service: SessionService = None,
+                 lookup_timeout: float = 2):
+        self._study_repository = study_repository
+        self._report_repository = report_repository
+        self._transfer_repository = transfer_repository
+        self._session_service = session_service
+        self._lookup_timeout = lookup_timeout
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lookup_executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    def record_report(self, study_id: str, metadata: Dict[str, Any], pdf_path: str, author: str = None,
+                      title_text: str = None):
+        self._submit(self._write_report, study_id, dict(metadata or {}), pdf_path, author, title_text)
+
+    def record_transfer(self, study_id: str, target_url: str, success: bool, error_message: str = None,
+                        with_result: bool = False, metadata: Dict[str, Any] = None):
+        sent_by = self._session_service.get_username() if self._session_service else None
+        self._submit(self._write_transfer, study_id, target_url, success, error_message, with_result,
+                     sent_by, dict(metadata or {}))
+
+    def get_study_record(self, study_id: str) -> Optional[StudyRecord]:
+        return self._study_repository.find_by_study_id(study_id)
+
+    def get_reports(self, study_id: str) -> List[ReportRecord]:
+        return self._report_repository.find_by_study_id(study_id)
+
+    def get_latest_report(self, study_id: str) -> Optional[ReportRecord]:
+        return self._report_repository.find_latest_for_study(study_id)
+
+    def get_transfers(self, study_id: str) -> List[TransferRecord]:
+        return self._transfer_repository.find_by_study_id(study_id)
+
+    def was_sent(self, study_id: str, target_url: str = None) -> bool:
+        return study_id in self.get_sent_study_ids([study_id], target_url)
+
+    def get_sent_study_ids(self, study_ids: Iterable[str], target_url: str = None) -> Set[str]:
+        return self._transfer_repository.find_sent_study_ids(study_ids, target_url)
+
+    def get_sent_study_ids_quick(self, study_ids: Iterable[str], target_url: str = None) -> Set[str]:
+        """Like get_sent_study_ids, but raises TimeoutError instead of blocking past lookup_timeout.
+
+        An open database circuit already fails fast in the session scope; the timeout covers a
+        server that accepts the connection but answers slowly.
+        """
+        with self._executor_lock:
+            if self._lookup_executor is None:
+                self._lookup_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="study-history-lookup")
+            future = self._lookup_executor.submit(self.get_sent_study_ids, list(study_ids), target_url)
+        return future.result(timeout=self._lookup_timeout)
+
+    def shutdown(self):
+        with self._executor_lock:
+            if self._executor:
+                # Inregistrarile deja primite se scriu inainte de inchidere
+                self._executor.shutdown(wait=True)
+                self._executor = None
+            if self._lookup_executor:
+                # O interogare blocata nu trebuie sa tina aplicatia deschisa
+                self._lookup_executor.shutdown(wait=False, cancel_futures=True)
+                self._lookup_executor = None
+
+    def _submit(self, func, *args):
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="study-history")
+            self._executor.submit(func, *args)
+
+    def _write_report(self, study_id: str, metadata: Dict[str, Any], pdf_path: str, author: str = None,
+                      title_text: str = None):
+        try:
+            try:
+                content_hash = file_sha256(pdf_path)
+            except OSError:
+                content_hash = None
+
+            self._report_repository.create(ReportRecord(
+                study_id=study_id,
+                pdf_path=pdf_path,
+                content_hash=content_hash,
+                author=author,
+                title_text=title_text
+            ))
+        except Exception as e:
+            print(f"Warning: Could not record report for study {study_id}: {e}")
+            return
+
+        self._upsert_study(study_id, metadata)
+
+    def _write_transfer(self, study_id: str, target_url: str, success: bool, error_message: str = None,
+                        with_result: bool = False, sent_by: str = None, metadata: Dict[str, Any] = None):
+        try:
+            self._transfer_repository.create(TransferRecord(
+                study_id=study_id,
+                target_url=target_url,
+                success=success,
+                error_message=error_message[:500] if error_message else None,
+                with_result=with_result,
+                sent_by=sent_by
+            ))
+        except Exception as e:
+            print(f"Warning: Could not record transfer for study {study_id}: {e}")
+            return
+
+        self._upsert_study(study_id, metadata)
+
+    def _upsert_study(self, study_id: str, metadata: Dict[str, Any] = None):
+        # Doar detalii afisate; raportul/transferul e deja scris chiar daca asta esueaza
+        metadata = metadata or {}
+        study_instance_uid = metadata.get("Study Instance UID")
+        try:
+            self._study_repository.upsert(study_id, {
+                "study_instance_uid": study_instance_uid if study_instance_uid != "N/A" else None,
+                "patient_name": metadata.get("Patient Name"),
+                "study_date": metadata.get("Study Date"),
+                "description": metadata.get("Description")
+            })
+        except Exception as e:
+            print(f"Warning: Could not update study details for {study_id}: {e}")
@@ -0,0 +1,160 @@
+import os
+import struct
+import threading
+from typing import Dict, Tuple, Iterable, List
+
+
+class DicomSniffer:
+    """Classifies files as DICOM by looking at the first few hundred bytes.
+
+    Recognizes Part 10 files (preamble + DICM) as well as raw datasets
+    without a preamble, in implicit or explicit VR little endian, by checking
+    that the leading elements have plausible, ascending group/element tags.
+    Verdicts are cached by path, size and mtime.
+    """
+
+    SNIFF_SIZE = 256
+    DICOM_EXTENSIONS = ('.dcm', '.dicom', '.dic')
+
+    # Grupurile cu care incepe in mod normal un dataset fara preambul
+    _LEADING_GROUPS = (0x0000, 0x0002, 0x0004, 0x0008)
+
+    _EXPLICIT_VRS = {
+        b'AE', b'AS', b'AT', b'CS', b'DA', b'DS', b'DT', b'FL', b'FD', b'IS',
+        b'LO', b'LT', b'OB', b'OD', b'OF', b'OL', b'OV', b'OW', b'PN', b'SH',
+        b'SL', b'SQ', b'SS', b'ST', b'SV', b'TM', b'UC', b'UI', b'UL', b'UN',
+        b'UR', b'US', b'UT', b'UV'
+    }
+    _LONG_VRS = {b'OB', b'OD', b'OF', b'OL', b'OV', b'OW', b'SQ', b'UC', b'UN', b'UR', b'UT', b'SV', b'UV'}
+
+    def __init__(self, max_cache_entries: int = 50000):
+        self._max_cache_entries = max_cache_entries
+        self._cache: Dict[str, Tuple[int, int, bool]] = {}  # path -> (mtime_ns, size, verdict)
+        self._lock = threading.Lock()
+
+    def is_dicom_file(self, file_path: str) -> bool:
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return False
+
+        key = os.path.abspath(file_path)
+        with self._lock:
+            cached = self._cache.get(key)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+
+        verdict = self._classify(file_path, stat.st_size)
+
+        with self._lock:
+            if len(self._cache) >= self._max_cache_entries:
+                self._cache.clear()
+            self._cache[key] = (stat.st_mtime_ns, stat.st_size, verdict)
+        return verdict
+
+    def filter_dicom_files(self, paths: Iterable[str], progress_callback=None) -> List[str]:
+        candidates = list(self.expand_paths(paths))
+        total = len(candidates)
+        dicom_files = []
+
+        for i, file_path in enumerate(candidates):
+            if self.is_dicom_file(file_path):
+                dicom_files.append(file_path)
+            if progress_callback and (i % 200 == 0 or i == total - 1):
+                progress_callback(i + 1, total)
+
+        return dicom_files
+
+    @staticmethod
+    def expand_paths(paths: Iterable[str]) -> Iterable[str]:
+        for path in paths:
+            if os.path.isdir(path):
+                for root, dirs, files in os.walk(path):
+                    for file in files:
+                        yield os.path.join(root, file)
+            elif os.path.isfile(path):
+                yield path
+
+    def clear_cache(self):
+        with self._lock:
+            self._cache.clear()
+
+    def is_dicom_header(self, header: bytes, file_size: int, name: str = "") -> bool:
+        if name and os.path.splitext(name)[1].lower() in self.DICOM_EXTENSIONS:
+            return True
+
+        if file_size < 8 or len(header) < 8:
+            return False
+
+        if len(header) >= 132 and header[128:132] == b'DICM':
+            return True
+
+        return self._looks_like_raw_dataset(header, file_size)
+
+    def _classify(self, file_path: str, file_size: int) -> bool:
+        if os.path.splitext(file_path)[1].lower() in self.DICOM_EXTENSIONS:
+            return True
+
+        if file_size < 8:
+            return False
+
+        try:
+            with open(file_path, 'rb') as f:
+                header = f.read(self.SNIFF_SIZE)
+        except OSError:
+            return False
+
+        return self.is_dicom_header(header, file_size)
+
+    def _looks_like_raw_dataset(self, header: bytes, file_size: int) -> bool:
+        group, element = struct.unpack_from('<HH', header, 0)
+        if group not in self._LEADING_GROUPS:
+            return False
+
+        if header[4:6] in self._EXPLICIT_VRS:
+            return self._walk_elements(header, file_size, explicit_vr=True)
+        return self._walk_elements(header, file_size, explicit_vr=False)
+
+    def _walk_elements(self, header: bytes, file_size: int, explicit_vr: bool) -> bool:
+        offset = 0
+        previous_tag = -1
+        parsed = 0
+
+        while offset + 8 <= len(header):
+            group, element = struct.unpack_from('<HH', header, offset)
+            tag = (group << 16) | element
+            if tag <= previous_tag:
+                return False
+
+            if explicit_vr:
+                vr = header[offset + 4:offset + 6]
+                if vr not in self._EXPLICIT_VRS:
+                    return False
+                if vr in self._LONG_VRS:
+                    if offset + 12 > len(header):
+                        break
+                    length = struct.unpack_from('<I', header, offset + 8)[0]
+                    value_offset = offset + 12
+                else:
+                    length = struct.unpack_from('<H', header, offset + 6)[0]
+                    value_offset = offset + 8
+            else:
+                length = struct.unpack_from('<I', header, offset + 4)[0]
+                value_offset = offset + 8
+
+            if length == 0xFFFFFFFF:
+                # Lungime nedefinita (secventa) - suficient pentru a decide
+                return parsed >= 1
+
+            if length % 2 or value_offset + length > file_size:
+                return False
+
+            parsed += 1
+            previous_tag = tag
+            offset = value_offset + length
+
+        if parsed >= 2:
+            return True
+
+        # Un singur element care depaseste fereastra citita (ex. valoare lunga la inceput)
+        return parsed == 1 and offset + 8 > len(header) and (previous_tag >> 16) in (0x0002, 0x0008)
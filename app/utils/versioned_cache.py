@@ -0,0 +1,92 @@
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional
+
+
+class VersionedCache:
+    """Read-through in-memory cache for rarely changing DB data.
+
+    Local writes invalidate entries explicitly. Changes made from other
+    machines are picked up by comparing a cheap version stamp (e.g. row count
+    and MAX(updated_at)) at most once every `ttl` seconds; 0 disables the check.
+    """
+
+    _MISSING = object()
+
+    def __init__(self, version_loader: Optional[Callable[[], Any]] = None, ttl: float = 0):
+        self._version_loader = version_loader
+        self._ttl = ttl
+        self._values: Dict[Hashable, Any] = {}
+        self._generation = 0
+        self._version = self._MISSING
+        self._checked_at = 0.0
+        self._lock = threading.RLock()
+
+    def get(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        self._validate()
+
+        with self._lock:
+            value = self._values.get(key, self._MISSING)
+            generation = self._generation
+        if value is not self._MISSING:
+            return value
+
+        value = loader()
+
+        with self._lock:
+            # Nu salvam o valoare citita inainte de o invalidare concurenta
+            if generation == self._generation:
+                self._values[key] = value
+        return value
+
+    def get_many(self, keys: Iterable[Hashable], loader: Callable[[list], Dict[Hashable, Any]]) -> Dict[Hashable, Any]:
+        """Like get(), but the missing keys are loaded with a single loader(keys) call."""
+        self._validate()
+
+        keys = list(dict.fromkeys(keys))
+        with self._lock:
+            found = {key: self._values[key] for key in keys if key in self._values}
+            generation = self._generation
+        missing = [key for key in keys if key not in found]
+        if not missing:
+            return found
+
+        loaded = loader(missing)
+        values = {key: loaded.get(key) for key in missing}
+
+        with self._lock:
+            if generation == self._generation:
+                self._values.update(values)
+        found.update(values)
+        return found
+
+    def invalidate(self, key: Hashable = None):
+        with self._lock:
+            self._generation += 1
+            if key is None:
+                self._values.clear()
+                self._version = self._MISSING
+            else:
+                self._values.pop(key, None)
+
+    def _validate(self):
+        if not self._version_loader or self._ttl <= 0:
+            return
+
+        now = time.monotonic()
+        with self._lock:
+            if self._version is not self._MISSING and now - self._checked_at < self._ttl:
+                return
+
+        try:
+            version = self._version_loader()
+        except Exception as e:
+            print(f"Warning: Could not check cache version: {e}")
+            return
+
+        with self._lock:
+            if version != self._version:
+                self._values.clear()
+                self._generation += 1
+                self._version = version
+            self._checked_at = now
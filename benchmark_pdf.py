@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Medical PACS Application - PDF Render Benchmark
+===============================================
+Masoara PdfGenerator pe un corpus sintetic de rapoarte (scurt/lung, HTML/text,
+cu/fara antet): construirea HTML, layout-ul WeasyPrint si scrierea PDF separat.
+Rezultatele (p50/p95 si dimensiune per caz, peak RSS pentru toata rularea) sunt
+salvate ca JSON, pentru comparatie intre versiuni.
+
+Utilizare:
+    python benchmark_pdf.py --iterations 10 --output pdf_benchmark.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+from app.config.settings import Settings
+from app.infrastructure.pdf_generator import PdfGenerator
+
+
+SAMPLE_METADATA = {
+    "Patient Name": "POPESCU^ION",
+    "Patient Birth Date": "19650412",
+    "Patient Sex": "M",
+    "Patient Age": "059Y",
+    "Study Date": "20250115",
+    "Description": "Scintigrafie osoasa",
+    "Body Part Examined": "WHOLEBODY",
+    "Referring Physician Name": "Dr. Ionescu",
+    "Accession Number": "ACC123456",
+    "Institution Name": "Spitalul Clinic Judetean de Urgenta"
+}
+
+PARAGRAPH = (
+    "Se evidentiaza distributie omogena a radiotrasorului la nivelul scheletului axial si apendicular, "
+    "fara arii de hiperfixare patologica. Rinichii vizualizati, cu eliminare urinara normala."
+)
+
+
+def build_corpus():
+    short_plain = PARAGRAPH
+    long_plain = "\n\n".join(f"{i + 1}. {PARAGRAPH}" for i in range(40))
+    short_html = f"<p><strong><em>Rezultat:</em></strong> {PARAGRAPH}</p><p><strong>CONCLUZII</strong></p>"
+    long_html = "".join(
+        f"<p><strong>Segment {i + 1}:</strong> <em>{PARAGRAPH}</em> <u>fara modificari</u></p>" for i in range(40)
+    )
+
+    corpus = []
+    for length, plain, html in (("short", short_plain, short_html), ("long", long_plain, long_html)):
+        for fmt, content in (("plain", plain), ("html", html)):
+            for with_header in (False, True):
+                name = f"{length}_{fmt}_{'header' if with_header else 'noheader'}"
+                corpus.append((name, content, with_header))
+    return corpus
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def summarize(values):
+    return {
+        "p50_ms": round(percentile(values, 50) * 1000, 2),
+        "p95_ms": round(percentile(values, 95) * 1000, 2),
+        "mean_ms": round(sum(values) / len(values) * 1000, 2) if values else 0.0
+    }
+
+
+def peak_rss_kb():
+    # Maximul pentru tot procesul (nu per caz); None pe Windows, unde nu exista modulul resource
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS raporteaza in bytes, Linux in KB
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def run_case(generator, content, header_image_path, iterations, output_dir, name):
+    from weasyprint import HTML
+
+    timings = {"build_html": [], "layout": [], "write": [], "total": []}
+    output_size = 0
+    output_path = os.path.join(output_dir, f"{name}.pdf")
+
+    for _ in range(iterations):
+        started = time.perf_counter()
+
+        generated_date = datetime.now().strftime("%d.%m.%Y %H:%M")
+        patient_metadata = generator._filter_patient_metadata(SAMPLE_METADATA)
+        html_content = generator._build_html_content(
+            content, patient_metadata, generated_date, "Dr. Benchmark", datetime.now().strftime("%Y"),
+            "Scintigrama osoasa", header_image_path
+        )
+        built = time.perf_counter()
+
+        document = HTML(string=html_content, base_url=Path.cwd().as_uri()).render(
+            stylesheets=generator._get_stylesheets(), cache=generator._image_cache, **generator.pdf_options
+        )
+        laid_out = time.perf_counter()
+
+        document.write_pdf(output_path, **generator.pdf_options)
+        written = time.perf_counter()
+
+        timings["build_html"].append(built - started)
+        timings["layout"].append(laid_out - built)
+        timings["write"].append(written - laid_out)
+        timings["total"].append(written - started)
+        output_size = os.path.getsize(output_path)
+
+    return {
+        "iterations": iterations,
+        "pages": len(document.pages),
+        "output_bytes": output_size,
+        **{phase: summarize(values) for phase, values in timings.items()}
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pentru generarea rapoartelor PDF")
+    parser.add_argument("--iterations", type=int, default=10, help="randari per caz (default 10)")
+    parser.add_argument("--warmup", type=int, default=1, help="randari de incalzire, neincluse (default 1)")
+    parser.add_argument("--output", help="fisierul JSON cu rezultate (default <temp>/pdf_benchmark_<data>.json)")
+    parser.add_argument("--keep-pdfs", action="store_true", help="pastreaza PDF-urile generate")
+    args = parser.parse_args()
+
+    settings = Settings()
+    generator = PdfGenerator(
+        settings.PDF_CSS_PATH,
+        settings.PDF_TEMPLATE_PATH,
+        pdf_options=getattr(settings, "PDF_WRITE_OPTIONS", None),
+        header_max_width=getattr(settings, "PDF_HEADER_MAX_WIDTH", 1200)
+    )
+    header_image_path = settings.HEADER_IMAGE_PATH if os.path.exists(settings.HEADER_IMAGE_PATH) else None
+
+    import weasyprint
+
+    output_dir = tempfile.mkdtemp(prefix="pdf_benchmark_")
+    results = {
+        "timestamp": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "weasyprint": getattr(weasyprint, "__version__", "unknown"),
+        "pdf_options": generator.pdf_options,
+        "cases": {}
+    }
+
+    print("📄 PDF Render Benchmark")
+    print("=" * 78)
+    print(f"{'case':<26}{'build p50':>11}{'layout p50':>12}{'write p50':>11}{'total p95':>11}{'size KB':>9}")
+
+    for name, content, with_header in build_corpus():
+        header = header_image_path if with_header else None
+        if args.warmup:
+            run_case(generator, content, header, args.warmup, output_dir, name)
+
+        case = run_case(generator, content, header, args.iterations, output_dir, name)
+        results["cases"][name] = case
+        print(f"{name:<26}{case['build_html']['p50_ms']:>11.2f}{case['layout']['p50_ms']:>12.2f}"
+              f"{case['write']['p50_ms']:>11.2f}{case['total']['p95_ms']:>11.2f}{case['output_bytes'] / 1024:>9.1f}")
+
+    results["peak_rss_kb"] = peak_rss_kb()
+
+    # Implicit in afara proiectului, ca rezultatele sa nu ajunga in git
+    output_path = args.output or os.path.join(
+        tempfile.gettempdir(), f"pdf_benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    )
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+
+    if args.keep_pdfs:
+        print(f"\nPDF-uri generate in: {output_dir}")
+    else:
+        for file in os.listdir(output_dir):
+            os.remove(os.path.join(output_dir, file))
+        os.rmdir(output_dir)
+
+    print(f"\n✅ Rezultate salvate in: {output_path}")
+    print(f"Peak RSS: {results['peak_rss_kb']} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -168,6 +168,7 @@ def run_pyinstaller_direct():
         # Adaugă fișierele de stil
         "--add-data", "app/presentation/styles/*.qss;app/presentation/styles",
         "--add-data", "app/presentation/styles/*.css;app/presentation/styles",
+        "--add-data", "app/presentation/styles/*.html;app/presentation/styles",
         # Import-uri hidden importante
         "--hidden-import", "PyQt6.QtCore",
         "--hidden-import", "PyQt6.QtGui",
@@ -96,6 +96,25 @@ def wait_for_database(db_uri, max_attempts=30):
     return False
 
 
+def migrate():
+    """Aplică doar migrările în așteptare, fără a șterge datele"""
+    settings = Settings()
+    print(f"📊 Conectare la: {settings.DB_URI}")
+
+    try:
+        from app.database.migration_runner import MigrationRunner
+        engine = create_engine(settings.DB_URI, echo=False, pool_pre_ping=True)
+        applied = MigrationRunner(engine).upgrade()
+        if applied:
+            print(f"✅ Migrări aplicate: {applied}")
+        else:
+            print("✅ Schema este deja la zi")
+    except Exception as e:
+        print(f"❌ Eroare la aplicarea migrărilor: {e}")
+
+    input("\nApasă Enter pentru a ieși...")
+
+
 def main():
     """Funcția principală de inițializare"""
 
@@ -145,6 +164,11 @@ def main():
         Base.metadata.create_all(engine)
         print("✅ Tabele create cu structura nouă!")
 
+        # Înregistrează migrările (structura din models.py le include deja)
+        from app.database.migration_runner import MigrationRunner
+        MigrationRunner(engine).upgrade()
+        print("✅ Versiune schemă actualizată!")
+
         # Adaugă datele default
         Session = sessionmaker(bind=engine)
         session = Session()
@@ -173,6 +197,7 @@ def main():
         print("  🏥 pacs_urls - Configurații PACS")
         print("  ⚙️ app_settings - Setări aplicație")
         print("  📄 report_titles - Titluri rapoarte")
+        print("  🗂️ study_records / report_records / transfer_records - Istoric studii, rapoarte și trimiteri")
         print("\nConturi utilizator:")
         print("  👤 admin / admin123 (Administrator)")
         print("  👤 dr.popescu / doctor123 (Dr. Ioan Popescu)")
@@ -438,4 +463,7 @@ def add_default_report_titles(session):
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if "--migrate" in sys.argv:
+        migrate()
+    else:
+        main()
\ No newline at end of file